@@ -11,8 +11,11 @@ from rich.console import Console
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.sync import convert_obsidian_to_hugo
-from tools.curate.validate import validate_directory
+from tools.sync import sync_vault
+from tools.sync.linkgraph import DEFAULT_LINK_GRAPH_PATH
+from tools.sync.manifest import DEFAULT_MANIFEST_PATH
+from tools.curate.validate import iter_validate_directory, tally_result
+from tools.curate.validation_cache import DEFAULT_VALIDATION_CACHE_PATH
 
 
 console = Console()
@@ -48,6 +51,18 @@ console = Console()
     is_flag=True,
     help="Skip Hugo build step",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes for conversion and validation (default: 1, serial)",
+)
+@click.option(
+    "--full-sync",
+    is_flag=True,
+    help="Reconvert every file instead of only changed ones",
+)
 @click.option(
     "--output",
     type=click.Path(path_type=Path),
@@ -60,6 +75,8 @@ def main(
     skip_sync: bool,
     skip_validate: bool,
     skip_hugo: bool,
+    jobs: int,
+    full_sync: bool,
     output: Path,
 ) -> None:
     """Run the full build pipeline."""
@@ -67,23 +84,41 @@ def main(
 
     content_dir = hugo / "content"
 
-    # Step 1: Sync Obsidian → Hugo
+    # Step 1: Sync Obsidian → Hugo (validating converted notes in memory)
+    results: dict | None = None
     if not skip_sync:
         console.print("[bold]Step 1:[/bold] Syncing Obsidian -> Hugo")
         with console.status("Syncing..."):
-            converted = convert_obsidian_to_hugo(
+            sync_result = sync_vault(
                 obsidian_path=obsidian,
                 hugo_content_path=content_dir,
+                manifest_path=DEFAULT_MANIFEST_PATH,
+                jobs=jobs,
+                full=full_sync,
+                link_graph_path=DEFAULT_LINK_GRAPH_PATH,
+                validate=not skip_validate,
+                validation_cache_path=DEFAULT_VALIDATION_CACHE_PATH,
             )
-        console.print(f"  [green]Done[/green] Synced {len(converted)} files\n")
+        results = sync_result.validation
+        console.print(
+            f"  [green]Done[/green] Synced {len(sync_result.files)} files "
+            f"({len(sync_result.written)} written, {len(sync_result.deleted)} deleted)\n"
+        )
     else:
         console.print("[dim]Step 1: Skipped Obsidian sync[/dim]\n")
 
     # Step 2: Validate frontmatter
     if not skip_validate:
         console.print("[bold]Step 2:[/bold] Validating content")
-        with console.status("Validating..."):
-            results = validate_directory(content_dir)
+        if results is None:
+            # No sync this run: validate what is on disk
+            results = {"total": 0, "valid": 0, "invalid": 0, "warnings": 0}
+            with console.status("Validating...") as status:
+                for file_result in iter_validate_directory(
+                    content_dir, jobs=jobs, cache_path=DEFAULT_VALIDATION_CACHE_PATH
+                ):
+                    tally_result(results, file_result)
+                    status.update(f"Validating... {results['total']} files")
 
         if results["invalid"] > 0:
             console.print(
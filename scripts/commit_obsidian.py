@@ -13,9 +13,13 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import frontmatter
 from rich.console import Console
 
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.curate.header import read_header
+
 console = Console()
 
 # AI author for commits
@@ -104,13 +108,13 @@ def determine_author(file_path: Path) -> str:
     Returns 'human' or 'ai'.
     """
     try:
-        post = frontmatter.load(file_path)
+        header = read_header(file_path)
     except Exception:
         # If we can't parse, default to human
         return "human"
 
-    human_modified = parse_timestamp(post.get("human_modified"))
-    ai_modified = parse_timestamp(post.get("ai_modified"))
+    human_modified = parse_timestamp(header.get("human_modified"))
+    ai_modified = parse_timestamp(header.get("ai_modified"))
 
     # Decision logic:
     # - If both missing: human (conservative)
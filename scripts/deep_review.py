@@ -3,6 +3,7 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.console import Console
@@ -11,10 +12,38 @@ from rich.table import Table
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.curate.deep_review import get_review_candidates, get_top_candidate
+from tools.curate.deep_review import (
+    CENTRALITY_WEIGHT,
+    get_top_candidate,
+    select_review_candidates,
+)
+from tools.curate.git_history import DEFAULT_GIT_HISTORY_PATH, GitHistory
+from tools.curate.vault_index import DEFAULT_VAULT_INDEX_PATH, refresh_vault_index
+from tools.sync.linkgraph import DEFAULT_LINK_GRAPH_PATH, LinkGraph
 
 
 console = Console()
+# Warnings go to stderr so that `next --json` prints only JSON on stdout
+err_console = Console(stderr=True)
+
+
+def _load_history(obsidian: Path) -> Optional[GitHistory]:
+    """Load the vault's git history, warning if it is unavailable."""
+    history = GitHistory.load(obsidian, cache_path=DEFAULT_GIT_HISTORY_PATH)
+    if history is None:
+        err_console.print("[yellow]Git history unavailable, using frontmatter only[/yellow]")
+    return history
+
+
+def _load_centrality() -> Optional[dict[str, float]]:
+    """Link centrality from the graph sync maintains, warning if sync has not built one."""
+    centrality = None
+    if DEFAULT_LINK_GRAPH_PATH.exists():
+        with LinkGraph(DEFAULT_LINK_GRAPH_PATH) as link_graph:
+            centrality = link_graph.centrality() or None
+    if centrality is None:
+        err_console.print("[yellow]Link graph unavailable (run sync first), not weighting[/yellow]")
+    return centrality
 
 
 @click.group()
@@ -38,45 +67,84 @@ def cli() -> None:
     default=10,
     help="Maximum candidates to show",
 )
+@click.option(
+    "--per-section",
+    type=click.IntRange(min=1),
+    default=None,
+    help="At most this many candidates from any one section (for batching reviews)",
+)
 @click.option(
     "--include-drafts",
     is_flag=True,
     help="Include draft content",
 )
-def candidates(obsidian: Path, limit: int, include_drafts: bool) -> None:
+@click.option(
+    "--git-history",
+    is_flag=True,
+    help="Treat commits newer than the frontmatter timestamps as modifications",
+)
+@click.option(
+    "--centrality",
+    "use_centrality",
+    is_flag=True,
+    help=(
+        f"Add {CENTRALITY_WEIGHT:.0f} points per multiple of the average note's link "
+        "centrality (PageRank over the link graph sync keeps in .cache/link-graph.sqlite)"
+    ),
+)
+def candidates(
+    obsidian: Path,
+    limit: int,
+    per_section: Optional[int],
+    include_drafts: bool,
+    git_history: bool,
+    use_centrality: bool,
+) -> None:
     """List documents needing deep review, ranked by urgency."""
-    results = get_review_candidates(
-        obsidian,
-        exclude_drafts=not include_drafts,
-    )
+    history = _load_history(obsidian) if git_history else None
+    centrality = _load_centrality() if use_centrality else None
+    with refresh_vault_index(obsidian, DEFAULT_VAULT_INDEX_PATH) as index:
+        results, total = select_review_candidates(
+            obsidian,
+            limit=limit,
+            per_section=per_section,
+            exclude_drafts=not include_drafts,
+            index=index,
+            history=history,
+            centrality=centrality,
+        )
 
     if not results:
         console.print("[yellow]No candidates found for deep review[/yellow]")
         return
 
-    table = Table(title=f"Deep Review Candidates (top {min(limit, len(results))})")
+    table = Table(title=f"Deep Review Candidates (top {len(results)})")
     table.add_column("Score", style="cyan", justify="right")
     table.add_column("Title", style="white")
     table.add_column("Last Review", style="dim")
     table.add_column("Unreviewed Days", style="yellow", justify="right")
+    if centrality:
+        table.add_column("Centrality", style="magenta", justify="right")
     table.add_column("Path", style="dim")
 
-    for candidate in results[:limit]:
+    for candidate in results:
         last_review = (
             "Never" if candidate.days_since_review == -1 else f"{candidate.days_since_review}d ago"
         )
-        table.add_row(
+        row = [
             f"{candidate.score:.0f}",
             candidate.title,
             last_review,
             str(candidate.days_unreviewed_content),
-            str(candidate.path.relative_to(obsidian)),
-        )
+        ]
+        if centrality:
+            row.append(f"{candidate.centrality:.1f}x")
+        table.add_row(*row, str(candidate.path.relative_to(obsidian)))
 
     console.print(table)
 
-    if len(results) > limit:
-        console.print(f"\n[dim]... and {len(results) - limit} more candidates[/dim]")
+    if total > len(results):
+        console.print(f"\n[dim]... and {total - len(results)} more candidates[/dim]")
 
 
 @cli.command("next")
@@ -93,11 +161,32 @@ def candidates(obsidian: Path, limit: int, include_drafts: bool) -> None:
     is_flag=True,
     help="Output as JSON for scripting",
 )
-def next_candidate(obsidian: Path, as_json: bool) -> None:
+@click.option(
+    "--git-history",
+    is_flag=True,
+    help="Treat commits newer than the frontmatter timestamps as modifications",
+)
+@click.option(
+    "--centrality",
+    "use_centrality",
+    is_flag=True,
+    help=(
+        f"Add {CENTRALITY_WEIGHT:.0f} points per multiple of the average note's link "
+        "centrality (PageRank over the link graph sync keeps in .cache/link-graph.sqlite)"
+    ),
+)
+def next_candidate(
+    obsidian: Path, as_json: bool, git_history: bool, use_centrality: bool
+) -> None:
     """Show the single highest priority candidate for deep review."""
     import json
 
-    candidate = get_top_candidate(obsidian)
+    history = _load_history(obsidian) if git_history else None
+    centrality = _load_centrality() if use_centrality else None
+    with refresh_vault_index(obsidian, DEFAULT_VAULT_INDEX_PATH) as index:
+        candidate = get_top_candidate(
+            obsidian, index=index, history=history, centrality=centrality
+        )
 
     if not candidate:
         if as_json:
@@ -114,6 +203,7 @@ def next_candidate(obsidian: Path, as_json: bool) -> None:
                 "score": candidate.score,
                 "days_since_review": candidate.days_since_review,
                 "days_unreviewed_content": candidate.days_unreviewed_content,
+                "centrality": candidate.centrality,
             }
         }
         console.print(json.dumps(output))
@@ -122,6 +212,8 @@ def next_candidate(obsidian: Path, as_json: bool) -> None:
         console.print(f"  Title: {candidate.title}")
         console.print(f"  Path: {candidate.path}")
         console.print(f"  Score: {candidate.score:.0f}")
+        if centrality:
+            console.print(f"  Centrality: {candidate.centrality:.1f}x average")
 
         if candidate.days_since_review == -1:
             console.print("  Status: [red]Never reviewed[/red]")
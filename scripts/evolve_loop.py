@@ -135,6 +135,61 @@ def set_last_push_time() -> None:
         log.warning(f"Could not update last_git_push in state: {e}")
 
 
+def run_native_validation() -> None:
+    """Run validate-all natively when it is due, so /evolve never schedules the skill.
+
+    The deterministic checks (frontmatter, links, orphans) take seconds this
+    way; judgement-based reviews stay with the LLM skills.
+    """
+    try:
+        from tools.curate.validate_all import (
+            DEFAULT_REPORT_PATH,
+            record_validate_all,
+            run_validate_all,
+            write_report,
+        )
+        from tools.evolution.staleness import check_staleness
+        from tools.evolution.state import load_state
+
+        state = load_state(STATE_PATH)
+        is_due, _ = check_staleness("validate-all", state)
+        if not is_due:
+            return
+
+        report = run_validate_all(REPO_ROOT / "obsidian", jobs=4)
+        write_report(report, REPO_ROOT / DEFAULT_REPORT_PATH)
+        record_validate_all(report, STATE_PATH)
+        log.info(
+            f"validate-all (native): {report.total} files, {report.invalid} invalid, "
+            f"{len(report.broken_links)} broken links, {len(report.orphans)} orphans"
+        )
+    except Exception as e:
+        log.warning(f"Native validate-all failed: {e}")
+
+
+def update_vault_stats() -> None:
+    """Refresh the vault index and copy its counts into evolution-state.yaml.
+
+    Keeps content_stats and progress current without /evolve having to
+    count files itself.
+    """
+    try:
+        from tools.curate.vault_index import DEFAULT_VAULT_INDEX_PATH, refresh_vault_index
+        from tools.evolution.state import apply_vault_counts, load_state, save_state
+
+        with refresh_vault_index(
+            REPO_ROOT / "obsidian", REPO_ROOT / DEFAULT_VAULT_INDEX_PATH
+        ) as index:
+            section_counts = index.section_counts()
+            content_stats = index.content_stats()
+
+        state = load_state(STATE_PATH)
+        apply_vault_counts(state, section_counts, content_stats)
+        save_state(state, STATE_PATH)
+    except Exception as e:
+        log.warning(f"Could not update vault stats in state: {e}")
+
+
 def run_evolve(verbose: bool = True, timeout_seconds: int = 5400) -> str:
     """Run a single evolve iteration. Returns claude output.
 
@@ -260,6 +315,10 @@ def main() -> int:
             log.info(f"Runtime: {format_duration(time.time() - start_time)}")
             log.info("─" * 60)
 
+            # Deterministic maintenance first, so /evolve does not pick it up
+            run_native_validation()
+            update_vault_stats()
+
             # Run evolve
             log.info(f"Running /evolve at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}...")
             try:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Query the wikilink graph recorded by sync."""
+
+import json
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.sync.linkgraph import DEFAULT_LINK_GRAPH_PATH, LinkGraph
+
+
+console = Console()
+
+graph_option = click.option(
+    "--graph",
+    "-g",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_LINK_GRAPH_PATH,
+    help="Path to link graph database (written by unfin-sync)",
+)
+json_option = click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+
+
+@click.group()
+def cli() -> None:
+    """Link graph queries: backlinks, orphans and broken links."""
+    pass
+
+
+@cli.command()
+@click.argument("slug")
+@graph_option
+@json_option
+def backlinks(slug: str, graph: Path, as_json: bool) -> None:
+    """List notes linking to SLUG."""
+    with LinkGraph(graph) as link_graph:
+        results = link_graph.backlinks(slug)
+
+    if as_json:
+        print(json.dumps({"slug": slug, "backlinks": results}, indent=2))
+        return
+
+    if not results:
+        console.print(f"[yellow]No backlinks to {slug}[/yellow]")
+        return
+
+    table = Table(title=f"Backlinks to {slug} ({len(results)})")
+    table.add_column("Source", style="cyan")
+    table.add_column("Anchor", style="dim")
+    for row in results:
+        table.add_row(row["source"], row["anchor"] or "")
+    console.print(table)
+
+
+@cli.command()
+@click.option("--include-archived", is_flag=True, help="Also report archived notes")
+@graph_option
+@json_option
+def orphans(include_archived: bool, graph: Path, as_json: bool) -> None:
+    """List notes that no other note links to."""
+    with LinkGraph(graph) as link_graph:
+        results = link_graph.orphans(include_archived=include_archived)
+
+    if as_json:
+        print(json.dumps({"orphans": results}, indent=2))
+        return
+
+    if not results:
+        console.print("[green]No orphaned notes[/green]")
+        return
+
+    console.print(f"[bold]{len(results)} orphaned note(s):[/bold]")
+    for source in results:
+        console.print(f"  {source}")
+
+
+@cli.command()
+@graph_option
+@json_option
+def broken(graph: Path, as_json: bool) -> None:
+    """List wikilinks whose target does not exist."""
+    with LinkGraph(graph) as link_graph:
+        results = link_graph.broken()
+
+    if as_json:
+        print(json.dumps({"broken": results}, indent=2))
+        return
+
+    if not results:
+        console.print("[green]No broken links[/green]")
+        return
+
+    table = Table(title=f"Broken links ({len(results)})")
+    table.add_column("Source", style="cyan")
+    table.add_column("Target", style="red")
+    for row in results:
+        target = row["target"] + (f"#{row['anchor']}" if row["anchor"] else "")
+        table.add_row(row["source"], target)
+    console.print(table)
+
+
+def main() -> None:
+    """Entry point."""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@
 
 import json
 import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.console import Console
@@ -11,12 +13,18 @@ from rich.console import Console
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.todo import process_vetoes, get_next_task, Task
-from tools.todo.processor import process_todo_file
+from tools.todo import Task, TaskType
+from tools.todo.compact import DEFAULT_KEEP_DAYS, archive_dir_for, compact_todo, search_archive
+from tools.todo.dedup import DuplicateIndex
+from tools.todo.index import DEFAULT_TODO_INDEX_PATH, TaskIndex
+from tools.todo.processor import add_task, process_todo_file
+from tools.todo.scan import scan_todo
 
 console = Console()
 
-DEFAULT_TODO_PATH = Path(__file__).parent.parent / "obsidian" / "workflow" / "todo.md"
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_TODO_PATH = REPO_ROOT / "obsidian" / "workflow" / "todo.md"
+TODO_INDEX_PATH = REPO_ROOT / DEFAULT_TODO_INDEX_PATH
 
 
 def task_to_dict(task: Task) -> dict:
@@ -47,8 +55,8 @@ def cli() -> None:
 @click.option("--dry-run", is_flag=True, help="Don't modify file, just show what would happen")
 def process_vetoes_cmd(todo_file: Path, dry_run: bool) -> None:
     """Process #veto tagged items, moving them to the Vetoed section."""
-    content = todo_file.read_text(encoding="utf-8")
-    new_content, vetoed = process_vetoes(content)
+    scan = scan_todo(todo_file.read_bytes())
+    vetoed = scan.vetoed
 
     if not vetoed:
         console.print("[dim]No vetoed items found[/dim]")
@@ -61,7 +69,8 @@ def process_vetoes_cmd(todo_file: Path, dry_run: bool) -> None:
     if dry_run:
         console.print("\n[yellow]Dry run - file not modified[/yellow]")
     else:
-        todo_file.write_text(new_content, encoding="utf-8")
+        assert scan.content is not None  # Rewritten whenever a task was vetoed
+        todo_file.write_text(scan.content, encoding="utf-8")
         console.print("\n[green]Moved to Vetoed Tasks section[/green]")
 
 
@@ -76,17 +85,12 @@ def process_vetoes_cmd(todo_file: Path, dry_run: bool) -> None:
 @click.option("--process-vetoes", "do_vetoes", is_flag=True, help="Process vetoes first")
 def next_task_cmd(todo_file: Path, as_json: bool, do_vetoes: bool) -> None:
     """Get the next task to execute."""
-    content = todo_file.read_text(encoding="utf-8")
-
     if do_vetoes:
-        new_content, vetoed = process_vetoes(content)
-        if vetoed:
-            todo_file.write_text(new_content, encoding="utf-8")
-            if not as_json:
-                console.print(f"[dim]Processed {len(vetoed)} vetoed item(s)[/dim]\n")
-            content = new_content
-
-    task = get_next_task(content)
+        _, vetoed, task = process_todo_file(todo_file, TODO_INDEX_PATH)
+        if vetoed and not as_json:
+            console.print(f"[dim]Processed {len(vetoed)} vetoed item(s)[/dim]\n")
+    else:
+        task = TaskIndex.load(todo_file, TODO_INDEX_PATH).next_task()
 
     if task is None:
         if as_json:
@@ -114,7 +118,7 @@ def next_task_cmd(todo_file: Path, as_json: bool, do_vetoes: bool) -> None:
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def process_cmd(todo_file: Path, as_json: bool) -> None:
     """Process vetoes and get next task in one step."""
-    modified, vetoed, next_task = process_todo_file(todo_file)
+    modified, vetoed, next_task = process_todo_file(todo_file, TODO_INDEX_PATH)
 
     if as_json:
         result = {
@@ -139,6 +143,227 @@ def process_cmd(todo_file: Path, as_json: bool) -> None:
             console.print("[yellow]No pending tasks[/yellow]")
 
 
+@cli.command("deps")
+@click.option(
+    "--todo-file",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_TODO_PATH,
+    help="Path to todo.md",
+)
+def deps_cmd(todo_file: Path) -> None:
+    """Show Blocked-by dependencies, unlock counts and cycles."""
+    active, graph = TaskIndex.load(todo_file, TODO_INDEX_PATH).graph()
+
+    if not active:
+        console.print("[yellow]No active tasks[/yellow]")
+        return
+
+    for i, entry in enumerate(active):
+        if not graph.is_blocked(i):
+            state = "[green]ready[/green]" if graph.pending[i] else f"[dim]{entry.status}[/dim]"
+        elif i in graph.stuck:
+            state = "[red]cycle[/red]"
+        else:
+            state = "[yellow]blocked[/yellow]"
+        line = f"{state} P{entry.priority}: {entry.title}"
+        unlocks = graph.unlocks_count(i)
+        if unlocks:
+            line += f" [dim](unlocks {unlocks})[/dim]"
+        console.print(line)
+        for blocker in sorted(graph.blockers[i]):
+            console.print(f"    waits for: {graph.titles[blocker]}")
+        for reference in graph.unmet[i]:
+            console.print(f"    waits for (blocked, failed or vetoed): {reference}")
+        for reference in graph.unresolved[i]:
+            console.print(f"    [dim]not found, ignored: {reference}[/dim]")
+
+    for cycle in graph.cycle_titles():
+        console.print(f"\n[red]Cycle:[/red] {' → '.join(cycle + cycle[:1])}")
+
+
+@cli.command("compact")
+@click.option(
+    "--todo-file",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_TODO_PATH,
+    help="Path to todo.md",
+)
+@click.option(
+    "--keep-days",
+    type=int,
+    default=DEFAULT_KEEP_DAYS,
+    show_default=True,
+    help="Keep completed entries newer than this many days",
+)
+@click.option("--dry-run", is_flag=True, help="Don't modify files, just show what would move")
+def compact_cmd(todo_file: Path, keep_days: int, dry_run: bool) -> None:
+    """Move old completed entries into monthly archive files."""
+    result = compact_todo(todo_file, keep_days=keep_days, dry_run=dry_run)
+
+    if not result.archived:
+        console.print(f"[dim]No completed entries older than {keep_days} days[/dim]")
+        return
+
+    verb = "Would archive" if dry_run else "Archived"
+    console.print(f"[bold]{verb} {len(result.archived)} completed entries:[/bold]")
+    for shard, count in sorted(result.shards.items()):
+        console.print(f"  • {archive_dir_for(todo_file).name}/{shard}.md: {count}")
+    console.print(
+        f"todo.md: {result.size_before / 1024:.0f} KB → {result.size_after / 1024:.0f} KB"
+    )
+    if dry_run:
+        console.print("\n[yellow]Dry run - files not modified[/yellow]")
+
+
+@cli.command("archived")
+@click.argument("query")
+@click.option(
+    "--todo-file",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_TODO_PATH,
+    help="Path to todo.md",
+)
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def archived_cmd(query: str, todo_file: Path, as_json: bool) -> None:
+    """Search the titles of archived completed entries."""
+    matches = search_archive(archive_dir_for(todo_file), query)
+
+    if as_json:
+        print(json.dumps([asdict(task) for task in matches], indent=2))
+        return
+
+    if not matches:
+        console.print("[yellow]No archived entries match[/yellow]")
+        return
+
+    for task in matches:
+        mark = "✓" if task.status == "completed" else "✗"
+        console.print(f"{mark} {task.completed}: {task.title} [dim]({task.shard}.md)[/dim]")
+
+
+@cli.command("dedup")
+@click.option(
+    "--todo-file",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_TODO_PATH,
+    help="Path to todo.md",
+)
+@click.option("--title", help="Check a proposed task title instead of listing duplicates")
+@click.option("--notes", default="", help="Notes of the proposed task")
+@click.option("--all", "show_all", is_flag=True, help="Include pairs with no active task")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def dedup_cmd(
+    todo_file: Path, title: Optional[str], notes: str, show_all: bool, as_json: bool
+) -> None:
+    """Find near-duplicate tasks across todo.md and its archive."""
+    index = DuplicateIndex.from_todo(todo_file)
+
+    if title is not None:
+        matches = index.query(title, notes)
+        if as_json:
+            print(json.dumps({"duplicates": [asdict(match) for match in matches]}, indent=2))
+        elif not matches:
+            console.print("[green]No similar tasks found[/green]")
+        else:
+            console.print(f"[bold]{len(matches)} similar task(s):[/bold]")
+            for match in matches:
+                record = match.record
+                console.print(
+                    f"  {match.similarity:.0%} {match.field}: {record.title} "
+                    f"[dim]({record.section}, {record.source})[/dim]"
+                )
+        if matches:
+            sys.exit(1)
+        return
+
+    pairs = [
+        (first, second, match)
+        for first, second, match in index.pairs()
+        if show_all or "active" in (first.section, second.section)
+    ]
+    if as_json:
+        print(
+            json.dumps(
+                [
+                    {
+                        "first": asdict(first),
+                        "second": asdict(second),
+                        "similarity": match.similarity,
+                        "field": match.field,
+                    }
+                    for first, second, match in pairs
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    if not pairs:
+        console.print("[green]No near-duplicate tasks found[/green]")
+        return
+
+    console.print(f"[bold]{len(pairs)} near-duplicate pair(s):[/bold]")
+    for first, second, match in pairs:
+        console.print(f"  {match.similarity:.0%} {match.field}")
+        console.print(f"    {first.title} [dim]({first.section}, {first.source})[/dim]")
+        console.print(f"    {second.title} [dim]({second.section}, {second.source})[/dim]")
+
+
+@cli.command("add")
+@click.argument("title")
+@click.option(
+    "--todo-file",
+    type=click.Path(exists=True, path_type=Path),
+    default=DEFAULT_TODO_PATH,
+    help="Path to todo.md",
+)
+@click.option("--priority", type=click.IntRange(0, 3), default=2, show_default=True)
+@click.option(
+    "--type",
+    "task_type",
+    type=click.Choice([t.value for t in TaskType]),
+    default=TaskType.OTHER.value,
+    show_default=True,
+)
+@click.option("--notes", default="", help="Task notes")
+@click.option("--source", help="What proposed the task")
+@click.option("--blocked-by", help="Title(s) of tasks this waits for, separated by ';'")
+@click.option("--force", is_flag=True, help="Append even if a similar task exists")
+def add_cmd(
+    title: str,
+    todo_file: Path,
+    priority: int,
+    task_type: str,
+    notes: str,
+    source: Optional[str],
+    blocked_by: Optional[str],
+    force: bool,
+) -> None:
+    """Append a task to Active Tasks, refusing near-duplicates."""
+    duplicates = add_task(
+        todo_file,
+        title,
+        priority,
+        TaskType(task_type),
+        notes=notes,
+        source=source,
+        blocked_by=blocked_by,
+        check_duplicates=not force,
+    )
+
+    if duplicates:
+        console.print("[red]Not added: similar to existing task(s):[/red]")
+        for match in duplicates:
+            record = match.record
+            console.print(
+                f"  {match.similarity:.0%} {match.field}: {record.title} "
+                f"[dim]({record.section}, {record.source})[/dim]"
+            )
+        sys.exit(1)
+
+    console.print(f"[green]Added[/green] P{priority}: {title}")
+
+
 def main() -> None:
     """Entry point."""
     cli()
@@ -2,6 +2,7 @@
 """Sync Obsidian vault to Hugo content directory."""
 
 import sys
+import time
 from pathlib import Path
 
 import click
@@ -11,7 +12,10 @@ from rich.table import Table
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.sync import convert_obsidian_to_hugo
+from tools.sync import SyncResult, sync_vault
+from tools.sync.linkgraph import DEFAULT_LINK_GRAPH_PATH
+from tools.sync.manifest import DEFAULT_MANIFEST_PATH
+from tools.curate.validation_cache import DEFAULT_VALIDATION_CACHE_PATH
 
 
 console = Console()
@@ -43,13 +47,56 @@ console = Console()
     is_flag=True,
     help="Show what would be synced without making changes",
 )
+@click.option(
+    "--manifest",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_MANIFEST_PATH,
+    help="Path to sync manifest used for incremental sync",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes for conversion (default: 1, serial)",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Reconvert every file instead of only changed ones",
+)
+@click.option(
+    "--validate",
+    is_flag=True,
+    help="Also validate frontmatter (converted notes are checked in memory)",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep running and resync notes as they change",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="With --watch, poll file stats instead of using inotify",
+)
 def main(
     obsidian: Path,
     hugo: Path,
     include_drafts: bool,
     dry_run: bool,
+    manifest: Path,
+    jobs: int,
+    full: bool,
+    validate: bool,
+    watch: bool,
+    poll: bool,
 ) -> None:
     """Sync Obsidian vault content to Hugo."""
+    if watch and dry_run:
+        raise click.UsageError("--watch cannot be combined with --dry-run")
+
     console.print("[bold]Syncing Obsidian -> Hugo[/bold]")
     console.print(f"  Source: {obsidian.absolute()}")
     console.print(f"  Target: {hugo.absolute()}")
@@ -57,24 +104,108 @@ def main(
     if dry_run:
         console.print("  [yellow]Dry run - no changes will be made[/yellow]")
 
-    converted = convert_obsidian_to_hugo(
+    result = sync_vault(
         obsidian_path=obsidian,
         hugo_content_path=hugo,
         exclude_drafts=not include_drafts,
         dry_run=dry_run,
+        manifest_path=manifest,
+        jobs=jobs,
+        full=full,
+        link_graph_path=DEFAULT_LINK_GRAPH_PATH,
+        validate=validate,
+        validation_cache_path=DEFAULT_VALIDATION_CACHE_PATH,
     )
+    unchanged = len(result.unchanged) + len(result.skipped)
 
-    if converted:
-        table = Table(title=f"{'Would sync' if dry_run else 'Synced'} {len(converted)} files")
+    table = Table(title="Would sync" if dry_run else "Synced")
+    table.add_column("Result", style="cyan")
+    table.add_column("Files", style="white", justify="right")
+    table.add_row("Written", f"[green]{len(result.written)}[/green]")
+    table.add_row("Unchanged", f"[dim]{unchanged}[/dim]")
+    table.add_row("Deleted (orphaned)", f"[red]{len(result.deleted)}[/red]")
+    console.print(table)
+
+    if result.written or result.deleted:
+        table = Table(title="Changed files")
         table.add_column("File", style="cyan")
         table.add_column("Status", style="green")
 
-        for path in converted:
-            table.add_row(str(path.relative_to(hugo)), "ok" if not dry_run else "pending")
+        for path in result.written:
+            table.add_row(str(path.relative_to(hugo)), "written" if not dry_run else "pending")
+        for path in result.deleted:
+            table.add_row(
+                str(path.relative_to(hugo)),
+                "[red]deleted[/red]" if not dry_run else "[red]would delete[/red]",
+            )
 
         console.print(table)
     else:
-        console.print("[yellow]No files to sync[/yellow]")
+        console.print("[yellow]Hugo content already up to date[/yellow]")
+
+    if result.validation is not None:
+        _print_validation(result.validation)
+
+    if watch:
+        _watch(obsidian, hugo, not include_drafts, manifest, poll)
+
+
+def _print_validation(results: dict) -> None:
+    """Print validation totals and any files with problems."""
+    console.print(
+        f"\n[bold]Validated {results['total']} files:[/bold] "
+        f"[green]{results['valid']} valid[/green], "
+        f"[red]{results['invalid']} invalid[/red], "
+        f"[yellow]{results['warnings']} warnings[/yellow]"
+    )
+    for file_result in results["files"]:
+        if not file_result["valid"] or file_result["warnings"]:
+            console.print(f"[bold]{file_result['path']}[/bold]")
+            for error in file_result["errors"]:
+                console.print(f"  [red]✗ {error}[/red]")
+            for warning in file_result["warnings"]:
+                console.print(f"  [yellow]⚠ {warning}[/yellow]")
+
+
+def _watch(
+    obsidian: Path,
+    hugo: Path,
+    exclude_drafts: bool,
+    manifest: Path,
+    poll: bool,
+) -> None:
+    """Run watch mode, printing a line per resync."""
+    from tools.sync.watch import watch_vault
+
+    def report(result: SyncResult, changed: set[Path], elapsed: float) -> None:
+        parts = [f"{len(result.written)} written"]
+        if result.unchanged:
+            parts.append(f"{len(result.unchanged)} unchanged")
+        if result.deleted:
+            parts.append(f"{len(result.deleted)} deleted")
+        console.print(
+            f"[dim]{time.strftime('%H:%M:%S')}[/dim] "
+            f"{len(changed)} changed -> {', '.join(parts)} "
+            f"[dim]({elapsed * 1000:.0f} ms)[/dim]"
+        )
+        for path in result.written:
+            console.print(f"  [cyan]{path.relative_to(hugo)}[/cyan]")
+        for path in result.deleted:
+            console.print(f"  [red]- {path.relative_to(hugo)}[/red]")
+
+    console.print("\n[bold]Watching for changes[/bold] (Ctrl+C to stop)")
+    try:
+        watch_vault(
+            obsidian_path=obsidian,
+            hugo_content_path=hugo,
+            exclude_drafts=exclude_drafts,
+            manifest_path=manifest,
+            force_polling=poll,
+            on_sync=report,
+            link_graph_path=DEFAULT_LINK_GRAPH_PATH,
+        )
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching[/dim]")
 
 
 if __name__ == "__main__":
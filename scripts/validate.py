@@ -11,14 +11,27 @@ from rich.table import Table
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.curate.validate import validate_frontmatter, validate_directory, fix_frontmatter
+from tools.curate.fix import iter_fix_files
+from tools.curate.validate import (
+    iter_validate_directory,
+    tally_result,
+    validate_frontmatter,
+)
+from tools.curate.validate_all import (
+    DEFAULT_REPORT_PATH,
+    DEFAULT_STATE_PATH,
+    record_validate_all,
+    run_validate_all,
+    write_report,
+)
+from tools.curate.validation_cache import DEFAULT_VALIDATION_CACHE_PATH
 
 
 console = Console()
 
 
 @click.command()
-@click.argument("path", type=click.Path(exists=True, path_type=Path))
+@click.argument("path", type=click.Path(exists=True, path_type=Path), required=False)
 @click.option(
     "--strict",
     is_flag=True,
@@ -27,21 +40,92 @@ console = Console()
 @click.option(
     "--fix",
     is_flag=True,
-    help="Attempt to fix issues automatically",
+    help="Add missing fields to every invalid file before validating",
+)
+@click.option(
+    "--dry-run",
+    "-n",
+    is_flag=True,
+    help="With --fix, show the fixes as diffs without writing them",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-validate every file instead of reusing cached results",
+)
+@click.option(
+    "--all",
+    "validate_all",
+    is_flag=True,
+    help="Run every validate-all check over the vault (PATH defaults to obsidian/)",
 )
-def main(path: Path, strict: bool, fix: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Worker processes for directory validation",
+)
+@click.option(
+    "--report",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_REPORT_PATH,
+    help="Where --all writes its JSON report",
+)
+@click.option(
+    "--state",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_STATE_PATH,
+    help="evolution-state.yaml updated by --all",
+)
+@click.option(
+    "--no-state",
+    is_flag=True,
+    help="Do not record the --all run in evolution-state.yaml",
+)
+def main(
+    path: Path | None,
+    strict: bool,
+    fix: bool,
+    dry_run: bool,
+    no_cache: bool,
+    validate_all: bool,
+    jobs: int,
+    report: Path,
+    state: Path,
+    no_state: bool,
+) -> None:
     """Validate frontmatter at PATH (file or directory)."""
+    if validate_all:
+        _validate_all(path or Path("obsidian"), strict, jobs, report, None if no_state else state)
+        return
+    if path is None:
+        raise click.UsageError("PATH is required unless --all is given")
+
+    cache_path = None if no_cache else DEFAULT_VALIDATION_CACHE_PATH
+    if fix:
+        _fix(path, strict, dry_run, jobs, cache_path)
+        if dry_run:
+            return
+
     if path.is_file():
         result = validate_frontmatter(path, strict=strict)
         _print_validation_result(result)
-
-        if fix and not result["valid"]:
-            if fix_frontmatter(path):
-                console.print("[green]Fixed frontmatter issues[/green]")
-
         sys.exit(0 if result["valid"] else 1)
     else:
-        results = validate_directory(path, strict=strict)
+        results = {"total": 0, "valid": 0, "invalid": 0, "warnings": 0}
+
+        # Stream details for problem files as they are validated
+        for file_result in iter_validate_directory(
+            path, strict=strict, jobs=jobs, cache_path=cache_path
+        ):
+            tally_result(results, file_result)
+            if not file_result["valid"] or file_result["warnings"]:
+                console.print(f"\n[bold]{file_result['path']}[/bold]")
+                for error in file_result["errors"]:
+                    console.print(f"  [red]✗ {error}[/red]")
+                for warning in file_result["warnings"]:
+                    console.print(f"  [yellow]⚠ {warning}[/yellow]")
 
         table = Table(title=f"Validation Results: {path}")
         table.add_column("Metric", style="cyan")
@@ -54,18 +138,80 @@ def main(path: Path, strict: bool, fix: bool) -> None:
 
         console.print(table)
 
-        # Show details for invalid files
-        for file_result in results["files"]:
-            if not file_result["valid"] or file_result["warnings"]:
-                console.print(f"\n[bold]{file_result['path']}[/bold]")
-                for error in file_result["errors"]:
-                    console.print(f"  [red]✗ {error}[/red]")
-                for warning in file_result["warnings"]:
-                    console.print(f"  [yellow]⚠ {warning}[/yellow]")
-
         sys.exit(0 if results["invalid"] == 0 else 1)
 
 
+def _fix(path: Path, strict: bool, dry_run: bool, jobs: int, cache_path: Path | None) -> None:
+    """Repair every invalid file at PATH, or preview the repairs as diffs."""
+    if path.is_file():
+        results = [validate_frontmatter(path, strict=strict)]
+    else:
+        results = list(
+            iter_validate_directory(path, strict=strict, jobs=jobs, cache_path=cache_path)
+        )
+    # Valid notes are left alone, even if they lack fields a fix would add
+    invalid = [Path(result["path"]) for result in results if not result["valid"]]
+
+    fixed = 0
+    for fix in iter_fix_files(invalid, dry_run=dry_run, jobs=jobs):
+        fixed += 1
+        if dry_run:
+            console.print(fix.diff(), markup=False, highlight=False, end="")
+        else:
+            console.print(f"[green]Fixed[/green] {fix.path} (added {', '.join(fix.added)})")
+
+    verb = "would be fixed" if dry_run else "fixed"
+    console.print(f"[bold]{fixed} of {len(invalid)} invalid file(s) {verb}[/bold]\n")
+
+
+def _validate_all(
+    obsidian_path: Path,
+    strict: bool,
+    jobs: int,
+    report_path: Path,
+    state_path: Path | None,
+) -> None:
+    """Run validate-all natively, write the report and record the run."""
+    report = run_validate_all(obsidian_path, strict=strict, jobs=jobs)
+    write_report(report, report_path)
+    if state_path is not None and state_path.exists():
+        record_validate_all(report, state_path)
+
+    table = Table(title=f"Validate All: {obsidian_path}")
+    table.add_column("Check", style="cyan")
+    table.add_column("Count", style="white")
+
+    table.add_row("Total files", str(report.total))
+    table.add_row("Valid", f"[green]{report.valid}[/green]")
+    table.add_row("Invalid", f"[red]{report.invalid}[/red]")
+    table.add_row("Warnings", f"[yellow]{report.warnings}[/yellow]")
+    table.add_row("Empty content", str(report.empty))
+    table.add_row("Broken links", f"[red]{len(report.broken_links)}[/red]")
+    table.add_row("Orphaned notes", f"[yellow]{len(report.orphans)}[/yellow]")
+
+    console.print(table)
+
+    for file_result in report.files:
+        console.print(f"\n[bold]{file_result['path']}[/bold]")
+        for error in file_result["errors"]:
+            console.print(f"  [red]✗ {error}[/red]")
+        for warning in file_result["warnings"]:
+            console.print(f"  [yellow]⚠ {warning}[/yellow]")
+
+    if report.broken_links:
+        console.print("\n[bold]Broken links[/bold]")
+        for link in report.broken_links:
+            console.print(f"  [red]✗ {link['source']}: [[{link['target']}]][/red]")
+
+    if report.orphans:
+        console.print("\n[bold]Orphaned notes[/bold]")
+        for source in report.orphans:
+            console.print(f"  [yellow]⚠ {source}[/yellow]")
+
+    console.print(f"\n[dim]Report written to {report_path}[/dim]")
+    sys.exit(0 if report.ok else 1)
+
+
 def _print_validation_result(result: dict) -> None:
     """Print a single validation result."""
     status = "[green]✓ Valid[/green]" if result["valid"] else "[red]✗ Invalid[/red]"
@@ -1,11 +1,20 @@
 """Content curation tools."""
 
-from .deep_review import ReviewCandidate, get_review_candidates, get_top_candidate
+from .deep_review import (
+    ReviewCandidate,
+    get_review_candidates,
+    get_top_candidate,
+    select_review_candidates,
+)
 from .validate import validate_frontmatter
+from .validate_all import ValidateAllReport, run_validate_all
 
 __all__ = [
     "validate_frontmatter",
+    "run_validate_all",
+    "ValidateAllReport",
     "get_review_candidates",
     "get_top_candidate",
+    "select_review_candidates",
     "ReviewCandidate",
 ]
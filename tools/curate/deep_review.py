@@ -1,15 +1,35 @@
 """Deep review candidate selection.
 
 Finds and ranks documents that need comprehensive review based on
-their last_deep_review timestamp and modification history.
+their last_deep_review timestamp and modification history, optionally
+weighted by how central each note is in the wikilink graph.
 """
 
+import heapq
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
-import frontmatter
+from .header import read_header
+
+if TYPE_CHECKING:
+    from tools.sync.inventory import VaultInventory
+
+    from .git_history import GitHistory
+    from .vault_index import VaultIndex
+
+# Frontmatter timestamps deep review reads (kept in sync with the vault index)
+TIMESTAMP_FIELDS = ("modified", "human_modified", "ai_modified", "last_deep_review")
+
+# A commit this soon after last_deep_review is taken to be the review's own commit
+REVIEW_COMMIT_GRACE = timedelta(hours=1)
+
+# Score points per multiple of the average note's link centrality
+CENTRALITY_WEIGHT = 10.0
+
+# Sections reviewed when none are given
+DEFAULT_CONTENT_TYPES = ["topics", "concepts", "tenets", "arguments"]
 
 
 @dataclass
@@ -23,6 +43,24 @@ class ReviewCandidate:
     days_since_review: int  # -1 if never reviewed
     days_unreviewed_content: int  # days since content changed without review
     score: float  # Higher = more urgent
+    centrality: float = 0.0  # PageRank relative to the average note (0 if not weighted)
+
+
+@dataclass(eq=False)
+class _Urgency:
+    """Ranking key of a candidate: higher score first, then path order."""
+
+    score: float
+    path: str
+
+    @classmethod
+    def of(cls, candidate: ReviewCandidate) -> "_Urgency":
+        """Key for a candidate."""
+        return cls(candidate.score, candidate.path.as_posix())
+
+    def __lt__(self, other: "_Urgency") -> bool:
+        """True if self is less urgent (lower score, or later path on a tie)."""
+        return (self.score, other.path) < (other.score, self.path)
 
 
 def parse_timestamp(value: object) -> Optional[datetime]:
@@ -75,6 +113,7 @@ def _evaluate_file(
     file_path: Path,
     now: datetime,
     exclude_drafts: bool,
+    history: Optional["GitHistory"] = None,
 ) -> Optional[ReviewCandidate]:
     """
     Evaluate a single file for review candidacy.
@@ -83,30 +122,68 @@ def _evaluate_file(
         file_path: Path to markdown file
         now: Current time (timezone-aware)
         exclude_drafts: Whether to skip draft content
+        history: Optional git history used to correct stale timestamps
 
     Returns:
         ReviewCandidate if file needs review, None otherwise
     """
     try:
-        post = frontmatter.load(file_path)
+        header = read_header(file_path)
     except Exception:
         return None
 
+    return _evaluate_metadata(
+        file_path,
+        header.metadata,
+        lambda: header.body_is_empty,
+        now,
+        exclude_drafts,
+        history.last_modified(file_path) if history else None,
+    )
+
+
+def _evaluate_metadata(
+    file_path: Path,
+    metadata: dict,
+    body_is_empty: Callable[[], bool],
+    now: datetime,
+    exclude_drafts: bool,
+    committed: Optional[datetime] = None,
+) -> Optional[ReviewCandidate]:
+    """
+    Evaluate a note's metadata for review candidacy.
+
+    Args:
+        file_path: Path to markdown file
+        metadata: Frontmatter (only title, draft and timestamps are used)
+        body_is_empty: Called (at most once) to check for placeholder content
+        now: Current time (timezone-aware)
+        exclude_drafts: Whether to skip draft content
+        committed: Time of the file's last commit, if known. A commit later
+            than the frontmatter timestamps counts as a modification, unless
+            it is within REVIEW_COMMIT_GRACE of the last deep review.
+
+    Returns:
+        ReviewCandidate if file needs review, None otherwise
+    """
     # Check draft status
-    if exclude_drafts and post.metadata.get("draft", False):
+    if exclude_drafts and metadata.get("draft", False):
         return None
 
     # Skip placeholders or empty content
-    if not post.content.strip():
+    if body_is_empty():
         return None
 
-    title = post.metadata.get("title", file_path.stem)
+    title = metadata.get("title", file_path.stem)
 
     # Parse timestamps
-    modified = _ensure_tz_aware(_get_latest_modified(post.metadata))
+    modified = _ensure_tz_aware(_get_latest_modified(metadata))
     last_deep_review = _ensure_tz_aware(
-        parse_timestamp(post.metadata.get("last_deep_review"))
+        parse_timestamp(metadata.get("last_deep_review"))
     )
+    if committed is not None and (modified is None or committed > modified):
+        if last_deep_review is None or committed > last_deep_review + REVIEW_COMMIT_GRACE:
+            modified = committed
 
     # Calculate metrics
     if last_deep_review is None:
@@ -141,10 +218,121 @@ def _evaluate_file(
     )
 
 
+def _iter_section_files(
+    content_dir: Path,
+    content_types: list[str],
+    inventory: Optional["VaultInventory"] = None,
+) -> Iterator[tuple[str, Path]]:
+    """Yield (content_type, path) for top-level markdown files in each section."""
+    if inventory is not None:
+        for entry in inventory.select(
+            exclude_drafts=False, sections=content_types, archived=False
+        ):
+            if len(entry.rel_path.parts) == 1:
+                yield entry.section, entry.path
+        return
+
+    for content_type in content_types:
+        type_dir = content_dir / content_type
+        if not type_dir.exists():
+            continue
+
+        for md_file in type_dir.glob("*.md"):
+            yield content_type, md_file
+
+
+def _iter_indexed(
+    content_dir: Path,
+    content_types: list[str],
+    index: "VaultIndex",
+    now: datetime,
+    exclude_drafts: bool,
+    history: Optional["GitHistory"] = None,
+) -> Iterator[tuple[str, ReviewCandidate]]:
+    """Evaluate top-level section notes from the vault index (no file reads)."""
+    for row in index.notes(sections=content_types, include_drafts=True, archived=False):
+        if "/" in row["rel_path"] or row["parse_error"] is not None:
+            continue
+        md_file = content_dir.parent / row["source"]
+        if md_file.stem == row["section"]:
+            # Section landing page
+            continue
+
+        metadata = {name: row[name] for name in TIMESTAMP_FIELDS if row[name] is not None}
+        metadata["draft"] = bool(row["draft"])
+        if row["title"] is not None:
+            metadata["title"] = row["title"]
+        body_empty = bool(row["body_empty"])
+
+        candidate = _evaluate_metadata(
+            md_file,
+            metadata,
+            lambda: body_empty,
+            now,
+            exclude_drafts,
+            history.last_modified(md_file) if history else None,
+        )
+        if candidate:
+            yield row["section"], candidate
+
+
+def _iter_candidates(
+    content_dir: Path,
+    content_types: Optional[list[str]],
+    exclude_drafts: bool,
+    inventory: Optional["VaultInventory"],
+    index: Optional["VaultIndex"],
+    history: Optional["GitHistory"] = None,
+    centrality: Optional[dict[str, float]] = None,
+) -> Iterator[tuple[str, ReviewCandidate]]:
+    """Yield (section, candidate) for every note needing review, in scan order."""
+    found = _iter_unweighted(content_dir, content_types, exclude_drafts, inventory, index, history)
+    if not centrality:
+        yield from found
+        return
+
+    average = 1.0 / len(centrality)
+    for section, candidate in found:
+        source = candidate.path.relative_to(content_dir.parent).as_posix()
+        candidate.centrality = centrality.get(source, 0.0) / average
+        candidate.score += CENTRALITY_WEIGHT * candidate.centrality
+        yield section, candidate
+
+
+def _iter_unweighted(
+    content_dir: Path,
+    content_types: Optional[list[str]],
+    exclude_drafts: bool,
+    inventory: Optional["VaultInventory"],
+    index: Optional["VaultIndex"],
+    history: Optional["GitHistory"],
+) -> Iterator[tuple[str, ReviewCandidate]]:
+    """Candidates scored on review age alone."""
+    content_types = content_types or DEFAULT_CONTENT_TYPES
+    now = datetime.now(timezone.utc)
+
+    if index is not None:
+        yield from _iter_indexed(content_dir, content_types, index, now, exclude_drafts, history)
+        return
+
+    for content_type, md_file in _iter_section_files(content_dir, content_types, inventory):
+        # Skip index files (section landing pages)
+        if md_file.stem == content_type or md_file.name == "_index.md":
+            continue
+
+        candidate = _evaluate_file(md_file, now, exclude_drafts, history)
+        if candidate:
+            yield content_type, candidate
+
+
 def get_review_candidates(
     content_dir: Path,
     content_types: Optional[list[str]] = None,
     exclude_drafts: bool = True,
+    inventory: Optional["VaultInventory"] = None,
+    index: Optional["VaultIndex"] = None,
+    history: Optional["GitHistory"] = None,
+    centrality: Optional[dict[str, float]] = None,
 ) -> list[ReviewCandidate]:
     """
     Find all documents that need deep review.
@@ -153,36 +341,91 @@ def get_review_candidates(
         content_dir: Root obsidian directory
         content_types: Subdirs to scan (default: topics, concepts, tenets, arguments)
         exclude_drafts: Skip draft content
+        inventory: Optional pre-scanned vault inventory to use instead of globbing
+        index: Optional refreshed vault index; candidates are then evaluated
+            from indexed metadata without reading any file
+        history: Optional git history; last commit times then override
+            frontmatter modification timestamps that are older
+        centrality: Optional PageRank per source path (LinkGraph.centrality);
+            adds CENTRALITY_WEIGHT points per multiple of the average rank
 
     Returns:
-        List of ReviewCandidate sorted by urgency (highest score first)
+        List of ReviewCandidate sorted by urgency (highest score first, then
+        by path), in the same order whichever source the notes came from
     """
-    content_types = content_types or ["topics", "concepts", "tenets", "arguments"]
-    now = datetime.now(timezone.utc)
-    candidates: list[ReviewCandidate] = []
+    candidates = [
+        candidate
+        for _, candidate in _iter_candidates(
+            content_dir, content_types, exclude_drafts, inventory, index, history, centrality
+        )
+    ]
 
-    for content_type in content_types:
-        type_dir = content_dir / content_type
-        if not type_dir.exists():
-            continue
+    # Sort by score descending (highest urgency first), ties by path
+    candidates.sort(key=_Urgency.of, reverse=True)
+    return candidates
 
-        for md_file in type_dir.glob("*.md"):
-            # Skip index files (section landing pages)
-            if md_file.stem == content_type or md_file.name == "_index.md":
-                continue
 
-            candidate = _evaluate_file(md_file, now, exclude_drafts)
-            if candidate:
-                candidates.append(candidate)
+def select_review_candidates(
+    content_dir: Path,
+    limit: int,
+    per_section: Optional[int] = None,
+    content_types: Optional[list[str]] = None,
+    exclude_drafts: bool = True,
+    inventory: Optional["VaultInventory"] = None,
+    index: Optional["VaultIndex"] = None,
+    history: Optional["GitHistory"] = None,
+    centrality: Optional[dict[str, float]] = None,
+) -> tuple[list[ReviewCandidate], int]:
+    """
+    Pick the most urgent candidates in one pass, without sorting them all.
 
-    # Sort by score descending (highest urgency first)
-    candidates.sort(key=lambda c: -c.score)
-    return candidates
+    Only the best `limit` candidates (or `per_section` per section) are kept
+    in bounded heaps while scanning. The result is the same as slicing
+    get_review_candidates, ties included; with per_section set, it is the
+    same as taking that many from each section's ranking first.
+
+    Args:
+        content_dir: Root obsidian directory
+        limit: Maximum candidates to return
+        per_section: If set, at most this many candidates from any one section
+        content_types: Subdirs to scan (default: topics, concepts, tenets, arguments)
+        exclude_drafts: Skip draft content
+        inventory: Optional pre-scanned vault inventory to use instead of globbing
+        index: Optional refreshed vault index (see get_review_candidates)
+        history: Optional git history (see get_review_candidates)
+        centrality: Optional link centrality (see get_review_candidates)
+
+    Returns:
+        Tuple of (selected candidates by urgency, total candidates found)
+    """
+    keep = limit if per_section is None else min(limit, per_section)
+    # Min-heaps of (urgency, candidate): the root is the entry to evict
+    heaps: dict[str, list[tuple[_Urgency, ReviewCandidate]]] = {}
+    total = 0
+
+    if keep > 0:
+        for section, candidate in _iter_candidates(
+            content_dir, content_types, exclude_drafts, inventory, index, history, centrality
+        ):
+            heap = heaps.setdefault(section if per_section is not None else "", [])
+            entry = (_Urgency.of(candidate), candidate)
+            total += 1
+            if len(heap) < keep:
+                heapq.heappush(heap, entry)
+            elif heap[0][0] < entry[0]:
+                heapq.heapreplace(heap, entry)
+
+    kept = [entry for heap in heaps.values() for entry in heap]
+    kept.sort(key=lambda entry: entry[0], reverse=True)
+    return [candidate for _, candidate in kept[:limit]], total
 
 
 def get_top_candidate(
     content_dir: Path,
     exclude_drafts: bool = True,
+    index: Optional["VaultIndex"] = None,
+    history: Optional["GitHistory"] = None,
+    centrality: Optional[dict[str, float]] = None,
 ) -> Optional[ReviewCandidate]:
     """
     Get the single most urgent review candidate.
@@ -190,9 +433,19 @@ def get_top_candidate(
     Args:
         content_dir: Root obsidian directory
         exclude_drafts: Skip draft content
+        index: Optional refreshed vault index (see get_review_candidates)
+        history: Optional git history (see get_review_candidates)
+        centrality: Optional link centrality (see get_review_candidates)
 
     Returns:
         The highest-priority ReviewCandidate, or None if no candidates
     """
-    candidates = get_review_candidates(content_dir, exclude_drafts=exclude_drafts)
+    candidates, _ = select_review_candidates(
+        content_dir,
+        limit=1,
+        exclude_drafts=exclude_drafts,
+        index=index,
+        history=history,
+        centrality=centrality,
+    )
     return candidates[0] if candidates else None
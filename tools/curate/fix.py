@@ -0,0 +1,207 @@
+"""Frontmatter repair that leaves existing YAML untouched.
+
+Writing a note back through frontmatter.dumps re-serializes the whole
+header: keys get sorted, quoting and comments change, and the diff hides
+the actual fix. Fixes are planned as text instead. Missing fields are appended as new lines
+just before the closing delimiter, and everything else in the file is kept
+byte for byte. Planned fixes can be previewed as unified diffs, and are
+written through a temporary file and an atomic rename.
+"""
+
+import datetime as dt
+import difflib
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import yaml
+
+# Same delimiter rule as read_header (a line of 3+ dashes)
+_BOUNDARY_PATTERN = re.compile(r"-{3,}\s*")
+
+
+@dataclass
+class FrontmatterFix:
+    """A planned repair of one note."""
+
+    path: Path
+    original: str
+    fixed: str
+    added: list[str]  # Fields the fix adds
+
+    def diff(self) -> str:
+        """Unified diff from the original to the fixed text."""
+        return "".join(
+            difflib.unified_diff(
+                self.original.splitlines(keepends=True),
+                self.fixed.splitlines(keepends=True),
+                fromfile=str(self.path),
+                tofile=str(self.path),
+            )
+        )
+
+
+def _missing_fields(metadata: dict, content_path: Path, defaults: dict) -> dict:
+    """Values for the fields fix_frontmatter fills in, in the order it adds them."""
+    fields = {
+        "title": lambda: content_path.stem.replace("-", " ").title(),
+        "created": dt.date.today,
+        "ai_contribution": lambda: 0,  # Default to human
+        "concepts": list,
+        "related_articles": list,
+    }
+    return {
+        field: defaults[field] if field in defaults else default()
+        for field, default in fields.items()
+        if field not in metadata
+    }
+
+
+def plan_fix(content_path: Path, defaults: Optional[dict] = None) -> Optional[FrontmatterFix]:
+    """
+    Work out the repair a note needs, without writing anything.
+
+    Missing title, created, ai_contribution, concepts and related_articles
+    fields are added. A note without frontmatter gets a new block.
+
+    Args:
+        content_path: Path to markdown file
+        defaults: Values to use for missing fields instead of the built-in ones
+
+    Returns:
+        FrontmatterFix, or None if nothing is missing or the header cannot
+        be repaired safely (unparseable YAML, unclosed block, non-YAML header)
+    """
+    defaults = defaults or {}
+    try:
+        with open(content_path, encoding="utf-8", newline="") as f:
+            original = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    lines = original.splitlines(keepends=True)
+    newline = "\r\n" if original.count("\r\n") * 2 > original.count("\n") else "\n"
+
+    start = 0
+    while start < len(lines) and not lines[start].strip():
+        start += 1
+
+    if start < len(lines) and _BOUNDARY_PATTERN.fullmatch(lines[start].strip()):
+        end = next(
+            (
+                i
+                for i in range(start + 1, len(lines))
+                if _BOUNDARY_PATTERN.fullmatch(lines[i].rstrip("\r\n"))
+            ),
+            None,
+        )
+        if end is None:
+            return None
+        try:
+            metadata = yaml.safe_load("".join(lines[start + 1 : end]))
+        except yaml.YAMLError:
+            return None
+        if metadata is None:
+            metadata = {}
+        if not isinstance(metadata, dict):
+            return None
+    elif start < len(lines) and lines[start].startswith("+++"):
+        # TOML frontmatter: not ours to rewrite
+        return None
+    else:
+        metadata = {}
+        end = None
+
+    missing = _missing_fields(metadata, content_path, defaults)
+    if not missing:
+        return None
+
+    added = "".join(
+        yaml.safe_dump(
+            {field: value},
+            sort_keys=False,
+            allow_unicode=True,
+            default_flow_style=False,
+            width=1000,
+        ).replace("\n", newline)
+        for field, value in missing.items()
+    )
+
+    if end is None:
+        fixed = f"---{newline}{added}---{newline}{newline}{original}"
+    else:
+        fixed = "".join(lines[:end]) + added + "".join(lines[end:])
+
+    return FrontmatterFix(path=content_path, original=original, fixed=fixed, added=list(missing))
+
+
+def apply_fix(fix: FrontmatterFix) -> None:
+    """
+    Write a planned fix atomically (temporary file, then rename).
+
+    Args:
+        fix: Plan from plan_fix
+    """
+    path = fix.path
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(fix.fixed)
+        os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _fix_file(
+    content_path: Path,
+    defaults: Optional[dict],
+    dry_run: bool,
+) -> Optional[FrontmatterFix]:
+    """Plan (and unless dry_run, apply) one fix (runs in a worker process)."""
+    fix = plan_fix(content_path, defaults)
+    if fix is not None and not dry_run:
+        apply_fix(fix)
+    return fix
+
+
+def iter_fix_files(
+    md_files: Iterable[Path],
+    defaults: Optional[dict] = None,
+    dry_run: bool = False,
+    jobs: int = 1,
+) -> Iterator[FrontmatterFix]:
+    """
+    Repair every fixable file, yielding the fixes in input order.
+
+    Args:
+        md_files: Markdown files to repair
+        defaults: Values to use for missing fields
+        dry_run: Plan fixes without writing them
+        jobs: Number of worker processes (1 = fix serially)
+
+    Yields:
+        FrontmatterFix for each file that needed (or would need) a repair
+    """
+    sources = list(md_files)
+    fix_one = partial(_fix_file, defaults=defaults, dry_run=dry_run)
+    if jobs > 1 and len(sources) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(sources) // (jobs * 4))
+            for fix in pool.map(fix_one, sources, chunksize=chunksize):
+                if fix is not None:
+                    yield fix
+    else:
+        for source in sources:
+            fix = fix_one(source)
+            if fix is not None:
+                yield fix
@@ -0,0 +1,182 @@
+"""Last-commit oracle for vault files, built from a single git log pass.
+
+Frontmatter timestamps (modified, ai_modified, human_modified) are written
+by hand or by skills and drift. GitHistory records, for every file under a
+pathspec, the time and author of the last commit that touched it. A single
+streamed `git log --name-only` pass fills it in, and the result is cached
+per HEAD commit, so hundreds of lookups cost one git invocation at most.
+"""
+
+import json
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+# Bump when the on-disk cache layout changes
+CACHE_FORMAT = 1
+
+# Default cache location, relative to the repository root
+DEFAULT_GIT_HISTORY_PATH = Path(".cache") / "git-history.json"
+
+# Marks the header line of each commit in the log output
+_COMMIT_MARKER = "\x1e"
+
+
+@dataclass
+class FileCommit:
+    """Last commit that touched a file."""
+
+    commit: str
+    timestamp: int  # Committer time, seconds since the epoch
+    author_name: str
+    author_email: str
+
+    @property
+    def committed(self) -> datetime:
+        """Commit time as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+
+
+class GitHistory:
+    """Per-file last commit times and authors for one HEAD."""
+
+    def __init__(self, repo_root: Path, head: str, pathspec: str):
+        self.repo_root = repo_root
+        self._resolved_root = repo_root.resolve()
+        self.head = head
+        self.pathspec = pathspec  # Recorded directory, relative to repo_root
+        self.files: dict[str, FileCommit] = {}  # repo-relative POSIX path -> last commit
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path,
+        cache_path: Optional[Path] = None,
+    ) -> Optional["GitHistory"]:
+        """
+        Load history for HEAD, from the cache if it was built for this HEAD.
+
+        Args:
+            directory: Directory whose files are recorded (e.g. the vault)
+            cache_path: Cache file (relative paths are taken from the
+                repository root; None disables caching)
+
+        Returns:
+            GitHistory, or None if git is unavailable or this is not a repository
+        """
+        try:
+            root = Path(_git(directory, "rev-parse", "--show-toplevel"))
+            head = _git(directory, "rev-parse", "HEAD")
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        pathspec = directory.resolve().relative_to(root.resolve()).as_posix()
+        history = cls(root, head, pathspec)
+        if cache_path is not None and not cache_path.is_absolute():
+            cache_path = history.repo_root / cache_path
+
+        if cache_path is not None and history._load_cache(cache_path):
+            return history
+
+        try:
+            history._scan()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        if cache_path is not None:
+            history._save_cache(cache_path)
+        return history
+
+    def _scan(self) -> None:
+        """Fill in files from one streamed git log (newest commit first)."""
+        process = subprocess.Popen(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--name-only",
+                f"--format={_COMMIT_MARKER}%H%x1f%ct%x1f%an%x1f%ae",
+                "HEAD",
+                "--",
+                self.pathspec,
+            ],
+            cwd=self.repo_root,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        assert process.stdout is not None
+
+        current: Optional[FileCommit] = None
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            if line.startswith(_COMMIT_MARKER):
+                commit, timestamp, name, email = line[1:].split("\x1f")
+                current = FileCommit(commit, int(timestamp), name, email)
+            elif line and current is not None:
+                # The newest commit that names a file is its last change
+                self.files.setdefault(line, current)
+
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, "git log")
+
+    def _load_cache(self, cache_path: Path) -> bool:
+        """Use the cache if it was written for this HEAD and pathspec."""
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        if (
+            data.get("format") != CACHE_FORMAT
+            or data.get("head") != self.head
+            or data.get("pathspec") != self.pathspec
+        ):
+            return False
+
+        self.files = {path: FileCommit(**entry) for path, entry in data["files"].items()}
+        return True
+
+    def _save_cache(self, cache_path: Path) -> None:
+        """Write the history, keyed by HEAD."""
+        data = {
+            "format": CACHE_FORMAT,
+            "head": self.head,
+            "pathspec": self.pathspec,
+            "files": {path: asdict(entry) for path, entry in self.files.items()},
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+    def get(self, path: Union[str, Path]) -> Optional[FileCommit]:
+        """
+        Last commit that touched a file.
+
+        Args:
+            path: File path (absolute, or relative to the working directory)
+
+        Returns:
+            FileCommit, or None if the file has never been committed
+        """
+        try:
+            key = Path(path).resolve().relative_to(self._resolved_root).as_posix()
+        except ValueError:
+            return None
+        return self.files.get(key)
+
+    def last_modified(self, path: Union[str, Path]) -> Optional[datetime]:
+        """Time of the last commit that touched a file, or None."""
+        entry = self.get(path)
+        return entry.committed if entry else None
+
+
+def _git(cwd: Path, *args: str) -> str:
+    """Run a git command and return its stripped output."""
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
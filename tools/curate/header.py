@@ -0,0 +1,112 @@
+"""Frontmatter-only reader for tools that just need a note's metadata.
+
+frontmatter.load reads and keeps the whole article to hand back a Post.
+read_header stops at the closing --- delimiter and parses only the YAML
+block; whether the body is empty is probed lazily, reading only as far as
+the first non-whitespace character.
+"""
+
+import codecs
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+import frontmatter
+import yaml
+
+# Same delimiter rule python-frontmatter uses for YAML (a line of 3+ dashes)
+_BOUNDARY_PATTERN = re.compile(rb"-{3,}\s*")
+
+# Body bytes read per step when probing for content
+_PROBE_CHUNK = 4096
+
+
+@dataclass
+class NoteHeader:
+    """Parsed frontmatter of a note, with lazy access to its body."""
+
+    path: Path
+    metadata: dict
+    body_offset: int  # Byte offset of the body in the file (unused if _body is set)
+    _body: Optional[str] = None  # Body already read, for notes parsed in full
+
+    def get(self, key: str, default: object = None) -> object:
+        """Metadata lookup, like frontmatter.Post.get."""
+        return self.metadata.get(key, default)
+
+    @cached_property
+    def body_is_empty(self) -> bool:
+        """True if the body holds only whitespace (reads as little as possible)."""
+        if self._body is not None:
+            return not self._body.strip()
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with open(self.path, "rb") as f:
+            f.seek(self.body_offset)
+            while True:
+                chunk = f.read(_PROBE_CHUNK)
+                if not chunk:
+                    return not decoder.decode(b"", final=True).strip()
+                if decoder.decode(chunk).strip():
+                    return False
+
+    def read_body(self) -> str:
+        """The note's body, stripped as frontmatter.load would."""
+        if self._body is not None:
+            return self._body
+        with open(self.path, "rb") as f:
+            f.seek(self.body_offset)
+            return f.read().decode("utf-8").strip()
+
+
+def read_header(path: Path) -> NoteHeader:
+    """
+    Read only a note's YAML frontmatter.
+
+    Metadata matches what frontmatter.load would produce. Files whose
+    header is not YAML between --- lines (or is never closed) fall back to
+    a full frontmatter.load, so the result is the same either way.
+
+    Args:
+        path: Path to markdown file
+
+    Returns:
+        NoteHeader with the parsed metadata
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the frontmatter is not valid YAML
+    """
+    header_lines: list[bytes] = []
+    with open(path, "rb") as f:
+        # python-frontmatter strips leading whitespace before detection
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+
+        if not _BOUNDARY_PATTERN.fullmatch(line.lstrip()):
+            return _read_full(path)
+
+        while True:
+            line = f.readline()
+            if not line:
+                # No closing delimiter
+                return _read_full(path)
+            if _BOUNDARY_PATTERN.fullmatch(line):
+                break
+            header_lines.append(line)
+
+        body_offset = f.tell()
+
+    metadata = yaml.load(b"".join(header_lines).decode("utf-8"), Loader=yaml.SafeLoader)
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return NoteHeader(path=path, metadata=metadata, body_offset=body_offset)
+
+
+def _read_full(path: Path) -> NoteHeader:
+    """Fall back to python-frontmatter for anything unusual."""
+    post = frontmatter.load(path)
+    return NoteHeader(path=path, metadata=post.metadata, body_offset=0, _body=post.content)
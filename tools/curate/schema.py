@@ -0,0 +1,247 @@
+"""Declarative frontmatter schemas, compiled into flat lists of checks.
+
+Each section maps frontmatter fields to a FieldSpec saying whether the
+field is required or recommended and what shape its value must have.
+compile_schema turns a schema into a tuple of small closures, one per rule,
+each bound to its field name, message and severity up front. Validating a
+note is then a single pass over that tuple with one dict lookup per rule.
+Adding a rule adds one closure, not another walk over the metadata.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+ERROR = "error"
+WARNING = "warning"
+
+# A whole wikilink, as written in frontmatter lists ("[[target]]" or "[[target|alias]]")
+_WIKILINK_PATTERN = re.compile(r"\[\[[^\[\]]+\]\]")
+
+# A compiled rule: inspects metadata and appends any issues it finds
+Check = Callable[[dict, list[dict]], None]
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Rules for one frontmatter field."""
+
+    required: bool = False
+    recommended: bool = False  # Only reported in strict mode
+    kind: Optional[str] = None  # "percentage", "timestamp" or "wikilinks"
+    severity: str = WARNING  # Severity of a value of the wrong kind
+
+
+# Checked for every note. Order matters: it is the order issues are reported in.
+BASE_SCHEMA: dict[str, FieldSpec] = {
+    "title": FieldSpec(required=True),
+    "ai_contribution": FieldSpec(kind="percentage", severity=ERROR),
+    "human_modified": FieldSpec(kind="timestamp"),
+    "ai_modified": FieldSpec(kind="timestamp"),
+    "ai_generated_date": FieldSpec(kind="timestamp"),
+    "last_curated": FieldSpec(kind="timestamp"),
+    "last_deep_review": FieldSpec(kind="timestamp"),
+    "created": FieldSpec(recommended=True),
+    "concepts": FieldSpec(recommended=True),
+}
+
+# Published articles: cross-reference lists are rendered, so must be wikilinks
+CONTENT_SCHEMA: dict[str, FieldSpec] = {
+    **BASE_SCHEMA,
+    "concepts": FieldSpec(recommended=True, kind="wikilinks"),
+    "topics": FieldSpec(kind="wikilinks"),
+    "related_articles": FieldSpec(kind="wikilinks"),
+}
+
+# Internal notes (research, review and workflow logs) need not name concepts
+NOTES_SCHEMA: dict[str, FieldSpec] = {
+    **BASE_SCHEMA,
+    "concepts": replace(BASE_SCHEMA["concepts"], recommended=False),
+}
+
+SECTION_SCHEMAS: dict[str, dict[str, FieldSpec]] = {
+    "topics": CONTENT_SCHEMA,
+    "concepts": CONTENT_SCHEMA,
+    "arguments": CONTENT_SCHEMA,
+    "questions": CONTENT_SCHEMA,
+    "voids": CONTENT_SCHEMA,
+    "tenets": CONTENT_SCHEMA,
+    "apex": CONTENT_SCHEMA,
+    "project": CONTENT_SCHEMA,
+    "research": NOTES_SCHEMA,
+    "reviews": NOTES_SCHEMA,
+    "workflow": NOTES_SCHEMA,
+}
+
+
+def issue(field: str, severity: str, message: str) -> dict:
+    """A single validation finding."""
+    return {"field": field, "severity": severity, "message": message}
+
+
+# Hugo site configuration files (their directory's content/ is a content root)
+_HUGO_CONFIG_NAMES = ("hugo.toml", "hugo.yaml", "config.toml", "config.yaml")
+
+
+@lru_cache(maxsize=None)
+def content_root(directory: Path) -> Optional[Path]:
+    """Nearest enclosing vault root (has .obsidian/) or Hugo content directory."""
+    directory = directory.absolute()
+    for candidate in (directory, *directory.parents):
+        if (candidate / ".obsidian").is_dir():
+            return candidate
+        if candidate.name == "content" and any(
+            (candidate.parent / name).is_file() for name in _HUGO_CONFIG_NAMES
+        ):
+            return candidate
+    return None
+
+
+def section_for(content_path: Path, root: Optional[Path] = None) -> Optional[str]:
+    """
+    Section whose schema applies to a file.
+
+    Only the first directory below the vault or content root counts, so a
+    file elsewhere does not pick up a schema from an unrelated ancestor.
+
+    Args:
+        content_path: Note path, in the vault or the Hugo content directory
+        root: Vault or content root (default: found from the path)
+
+    Returns:
+        Section name, or None if the file is not inside a section with a schema
+    """
+    content_path = content_path.absolute()
+    if root is None:
+        root = content_root(content_path.parent)
+        if root is None:
+            return None
+    try:
+        parts = content_path.relative_to(root.absolute()).parts
+    except ValueError:
+        return None
+    if len(parts) < 2 or parts[0] not in SECTION_SCHEMAS:
+        return None
+    return parts[0]
+
+
+@lru_cache(maxsize=None)
+def compile_schema(section: Optional[str], strict: bool = False) -> tuple[Check, ...]:
+    """
+    Compile a section's schema into checks, in reporting order.
+
+    Required fields come first, then value checks, then (strict only)
+    recommended fields.
+
+    Args:
+        section: Section name (None or unknown sections use BASE_SCHEMA)
+        strict: Include checks for recommended fields
+
+    Returns:
+        Tuple of checks to run in order
+    """
+    schema = SECTION_SCHEMAS.get(section, BASE_SCHEMA) if section is not None else BASE_SCHEMA
+    checks: list[Check] = []
+
+    for field, spec in schema.items():
+        if spec.required:
+            checks.append(_required(field, ERROR, f"Missing required field: {field}"))
+
+    for field, spec in schema.items():
+        if spec.kind is not None:
+            checks.append(_VALUE_CHECKS[spec.kind](field, spec.severity))
+
+    if strict:
+        for field, spec in schema.items():
+            if spec.recommended:
+                checks.append(_required(field, WARNING, f"Missing recommended field: {field}"))
+
+    return tuple(checks)
+
+
+def _required(field: str, severity: str, message: str) -> Check:
+    def check(metadata: dict, issues: list[dict]) -> None:
+        if field not in metadata:
+            issues.append(issue(field, severity, message))
+
+    return check
+
+
+def _percentage(field: str, severity: str) -> Check:
+    """Number from 0 to 100, plus the authorship attribution it implies."""
+
+    def check(metadata: dict, issues: list[dict]) -> None:
+        value = metadata.get(field)
+        if value is None:
+            return
+        if not isinstance(value, (int, float)):
+            issues.append(issue(field, severity, f"{field} must be a number"))
+        elif not (0 <= value <= 100):
+            issues.append(issue(field, severity, f"{field} must be between 0 and 100"))
+        elif int(value) == 100:
+            if not metadata.get("ai_system"):
+                issues.append(
+                    issue(
+                        "ai_system",
+                        WARNING,
+                        f"AI-authored content ({field}=100) should specify ai_system",
+                    )
+                )
+        elif int(value) == 0:
+            if not metadata.get("author"):
+                issues.append(
+                    issue("author", WARNING, "Human-authored content should specify author")
+                )
+
+    return check
+
+
+def _timestamp(field: str, severity: str) -> Check:
+    """ISO 8601 date or datetime (YAML often parses these already)."""
+
+    def check(metadata: dict, issues: list[dict]) -> None:
+        value = metadata.get(field)
+        if not value or isinstance(value, (datetime, date)):
+            return
+        try:
+            datetime.fromisoformat(str(value))
+        except (ValueError, TypeError):
+            issues.append(
+                issue(field, severity, f"Invalid timestamp format for {field}: {value}")
+            )
+
+    return check
+
+
+def _wikilinks(field: str, severity: str) -> Check:
+    """List whose items are each a single [[wikilink]]."""
+    fullmatch = _WIKILINK_PATTERN.fullmatch
+
+    def check(metadata: dict, issues: list[dict]) -> None:
+        value = metadata.get(field)
+        if value is None:
+            return
+        if not isinstance(value, list):
+            issues.append(issue(field, severity, f"{field} must be a list of wikilinks"))
+            return
+        for position, item in enumerate(value):
+            if not isinstance(item, str) or not fullmatch(item):
+                issues.append(
+                    issue(
+                        f"{field}[{position}]",
+                        severity,
+                        f"{field} entries must be wikilinks like [[name]]: {item!r}",
+                    )
+                )
+
+    return check
+
+
+_VALUE_CHECKS: dict[str, Callable[[str, str], Check]] = {
+    "percentage": _percentage,
+    "timestamp": _timestamp,
+    "wikilinks": _wikilinks,
+}
@@ -1,27 +1,22 @@
 """Frontmatter validation for content files."""
 
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 import frontmatter
 
+from .fix import apply_fix, plan_fix
+from .header import NoteHeader, read_header
+from .schema import ERROR, WARNING, compile_schema, content_root, issue, section_for
+from .validation_cache import ValidationCache
 
-def _is_valid_timestamp(value: Union[str, datetime, None]) -> bool:
-    """Check if a value is a valid ISO timestamp."""
-    if value is None:
-        return True
-    if isinstance(value, datetime):
-        return True
-    try:
-        datetime.fromisoformat(str(value))
-        return True
-    except (ValueError, TypeError):
-        return False
+if TYPE_CHECKING:
+    from tools.sync.inventory import VaultInventory
 
 
-# Required frontmatter fields
-REQUIRED_FIELDS = ["title"]
+# Bump whenever the validation rules change (invalidates cached results)
+VALIDATOR_VERSION = 3
 
 
 def get_authorship_type(ai_contribution: int) -> str:
@@ -37,96 +32,257 @@ def get_authorship_type(ai_contribution: int) -> str:
 def validate_frontmatter(
     content_path: Path,
     strict: bool = False,
+    root: Optional[Path] = None,
 ) -> dict:
     """
     Validate frontmatter in a markdown file.
 
+    Only the frontmatter block is parsed; the body is read just far enough
+    to tell whether it is empty.
+
     Args:
         content_path: Path to markdown file
         strict: If True, require all optional fields too
+        root: Vault or content root the file's section is taken from
+            (default: found from the path, see section_for)
 
     Returns:
         Dict with validation results
     """
-    result = {
-        "valid": True,
-        "errors": [],
-        "warnings": [],
+    try:
+        header = read_header(content_path)
+    except Exception as e:
+        message = f"Failed to parse frontmatter: {e}"
+        return {
+            "valid": False,
+            "errors": [message],
+            "warnings": [],
+            "issues": [issue("frontmatter", ERROR, message)],
+            "path": str(content_path),
+        }
+
+    return validate_header(header, strict=strict, root=root)
+
+
+def validate_header(
+    header: NoteHeader,
+    strict: bool = False,
+    root: Optional[Path] = None,
+) -> dict:
+    """
+    Validate a note header from read_header.
+
+    Args:
+        header: Parsed note header
+        strict: If True, require all optional fields too
+        root: Vault or content root (see validate_frontmatter)
+
+    Returns:
+        Dict with validation results, as from validate_frontmatter
+    """
+    return _validate_metadata(header.metadata, header.body_is_empty, header.path, strict, root)
+
+
+def validate_post(
+    post: frontmatter.Post,
+    content_path: Path,
+    strict: bool = False,
+    root: Optional[Path] = None,
+) -> dict:
+    """
+    Validate an already-parsed post (e.g. one sync is about to write).
+
+    Args:
+        post: Parsed frontmatter post
+        content_path: Path reported in the result
+        strict: If True, require all optional fields too
+        root: Vault or content root (see validate_frontmatter)
+
+    Returns:
+        Dict with validation results, as from validate_frontmatter
+    """
+    return _validate_metadata(
+        post.metadata, not post.content.strip(), content_path, strict, root
+    )
+
+
+def _validate_metadata(
+    metadata: dict,
+    body_is_empty: bool,
+    content_path: Path,
+    strict: bool,
+    root: Optional[Path] = None,
+) -> dict:
+    """Run the compiled schema for the note's section against parsed metadata."""
+    issues: list[dict] = []
+    for check in compile_schema(section_for(content_path, root), strict):
+        check(metadata, issues)
+
+    # Check content
+    if body_is_empty:
+        issues.append(issue("content", WARNING, "Content is empty"))
+
+    errors = [found["message"] for found in issues if found["severity"] == ERROR]
+    return {
+        "valid": not errors,
+        "errors": errors,
+        "warnings": [found["message"] for found in issues if found["severity"] != ERROR],
+        "issues": issues,
         "path": str(content_path),
     }
 
-    try:
-        post = frontmatter.load(content_path)
-    except Exception as e:
-        result["valid"] = False
-        result["errors"].append(f"Failed to parse frontmatter: {e}")
+
+def _iter_content_files(
+    content_dir: Path,
+    inventory: Optional["VaultInventory"] = None,
+) -> Iterator[Path]:
+    """Yield the markdown files under content_dir, lazily."""
+    if inventory is not None:
+        for entry in inventory.select(exclude_drafts=False):
+            if entry.path.is_relative_to(content_dir):
+                yield entry.path
+    else:
+        yield from content_dir.rglob("*.md")
+
+
+def iter_validate_files(
+    md_files: Iterable[Path],
+    strict: bool = False,
+    jobs: int = 1,
+    cache: Optional[ValidationCache] = None,
+    root: Optional[Path] = None,
+) -> Iterator[dict]:
+    """
+    Validate markdown files, yielding results as they finish.
+
+    With jobs > 1 files are validated in a process pool. At most a few
+    files per worker are in flight at once, so memory stays flat however
+    many files there are; results arrive in completion order.
+
+    Args:
+        md_files: Files to validate (may be a lazy iterator)
+        strict: If True, require all optional fields
+        jobs: Number of worker processes (1 = validate serially)
+        cache: If given, reuse results for unchanged files and record
+            fresh ones (the caller saves it)
+        root: Vault or content root (see validate_frontmatter)
+
+    Yields:
+        Per-file result dicts, as returned by validate_frontmatter
+    """
+
+    def lookup(md_file: Path) -> tuple[Optional[str], Optional[dict]]:
+        if cache is None:
+            return None, None
+        key = cache.key_for(md_file, strict, section_for(md_file, root))
+        return key, cache.get(key, md_file) if key is not None else None
+
+    def store(key: Optional[str], result: dict) -> dict:
+        if cache is not None and key is not None:
+            cache.put(key, result)
         return result
 
-    metadata = post.metadata
-
-    # Check required fields
-    for field in REQUIRED_FIELDS:
-        if field not in metadata:
-            result["valid"] = False
-            result["errors"].append(f"Missing required field: {field}")
-
-    # Validate ai_contribution if present
-    ai_contribution = metadata.get("ai_contribution")
-    if ai_contribution is not None:
-        if not isinstance(ai_contribution, (int, float)):
-            result["errors"].append("ai_contribution must be a number")
-            result["valid"] = False
-        elif not (0 <= ai_contribution <= 100):
-            result["errors"].append("ai_contribution must be between 0 and 100")
-            result["valid"] = False
-        else:
-            # Derive type and validate consistency
-            authorship_type = get_authorship_type(int(ai_contribution))
-
-            if authorship_type == "ai":
-                if not metadata.get("ai_system"):
-                    result["warnings"].append(
-                        "AI-authored content (ai_contribution=100) should specify ai_system"
-                    )
-
-            elif authorship_type == "human":
-                if not metadata.get("author"):
-                    result["warnings"].append(
-                        "Human-authored content should specify author"
-                    )
-
-    # Validate timestamp fields if present
-    for field in ["human_modified", "ai_modified", "ai_generated_date", "last_curated", "last_deep_review"]:
-        if field in metadata and metadata[field]:
-            if not _is_valid_timestamp(metadata[field]):
-                result["warnings"].append(
-                    f"Invalid timestamp format for {field}: {metadata[field]}"
-                )
-
-    # Check optional but recommended fields
-    if strict:
-        if "created" not in metadata:
-            result["warnings"].append("Missing recommended field: created")
-        if "concepts" not in metadata:
-            result["warnings"].append("Missing recommended field: concepts")
+    if jobs <= 1:
+        for md_file in md_files:
+            key, cached = lookup(md_file)
+            if cached is not None:
+                yield cached
+            else:
+                yield store(key, validate_frontmatter(md_file, strict=strict, root=root))
+        return
+
+    window = jobs * 4
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: dict = {}
+        for md_file in md_files:
+            key, cached = lookup(md_file)
+            if cached is not None:
+                yield cached
+                continue
+            pending[pool.submit(validate_frontmatter, md_file, strict, root)] = key
+            if len(pending) >= window:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield store(pending.pop(future), future.result())
+        for future in as_completed(list(pending)):
+            yield store(pending.pop(future), future.result())
+
+
+def iter_validate_directory(
+    content_dir: Path,
+    strict: bool = False,
+    inventory: Optional["VaultInventory"] = None,
+    jobs: int = 1,
+    cache_path: Optional[Path] = None,
+) -> Iterator[dict]:
+    """
+    Validate all markdown files in a directory, yielding results as they finish.
 
-    # Check content
-    if not post.content.strip():
-        result["warnings"].append("Content is empty")
+    Args:
+        content_dir: Directory to validate
+        strict: If True, require all optional fields
+        inventory: Optional pre-scanned vault inventory; its notes under
+            content_dir are validated instead of walking the directory
+        jobs: Number of worker processes (1 = validate serially)
+        cache_path: If given, reuse results for unchanged files from this
+            validation cache and record fresh ones in it
+
+    Yields:
+        Per-file result dicts, as returned by validate_frontmatter
+    """
+    cache = ValidationCache.load(cache_path, VALIDATOR_VERSION) if cache_path else None
+    md_files = _iter_content_files(content_dir, inventory)
+    # Sections are named relative to the vault or content root
+    root = content_root(content_dir) or content_dir
+
+    try:
+        yield from iter_validate_files(
+            md_files, strict=strict, jobs=jobs, cache=cache, root=root
+        )
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def tally_result(totals: dict, result: dict) -> None:
+    """
+    Add one file's validation result to running totals.
+
+    Args:
+        totals: Dict with total, valid, invalid and warnings counts
+        result: Per-file result from validate_frontmatter
+    """
+    totals["total"] += 1
+
+    if result["valid"]:
+        totals["valid"] += 1
+    else:
+        totals["invalid"] += 1
 
-    return result
+    if result["warnings"]:
+        totals["warnings"] += len(result["warnings"])
 
 
 def validate_directory(
     content_dir: Path,
     strict: bool = False,
+    inventory: Optional["VaultInventory"] = None,
+    jobs: int = 1,
+    cache_path: Optional[Path] = None,
 ) -> dict:
     """
     Validate all markdown files in a directory.
 
+    Collects every per-file result; use iter_validate_directory() with
+    tally_result() to stream results instead.
+
     Args:
         content_dir: Directory to validate
         strict: If True, require all optional fields
+        inventory: Optional pre-scanned vault inventory; its notes under
+            content_dir are validated instead of walking the directory
+        jobs: Number of worker processes (1 = validate serially)
+        cache_path: Optional validation cache (see iter_validate_directory)
 
     Returns:
         Dict with summary and per-file results
@@ -139,18 +295,8 @@ def validate_directory(
         "files": [],
     }
 
-    for md_file in content_dir.rglob("*.md"):
-        result = validate_frontmatter(md_file, strict=strict)
-        results["total"] += 1
-
-        if result["valid"]:
-            results["valid"] += 1
-        else:
-            results["invalid"] += 1
-
-        if result["warnings"]:
-            results["warnings"] += len(result["warnings"])
-
+    for result in iter_validate_directory(content_dir, strict, inventory, jobs, cache_path):
+        tally_result(results, result)
         results["files"].append(result)
 
     return results
@@ -163,6 +309,9 @@ def fix_frontmatter(
     """
     Attempt to fix common frontmatter issues.
 
+    Missing fields are added without re-serializing the rest of the header
+    (see tools.curate.fix).
+
     Args:
         content_path: Path to markdown file
         defaults: Default values to use for missing fields
@@ -170,47 +319,8 @@ def fix_frontmatter(
     Returns:
         True if file was modified
     """
-    import datetime as dt
-
-    defaults = defaults or {}
-
-    try:
-        post = frontmatter.load(content_path)
-    except Exception:
+    fix = plan_fix(content_path, defaults)
+    if fix is None:
         return False
-
-    modified = False
-
-    # Add missing title
-    if "title" not in post.metadata:
-        post.metadata["title"] = defaults.get(
-            "title", content_path.stem.replace("-", " ").title()
-        )
-        modified = True
-
-    # Add missing created date
-    if "created" not in post.metadata:
-        post.metadata["created"] = defaults.get(
-            "created", dt.date.today().isoformat()
-        )
-        modified = True
-
-    # Add missing ai_contribution (default to human)
-    if "ai_contribution" not in post.metadata:
-        post.metadata["ai_contribution"] = defaults.get("ai_contribution", 0)
-        modified = True
-
-    # Add missing concepts
-    if "concepts" not in post.metadata:
-        post.metadata["concepts"] = defaults.get("concepts", [])
-        modified = True
-
-    # Add missing related_articles
-    if "related_articles" not in post.metadata:
-        post.metadata["related_articles"] = defaults.get("related_articles", [])
-        modified = True
-
-    if modified:
-        content_path.write_text(frontmatter.dumps(post), encoding="utf-8")
-
-    return modified
+    apply_fix(fix)
+    return True
@@ -0,0 +1,210 @@
+"""Native validate-all: deterministic vault health checks.
+
+Runs the checks the /validate-all skill used to perform by hand (frontmatter,
+empty content, timestamp formats, broken wikilinks and orphaned notes) over
+the whole vault in parallel, writes a JSON report and records the run in
+evolution-state.yaml so the evolve loop does not schedule the skill.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from tools.evolution.state import TaskRecord, load_state, save_state
+from tools.sync.converter import SYNC_DIRS, build_content_index
+from tools.sync.inventory import VaultInventory
+from tools.sync.transform import transform_markdown
+from tools.sync.wikilinks import resolve_link
+
+from .header import read_header
+from .validate import validate_frontmatter, validate_header
+
+# Default report location, relative to the repository root
+DEFAULT_REPORT_PATH = Path(".cache") / "validate-all.json"
+
+DEFAULT_STATE_PATH = Path("obsidian") / "workflow" / "evolution-state.yaml"
+
+# Name of the maintenance task in evolution-state.yaml
+TASK_NAME = "validate-all"
+
+# Internal notes that are not expected to be linked from anywhere
+ORPHAN_EXEMPT_SECTIONS = ("research", "reviews", "workflow")
+
+
+@dataclass
+class ValidateAllReport:
+    """Outcome of a validate-all run."""
+
+    generated: str
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    warnings: int = 0
+    empty: int = 0
+    files: list[dict] = field(default_factory=list)  # Files with errors or warnings
+    broken_links: list[dict] = field(default_factory=list)
+    orphans: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if no file is invalid and no link is broken."""
+        return self.invalid == 0 and not self.broken_links
+
+    @property
+    def issues(self) -> int:
+        """Total number of problems found."""
+        return self.invalid + self.warnings + len(self.broken_links) + len(self.orphans)
+
+    def to_dict(self) -> dict:
+        """Serializable form, as written to the report file."""
+        return {**asdict(self), "ok": self.ok, "issues": self.issues}
+
+
+def _check_note(
+    source_path: Path,
+    strict: bool = False,
+) -> tuple[dict, list[tuple[str, Optional[str]]]]:
+    """
+    Validate one note (runs in a worker process).
+
+    Returns:
+        Tuple of (frontmatter result, wikilinks as (target, heading))
+    """
+    try:
+        header = read_header(source_path)
+    except Exception:
+        # validate_frontmatter reports the parse error
+        return validate_frontmatter(source_path, strict=strict), []
+
+    result = validate_header(header, strict=strict)
+    wikilinks: list[tuple[str, Optional[str]]] = []
+    # Same tokenizer as sync, so links written as code are not reported
+    transform_markdown(
+        header.read_body(), link_resolver=lambda target: "", collect_links=wikilinks
+    )
+    return result, wikilinks
+
+
+def run_validate_all(
+    obsidian_path: Path,
+    strict: bool = False,
+    jobs: int = 1,
+    inventory: Optional[VaultInventory] = None,
+) -> ValidateAllReport:
+    """
+    Run every deterministic check over the vault.
+
+    Drafts are validated too, but links from drafts do not count as
+    inbound links and links to drafts are reported as broken, since
+    neither is published. Notes in ORPHAN_EXEMPT_SECTIONS are never
+    reported as orphans.
+
+    Args:
+        obsidian_path: Path to Obsidian vault root
+        strict: If True, require all recommended frontmatter fields
+        jobs: Number of worker processes (1 = validate serially)
+        inventory: Pre-scanned vault inventory (scanned here if omitted)
+
+    Returns:
+        ValidateAllReport with counts and every problem found
+    """
+    if inventory is None:
+        inventory = VaultInventory.scan(obsidian_path, SYNC_DIRS)
+
+    content_index = build_content_index(obsidian_path, SYNC_DIRS, inventory=inventory)
+    published = {entry.path for entry in inventory.select(exclude_drafts=True)}
+    known_urls = {entry.url for entry in inventory.select(exclude_drafts=True)}
+
+    entries = list(inventory.select(exclude_drafts=False))
+    check = partial(_check_note, strict=strict)
+    sources = [entry.path for entry in entries]
+    if jobs > 1 and len(sources) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(sources) // (jobs * 4))
+            outcomes = list(pool.map(check, sources, chunksize=chunksize))
+    else:
+        outcomes = [check(source) for source in sources]
+
+    report = ValidateAllReport(generated=datetime.now(timezone.utc).isoformat())
+    linked_urls: set[str] = set()
+
+    for entry, (result, wikilinks) in zip(entries, outcomes):
+        source = str(entry.path.relative_to(obsidian_path.parent))
+        result["path"] = source
+
+        report.total += 1
+        if result["valid"]:
+            report.valid += 1
+        else:
+            report.invalid += 1
+        report.warnings += len(result["warnings"])
+        if "Content is empty" in result["warnings"]:
+            report.empty += 1
+        if result["errors"] or result["warnings"]:
+            report.files.append(result)
+
+        for target, heading in wikilinks:
+            if not target:
+                # [[#Heading]] points into the note itself
+                continue
+            url = resolve_link(target, content_index)
+            if url not in known_urls:
+                report.broken_links.append(
+                    {"source": source, "target": target, "anchor": heading, "url": url}
+                )
+            elif entry.path in published and url != entry.url:
+                linked_urls.add(url)
+
+    for entry in inventory.select(exclude_drafts=True, archived=False):
+        if entry.section in ORPHAN_EXEMPT_SECTIONS:
+            continue
+        # "/" and "/section/" are landing pages
+        if entry.url.count("/") > 2 and entry.url not in linked_urls:
+            report.orphans.append(str(entry.path.relative_to(obsidian_path.parent)))
+
+    return report
+
+
+def write_report(report: ValidateAllReport, path: Path = DEFAULT_REPORT_PATH) -> None:
+    """Write the report as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+def record_validate_all(
+    report: ValidateAllReport,
+    state_path: Path = DEFAULT_STATE_PATH,
+    now: Optional[datetime] = None,
+) -> None:
+    """
+    Record a validate-all run in evolution-state.yaml.
+
+    Updates last_runs['validate-all'], the orphaned file count and the
+    recent task log. Review-derived issue counts are left alone.
+
+    Args:
+        report: Result of run_validate_all
+        state_path: Path to evolution-state.yaml
+        now: Time of the run (defaults to now)
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    state = load_state(state_path)
+    state.last_runs[TASK_NAME] = now
+    state.last_updated = now
+    state.quality.orphaned_files = len(report.orphans)
+    state.recent_tasks.append(
+        TaskRecord(
+            task=f"{TASK_NAME} (native)",
+            task_type=TASK_NAME,
+            date=now.date().isoformat(),
+            outcome="success" if report.ok else "partial",
+            issues_found=report.issues,
+        )
+    )
+    save_state(state, state_path)
@@ -0,0 +1,176 @@
+"""Persisted cache of frontmatter validation results.
+
+Results are keyed by the file's content hash, its schema section, the
+strict flag and the validator version, so an unchanged file is never parsed twice and any change
+to the validation rules invalidates every entry. A stat index (path ->
+mtime, size, hash) lets unchanged files skip even the hashing step.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from tools.sync.manifest import hash_file
+
+# Bump when the on-disk cache layout changes
+CACHE_FORMAT = 1
+
+# Default cache location, relative to the repository root
+DEFAULT_VALIDATION_CACHE_PATH = Path(".cache") / "validation-cache.json"
+
+# Least recently used entries beyond this are dropped on save
+MAX_ENTRIES = 20000
+
+
+class ValidationCache:
+    """Content-addressed validate_frontmatter results persisted as JSON."""
+
+    def __init__(self, path: Path, validator_version: int):
+        self.path = path
+        self.validator_version = validator_version
+        self.results: dict[str, dict] = {}  # key -> result without "path"
+        self.stats: dict[str, list] = {}  # source path -> [mtime_ns, size, hash]
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path, validator_version: int) -> "ValidationCache":
+        """
+        Load a cache, starting empty if it is missing, unreadable or was
+        written by a different validator version.
+
+        Args:
+            path: Path to the cache file
+            validator_version: Current validator version
+
+        Returns:
+            ValidationCache (possibly empty)
+        """
+        cache = cls(path, validator_version)
+        if not path.exists():
+            return cache
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+
+        if data.get("format") != CACHE_FORMAT or data.get("validator") != validator_version:
+            return cache
+
+        cache.results = data.get("results", {})
+        cache.stats = data.get("stats", {})
+        return cache
+
+    def save(self) -> None:
+        """Write the cache to disk, keeping the most recently used entries."""
+        results = dict(list(self.results.items())[-MAX_ENTRIES:])
+        stats = dict(list(self.stats.items())[-MAX_ENTRIES:])
+        data = {
+            "format": CACHE_FORMAT,
+            "validator": self.validator_version,
+            "results": results,
+            "stats": stats,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    def key_for(
+        self,
+        source_path: Path,
+        strict: bool,
+        section: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Cache key for a file's current content.
+
+        Args:
+            source_path: Markdown file to be validated
+            strict: Whether strict validation is requested
+            section: Schema section the file is validated against (see section_for)
+
+        Returns:
+            Key string, or None if the file cannot be read
+        """
+        try:
+            stat = source_path.stat()
+        except OSError:
+            return None
+
+        name = str(source_path)
+        known = self.stats.pop(name, None)
+        if known is not None and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            content_hash = known[2]
+        else:
+            try:
+                content_hash = hash_file(source_path)
+            except OSError:
+                return None
+        self.stats[name] = [stat.st_mtime_ns, stat.st_size, content_hash]
+
+        return f"{content_hash}:{int(strict)}:{section or ''}"
+
+    def key_for_bytes(
+        self,
+        source_path: Path,
+        data: bytes,
+        strict: bool,
+        section: Optional[str] = None,
+    ) -> str:
+        """
+        Cache key for content that was just written to source_path.
+
+        Lets a writer (sync) record results without reading the file back.
+
+        Args:
+            source_path: File holding exactly these bytes
+            data: The file's content
+            strict: Whether strict validation is requested
+            section: Schema section the file is validated against (see section_for)
+
+        Returns:
+            Key string
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+        self.stats.pop(str(source_path), None)
+        try:
+            stat = source_path.stat()
+        except OSError:
+            pass
+        else:
+            self.stats[str(source_path)] = [stat.st_mtime_ns, stat.st_size, content_hash]
+
+        return f"{content_hash}:{int(strict)}:{section or ''}"
+
+    def get(self, key: str, source_path: Path) -> Optional[dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from key_for()
+            source_path: File the result is for (fills in "path")
+
+        Returns:
+            Result dict as returned by validate_frontmatter, or None on a miss
+        """
+        cached = self.results.pop(key, None)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        # Re-insert to mark as most recently used
+        self.results[key] = cached
+        self.hits += 1
+        return {
+            **cached,
+            "errors": list(cached["errors"]),
+            "warnings": list(cached["warnings"]),
+            "issues": [dict(found) for found in cached.get("issues", [])],
+            "path": str(source_path),
+        }
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a fresh validate_frontmatter result."""
+        self.results[key] = {name: value for name, value in result.items() if name != "path"}
+
@@ -0,0 +1,407 @@
+"""Persistent vault metadata index (SQLite), refreshed incrementally.
+
+Deep review, highlights and the evolution state all need the same few facts
+about every note: where it lives, its title, draft flag, timestamps,
+authorship and size. Rather than each tool rereading the vault, this index
+stores them once and reparses only notes whose mtime or size changed.
+"""
+
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+import frontmatter
+
+from tools.sync.converter import SYNC_DIRS, build_content_index
+from tools.sync.inventory import VaultEntry, VaultInventory
+from tools.sync.transform import transform_markdown
+from tools.sync.wikilinks import resolve_link
+
+# Default index location, relative to the repository root
+DEFAULT_VAULT_INDEX_PATH = Path(".cache") / "vault-index.sqlite"
+
+# Bump when the table layout or extracted fields change (the index is rebuilt)
+SCHEMA_VERSION = 1
+
+# Frontmatter timestamps stored (as ISO strings) for every note
+TIMESTAMP_FIELDS = (
+    "created",
+    "modified",
+    "human_modified",
+    "ai_modified",
+    "ai_generated_date",
+    "last_curated",
+    "last_deep_review",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notes (
+    source TEXT PRIMARY KEY,      -- source path, relative to the vault's parent
+    section TEXT NOT NULL,
+    rel_path TEXT NOT NULL,       -- path within the section directory
+    slug TEXT NOT NULL,
+    url TEXT NOT NULL,
+    archived INTEGER NOT NULL,
+    in_drafts INTEGER NOT NULL,   -- lives under a drafts/ folder
+    draft INTEGER NOT NULL,       -- frontmatter draft: true
+    section_index INTEGER NOT NULL,
+    title TEXT,
+    {", ".join(f"{name} TEXT" for name in TIMESTAMP_FIELDS)},
+    ai_contribution REAL,
+    word_count INTEGER NOT NULL,
+    body_empty INTEGER NOT NULL,
+    outbound_links INTEGER NOT NULL,
+    parse_error TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,         -- wikilink target as written
+    target_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_slug ON notes(slug);
+CREATE INDEX IF NOT EXISTS notes_url ON notes(url);
+CREATE INDEX IF NOT EXISTS notes_section ON notes(section);
+CREATE INDEX IF NOT EXISTS links_source ON links(source);
+CREATE INDEX IF NOT EXISTS links_target_url ON links(target_url);
+"""
+
+_NOTE_COLUMNS = (
+    "source",
+    "section",
+    "rel_path",
+    "slug",
+    "url",
+    "archived",
+    "in_drafts",
+    "draft",
+    "section_index",
+    "title",
+    *TIMESTAMP_FIELDS,
+    "ai_contribution",
+    "word_count",
+    "body_empty",
+    "outbound_links",
+    "parse_error",
+    "mtime_ns",
+    "size",
+)
+
+# Notes joined with their inbound link count (links from other notes)
+_NOTES_QUERY = (
+    "SELECT n.*, (SELECT COUNT(DISTINCT l.source) FROM links l "
+    "WHERE l.target_url = n.url AND l.source != n.source) AS inbound_links "
+    "FROM notes n"
+)
+
+
+def _timestamp(value: object) -> Optional[str]:
+    """Store a frontmatter timestamp as an ISO string (None if missing)."""
+    if not value:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class VaultIndex:
+    """SQLite-backed metadata for every note in the vault and archive."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def __enter__(self) -> "VaultIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _ensure_schema(self) -> None:
+        """Create tables, rebuilding them if the schema version changed."""
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is not None and int(row["value"]) == SCHEMA_VERSION:
+            return
+
+        with self._conn:
+            for table in ("notes", "links", "meta"):
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def refresh(
+        self,
+        obsidian_path: Path,
+        inventory: Optional[VaultInventory] = None,
+    ) -> dict:
+        """
+        Bring the index up to date with the vault.
+
+        Only notes whose mtime or size changed are reparsed; notes that no
+        longer exist are dropped. Link targets are re-resolved whenever the
+        set of notes changes.
+
+        Args:
+            obsidian_path: Path to Obsidian vault root
+            inventory: Pre-scanned vault inventory (scanned here if omitted)
+
+        Returns:
+            Dict with added, updated, removed and unchanged counts
+        """
+        if inventory is None:
+            inventory = VaultInventory.scan(obsidian_path, SYNC_DIRS)
+
+        vault_root = obsidian_path.parent
+        known = {
+            row["source"]: (row["mtime_ns"], row["size"])
+            for row in self._conn.execute("SELECT source, mtime_ns, size FROM notes")
+        }
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        current: dict[str, VaultEntry] = {}
+        for entry in inventory.select(exclude_drafts=False):
+            current[entry.path.relative_to(vault_root).as_posix()] = entry
+
+        stale = [
+            source
+            for source, entry in current.items()
+            if known.get(source) != (entry.stat.st_mtime_ns, entry.stat.st_size)
+        ]
+        removed = [source for source in known if source not in current]
+        counts["added"] = sum(1 for source in stale if source not in known)
+        counts["updated"] = len(stale) - counts["added"]
+        counts["removed"] = len(removed)
+        counts["unchanged"] = len(current) - len(stale)
+
+        if not stale and not removed:
+            return counts
+
+        membership_changed = counts["added"] > 0 or counts["removed"] > 0
+        content_index = build_content_index(obsidian_path, SYNC_DIRS, inventory=inventory)
+
+        with self._conn:
+            for source in removed:
+                self._conn.execute("DELETE FROM notes WHERE source = ?", (source,))
+                self._conn.execute("DELETE FROM links WHERE source = ?", (source,))
+
+            placeholders = ", ".join("?" for _ in _NOTE_COLUMNS)
+            for source in stale:
+                row, targets = _read_note(source, current[source])
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO notes ({', '.join(_NOTE_COLUMNS)}) "
+                    f"VALUES ({placeholders})",
+                    [row[column] for column in _NOTE_COLUMNS],
+                )
+                self._conn.execute("DELETE FROM links WHERE source = ?", (source,))
+                self._conn.executemany(
+                    "INSERT INTO links (source, target, target_url) VALUES (?, ?, ?)",
+                    [(source, target, resolve_link(target, content_index)) for target in targets],
+                )
+
+            if membership_changed:
+                # Targets may have appeared or vanished: re-resolve every link
+                rows = self._conn.execute("SELECT rowid, target FROM links").fetchall()
+                self._conn.executemany(
+                    "UPDATE links SET target_url = ? WHERE rowid = ?",
+                    [(resolve_link(row["target"], content_index), row["rowid"]) for row in rows],
+                )
+
+        return counts
+
+    def get(self, source: str) -> Optional[dict]:
+        """
+        Metadata for one note.
+
+        Args:
+            source: Source path relative to the vault's parent
+
+        Returns:
+            Dict of note columns plus inbound_links, or None if not indexed
+        """
+        row = self._conn.execute(f"{_NOTES_QUERY} WHERE n.source = ?", (source,)).fetchone()
+        return dict(row) if row else None
+
+    def find(
+        self,
+        slug: str,
+        include_archived: bool = True,
+        include_drafts: bool = True,
+    ) -> list[dict]:
+        """
+        Notes with the given slug, live notes before archived ones.
+
+        Args:
+            slug: Slugified note name
+            include_archived: Also return archived notes
+            include_drafts: Also return notes in drafts/ folders or marked draft
+
+        Returns:
+            List of note dicts
+        """
+        query = f"{_NOTES_QUERY} WHERE n.slug = ?"
+        if not include_archived:
+            query += " AND n.archived = 0"
+        if not include_drafts:
+            query += " AND n.in_drafts = 0 AND n.draft = 0"
+        rows = self._conn.execute(f"{query} ORDER BY n.archived, n.source", (slug,))
+        return [dict(row) for row in rows]
+
+    def notes(
+        self,
+        sections: Optional[list[str]] = None,
+        include_drafts: bool = False,
+        archived: Optional[bool] = False,
+    ) -> list[dict]:
+        """
+        Query notes.
+
+        Args:
+            sections: Only these sections (None = all)
+            include_drafts: Include notes in drafts/ folders or marked draft
+            archived: Only archived (True) or only live (False) notes (None = both)
+
+        Returns:
+            List of note dicts (columns plus inbound_links), ordered by source
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+        if sections is not None:
+            clauses.append(f"n.section IN ({', '.join('?' for _ in sections)})")
+            params.extend(sections)
+        if not include_drafts:
+            clauses.append("n.in_drafts = 0 AND n.draft = 0")
+        if archived is not None:
+            clauses.append("n.archived = ?")
+            params.append(int(archived))
+
+        query = _NOTES_QUERY
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        rows = self._conn.execute(f"{query} ORDER BY n.source", params)
+        return [dict(row) for row in rows]
+
+    def section_counts(self, include_drafts: bool = False) -> dict[str, int]:
+        """
+        Number of live notes per section, not counting section landing pages.
+
+        Args:
+            include_drafts: Count drafts too
+
+        Returns:
+            Dict mapping section name to note count
+        """
+        query = (
+            "SELECT section, COUNT(*) AS count FROM notes "
+            "WHERE archived = 0 AND section_index = 0 AND section != ''"
+        )
+        if not include_drafts:
+            query += " AND in_drafts = 0 AND draft = 0"
+        rows = self._conn.execute(f"{query} GROUP BY section")
+        return {row["section"]: row["count"] for row in rows}
+
+    def content_stats(self) -> dict:
+        """
+        Site-wide counts in the shape of the evolution state's content_stats.
+
+        Returns:
+            Dict with total_files, published_files, draft_files, placeholder_files
+        """
+        row = self._conn.execute(
+            "SELECT COUNT(*) AS total, "
+            "SUM(CASE WHEN in_drafts = 0 AND draft = 0 THEN 1 ELSE 0 END) AS published, "
+            "SUM(CASE WHEN in_drafts = 1 OR draft = 1 THEN 1 ELSE 0 END) AS drafts, "
+            "SUM(body_empty) AS placeholders "
+            "FROM notes WHERE archived = 0"
+        ).fetchone()
+        return {
+            "total_files": row["total"] or 0,
+            "published_files": row["published"] or 0,
+            "draft_files": row["drafts"] or 0,
+            "placeholder_files": row["placeholders"] or 0,
+        }
+
+
+def _read_note(source: str, entry: VaultEntry) -> tuple[dict, list[str]]:
+    """Parse one note into an index row and its wikilink targets."""
+    row: dict = {
+        "source": source,
+        "section": entry.section,
+        "rel_path": entry.rel_path.as_posix(),
+        "slug": entry.slug,
+        "url": entry.url,
+        "archived": int(entry.archived),
+        "in_drafts": int(entry.in_drafts),
+        "section_index": int(entry.is_section_index),
+        "mtime_ns": entry.stat.st_mtime_ns,
+        "size": entry.stat.st_size,
+        "parse_error": None,
+    }
+
+    try:
+        post = frontmatter.load(entry.path)
+        metadata, body = post.metadata, post.content
+    except Exception as e:
+        metadata, body = {}, ""
+        row["parse_error"] = str(e)
+
+    title = metadata.get("title")
+    ai_contribution = metadata.get("ai_contribution")
+    row["title"] = None if title is None else str(title)
+    row["draft"] = int(bool(metadata.get("draft", False)))
+    for name in TIMESTAMP_FIELDS:
+        row[name] = _timestamp(metadata.get(name))
+    row["ai_contribution"] = (
+        ai_contribution
+        if isinstance(ai_contribution, (int, float)) and not isinstance(ai_contribution, bool)
+        else None
+    )
+
+    wikilinks: list[tuple[str, Optional[str]]] = []
+    transform_markdown(body, link_resolver=lambda target: "", collect_links=wikilinks)
+    targets = [target for target, _ in wikilinks if target]
+
+    row["word_count"] = len(body.split())
+    row["body_empty"] = int(not body.strip())
+    row["outbound_links"] = len(targets)
+    return row, targets
+
+
+def refresh_vault_index(
+    obsidian_path: Path,
+    index_path: Path = DEFAULT_VAULT_INDEX_PATH,
+    inventory: Optional[VaultInventory] = None,
+) -> VaultIndex:
+    """
+    Open the vault index and bring it up to date.
+
+    Args:
+        obsidian_path: Path to Obsidian vault root
+        index_path: Path to the index database
+        inventory: Pre-scanned vault inventory (scanned here if omitted)
+
+    Returns:
+        Refreshed VaultIndex (caller closes it)
+    """
+    index = VaultIndex(index_path)
+    index.refresh(obsidian_path, inventory=inventory)
+    return index
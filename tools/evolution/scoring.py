@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from tools.todo.graph import TaskGraph
 from tools.todo.processor import Task, TaskStatus
 from .state import EvolutionState
 
@@ -194,23 +195,33 @@ def get_ranked_tasks(
     tasks: list[Task],
     state: EvolutionState,
     synthetic_tasks: Optional[list[ScoredTask]] = None,
+    graph: Optional[TaskGraph] = None,
 ) -> list[ScoredTask]:
     """
     Score and rank all tasks (queue + synthetic).
 
+    Tasks still waiting on another task are left out, and each task's score
+    counts the tasks it transitively unlocks. Pass the graph from scan_todo
+    (built over the same active task list) so that Blocked-by references to
+    completed, failed or archived tasks resolve; without one the graph is
+    built from ``tasks`` alone.
+
     Args:
         tasks: Active tasks from todo.md (pending status only)
         state: Current evolution state
         synthetic_tasks: Pre-scored synthetic maintenance tasks
+        graph: Blocked-by graph over ``tasks``, by position
 
     Returns:
         List of ScoredTasks sorted by total_score descending
     """
     scored: list[ScoredTask] = []
+    if graph is None:
+        graph = TaskGraph.build(tasks)
 
     # Score queue tasks
-    for task in tasks:
-        if task.status != TaskStatus.PENDING:
+    for i, task in enumerate(tasks):
+        if task.status != TaskStatus.PENDING or graph.is_blocked(i):
             continue
 
         # Skip tasks blocked by 3+ failures (they go to Blocked section)
@@ -218,7 +229,7 @@ def get_ranked_tasks(
         if failure_count >= 3:
             continue
 
-        scored_task = score_task(task, state)
+        scored_task = score_task(task, state, unlocks_count=graph.unlocks_count(i))
         scored.append(scored_task)
 
     # Add synthetic tasks
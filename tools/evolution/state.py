@@ -221,6 +221,39 @@ def save_state(state: EvolutionState, path: Path) -> None:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
 
+# Vault section -> Progress field it is counted in
+PROGRESS_SECTIONS = {
+    "topics": "topics_written",
+    "concepts": "concepts_written",
+    "arguments": "arguments_written",
+    "questions": "questions_written",
+    "voids": "voids_written",
+    "research": "research_notes",
+}
+
+
+def apply_vault_counts(
+    state: EvolutionState,
+    section_counts: dict[str, int],
+    content_stats: dict[str, int],
+) -> None:
+    """
+    Overwrite the counted fields of the state with figures taken from the vault.
+
+    reviews_completed counts review sessions, not files, and is left alone.
+
+    Args:
+        state: State to update in place
+        section_counts: Live notes per section (VaultIndex.section_counts)
+        content_stats: Site-wide counts (VaultIndex.content_stats)
+    """
+    state.content_stats = ContentStats(
+        **{name: content_stats.get(name, 0) for name in ContentStats.__dataclass_fields__}
+    )
+    for section, attribute in PROGRESS_SECTIONS.items():
+        setattr(state.progress, attribute, section_counts.get(section, 0))
+
+
 def calculate_convergence(state: EvolutionState) -> float:
     """
     Calculate convergence score (0.0 to 1.0).
@@ -3,12 +3,16 @@
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
 import tweepy
 from dotenv import load_dotenv
 
+from tools.curate.vault_index import DEFAULT_VAULT_INDEX_PATH, VaultIndex, refresh_vault_index
+from tools.sync.wikilinks import slugify
+
 logger = logging.getLogger(__name__)
 
 # Load .env file from project root (if it exists)
@@ -39,10 +43,32 @@ def is_configured() -> bool:
     return all(os.environ.get(key) for key in required)
 
 
+@lru_cache(maxsize=None)
+def _vault_index() -> VaultIndex | None:
+    """
+    The vault metadata index, refreshed once per process.
+
+    Returns:
+        Open VaultIndex, or None if it could not be refreshed
+    """
+    project_root = Path(__file__).parent.parent.parent
+    try:
+        return refresh_vault_index(
+            project_root / "obsidian", project_root / DEFAULT_VAULT_INDEX_PATH
+        )
+    except Exception as e:
+        logger.warning(f"Vault index unavailable, searching Hugo content: {e}")
+        return None
+
+
 def _find_content_path(slug: str) -> str | None:
     """
     Find the actual path of a page in Hugo content by searching for it.
 
+    Looks the slug up among published notes in the vault metadata index
+    first; only pages the index does not know about (hand-written Hugo
+    content) need a walk.
+
     Args:
         slug: The slugified page name (e.g., 'multi-mind-collapse-problem')
 
@@ -53,6 +79,13 @@ def _find_content_path(slug: str) -> str | None:
     project_root = Path(__file__).parent.parent.parent
     hugo_content = project_root / "hugo" / "content"
 
+    index = _vault_index()
+    if index is not None:
+        # Drafts and archived notes are not published under hugo/content
+        matches = index.find(slug, include_archived=False, include_drafts=False)
+        if matches:
+            return str(matches[0]["url"]).strip("/")
+
     if not hugo_content.exists():
         return None
 
@@ -102,12 +135,8 @@ def wikilink_to_url(wikilink: str) -> str:
     if "|" in target:
         target = target.split("|")[0]
 
-    # Slugify: lowercase, spaces/underscores to hyphens
-    slug = target.lower()
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"[^a-z0-9\-/]", "", slug)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip("-")
+    # Slugify each path segment with the same engine the site sync uses
+    slug = "/".join(part for part in map(slugify, target.split("/")) if part)
 
     # If the wikilink already has a path (e.g., concepts/foo), use it directly
     if "/" in slug:
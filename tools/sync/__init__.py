@@ -1,6 +1,6 @@
 """Obsidian to Hugo sync tools."""
 
-from .converter import convert_obsidian_to_hugo
+from .converter import SyncResult, convert_obsidian_to_hugo, sync_vault
 from .wikilinks import convert_wikilinks
 
-__all__ = ["convert_obsidian_to_hugo", "convert_wikilinks"]
+__all__ = ["convert_obsidian_to_hugo", "convert_wikilinks", "sync_vault", "SyncResult"]
@@ -1,13 +1,50 @@
 """Convert Obsidian markdown files to Hugo-compatible format."""
 
-import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import frontmatter
 
-from .wikilinks import convert_wikilinks, convert_block_references
+from .inventory import VaultInventory
+from .linkgraph import LinkGraph
+from .manifest import SyncManifest
+from .transform import transform_markdown
+from .wikilinks import resolve_link, slugify
+
+
+# Bump whenever a change to the conversion logic alters output, so that
+# incremental syncs reconvert everything once
+CONVERTER_VERSION = 2
+
+# Directories to sync (exclude .obsidian, drafts if configured)
+SYNC_DIRS = [
+    "topics",
+    "concepts",
+    "project",
+    "tenets",
+    "questions",
+    "arguments",
+    "workflow",
+    "research",
+    "reviews",
+    "voids",
+]
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a sync run."""
+
+    files: list[Path] = field(default_factory=list)  # Every output the vault maps to
+    converted: list[Path] = field(default_factory=list)  # Outputs (re)converted this run
+    skipped: list[Path] = field(default_factory=list)  # Not reconverted (manifest: up to date)
+    written: list[Path] = field(default_factory=list)  # Converted and written to disk
+    unchanged: list[Path] = field(default_factory=list)  # Converted, identical to disk
+    deleted: list[Path] = field(default_factory=list)  # Outputs whose source has gone
+    validation: Optional[dict] = None  # validate_directory-style results, if requested
 
 
 def convert_obsidian_to_hugo(
@@ -15,6 +52,8 @@ def convert_obsidian_to_hugo(
     hugo_content_path: Path,
     exclude_drafts: bool = True,
     dry_run: bool = False,
+    manifest_path: Optional[Path] = None,
+    jobs: int = 1,
 ) -> list[Path]:
     """
     Convert Obsidian vault content to Hugo content directory.
@@ -24,104 +63,315 @@ def convert_obsidian_to_hugo(
         hugo_content_path: Path to Hugo content directory
         exclude_drafts: Whether to exclude files in drafts/ folder
         dry_run: If True, don't actually copy files
+        manifest_path: Optional sync manifest enabling incremental conversion
+        jobs: Number of worker processes for conversion (1 = serial)
 
     Returns:
         List of paths to converted files
     """
-    converted_files: list[Path] = []
-
-    # Directories to sync (exclude .obsidian, drafts if configured)
-    sync_dirs = [
-        "topics",
-        "concepts",
-        "project",
-        "tenets",
-        "questions",
-        "arguments",
-        "workflow",
-        "research",
-        "reviews",
-        "voids",
-    ]
+    result = sync_vault(
+        obsidian_path,
+        hugo_content_path,
+        exclude_drafts=exclude_drafts,
+        dry_run=dry_run,
+        manifest_path=manifest_path,
+        jobs=jobs,
+    )
+    return result.converted
 
-    # Build content index for wikilink resolution
-    content_index = build_content_index(obsidian_path, sync_dirs, exclude_drafts)
 
-    # Handle root index.md -> _index.md (site landing page)
-    root_index = obsidian_path / "index.md"
-    if root_index.exists():
-        target_file = hugo_content_path / "_index.md"
-        converted_content = convert_file(root_index, content_index)
-        if not dry_run:
-            target_file.write_text(converted_content, encoding="utf-8")
-        converted_files.append(target_file)
+def sync_vault(
+    obsidian_path: Path,
+    hugo_content_path: Path,
+    exclude_drafts: bool = True,
+    dry_run: bool = False,
+    manifest_path: Optional[Path] = None,
+    jobs: int = 1,
+    inventory: Optional[VaultInventory] = None,
+    changed: Optional[set[Path]] = None,
+    full: bool = False,
+    link_graph_path: Optional[Path] = None,
+    validate: bool = False,
+    strict: bool = False,
+    validation_cache_path: Optional[Path] = None,
+) -> SyncResult:
+    """
+    Sync the Obsidian vault to Hugo, optionally incrementally.
 
-    for sync_dir in sync_dirs:
-        source_dir = obsidian_path / sync_dir
-        if not source_dir.exists():
-            continue
+    With a manifest, notes whose source bytes, converter version and link
+    resolutions are unchanged since the last run are skipped. Notes whose
+    wikilinks now resolve differently (because a target was added, moved or
+    archived) are reconverted even if their own source did not change.
+    Outputs recorded as owned by a previous sync whose source no longer
+    exists are deleted (listed only, in a dry run).
 
-        target_dir = hugo_content_path / sync_dir
+    Args:
+        obsidian_path: Path to Obsidian vault root
+        hugo_content_path: Path to Hugo content directory
+        exclude_drafts: Whether to exclude files in drafts/ folder
+        dry_run: If True, don't write files or the manifest
+        manifest_path: Path to the sync manifest (None = full conversion)
+        jobs: Number of worker processes for conversion (1 = serial). The
+            content index is built once and handed to each worker; output
+            is identical to the serial path.
+        inventory: Pre-scanned vault inventory (scanned here if omitted)
+        changed: Source paths known to have changed (e.g. from a file
+            watcher). With a manifest, other sources are trusted to be
+            unchanged and are not re-hashed; they are still reconverted if
+            their link resolutions change.
+        full: Reconvert every note, but still record outputs in the
+            manifest and prune orphaned ones
+        link_graph_path: If given, update the persistent link graph with
+            the wikilinks of every reconverted note
+        validate: Also validate the frontmatter of the Hugo content
+            directory. Reconverted notes are validated in memory, before
+            serialization; other files (skipped or hand-written) are
+            validated from disk, through the validation cache if given.
+            Results are the same as validate_directory(hugo_content_path).
+        strict: Strict validation (see validate_frontmatter)
+        validation_cache_path: Validation cache to read and update
 
-        for md_file in source_dir.rglob("*.md"):
-            # Skip draft files if configured
-            if exclude_drafts and "drafts" in md_file.parts:
-                continue
+    Returns:
+        SyncResult describing written, unchanged, skipped and deleted outputs
+    """
+    result = SyncResult()
+
+    manifest: Optional[SyncManifest] = None
+    if manifest_path is not None:
+        manifest = SyncManifest.load(manifest_path, hugo_content_path, exclude_drafts)
 
-            # Calculate relative path and target
-            rel_path = md_file.relative_to(source_dir)
+    # One directory scan feeds both the content index and the conversion loop
+    if inventory is None:
+        inventory = VaultInventory.scan(obsidian_path, SYNC_DIRS)
 
-            # If file has same name as its parent folder, make it _index.md
-            # e.g., tenets/tenets.md -> tenets/_index.md
-            if md_file.stem.lower() == sync_dir.lower():
-                target_file = target_dir / "_index.md"
-            else:
-                target_file = target_dir / rel_path
+    # Build content index for wikilink resolution
+    content_index = build_content_index(
+        obsidian_path, SYNC_DIRS, exclude_drafts, inventory=inventory
+    )
 
-            # Convert the file with content-aware link resolver
-            converted_content = convert_file(md_file, content_index)
+    link_graph: Optional[LinkGraph] = None
+    graph_sources: set[str] = set()
+    if link_graph_path is not None and not dry_run:
+        link_graph = LinkGraph(link_graph_path)
+        graph_sources = link_graph.scanned_sources()
+
+    seen: set[str] = set()
+    vault_root = obsidian_path.parent
+    pending: list[tuple[str, Path, Path]] = []
+    graph_notes: list[tuple[str, str, str, bool]] = []
+
+    for entry in inventory.select(exclude_drafts=exclude_drafts):
+        md_file = entry.path
+        target_file = hugo_content_path / entry.target
+        result.files.append(target_file)
+
+        key = md_file.relative_to(vault_root).as_posix()
+        seen.add(key)
+        graph_notes.append((key, entry.slug, entry.url, entry.archived))
+
+        # A note missing from the link graph must be converted to learn its links
+        missing_links = link_graph is not None and key not in graph_sources
+
+        if manifest is not None and not full and not missing_links and manifest.is_fresh(
+            key,
+            md_file,
+            target_file,
+            CONVERTER_VERSION,
+            content_index,
+            stat=entry.stat,
+            assume_unchanged=changed is not None and md_file not in changed,
+        ):
+            result.skipped.append(target_file)
+            continue
 
+        pending.append((key, md_file, target_file))
+
+    # Convert the files with content-aware link resolver
+    sources = [md_file for _, md_file, _ in pending]
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(content_index, strict if validate else None),
+        ) as pool:
+            chunksize = max(1, len(sources) // (jobs * 4))
+            outputs = list(pool.map(_convert_worker, sources, chunksize=chunksize))
+    else:
+        outputs = [
+            _convert_file(md_file, content_index, strict if validate else None)
+            for md_file in sources
+        ]
+
+    # Output stage: only touch files whose bytes actually change, so mtimes
+    # (and Hugo's watcher / mtime-based deploys) see a precise change set
+    validated: dict[Path, tuple[dict, bytes]] = {}
+    for (key, md_file, target_file), (converted_content, deps) in zip(pending, outputs):
+        if write_if_changed(target_file, converted_content, dry_run=dry_run):
+            result.written.append(target_file)
+        else:
+            result.unchanged.append(target_file)
+
+        if validate:
+            validated[target_file] = (deps.pop("validation"), converted_content.encode("utf-8"))
+
+        if manifest is not None and not dry_run:
+            manifest.record(key, md_file, target_file, CONVERTER_VERSION, deps)
+
+        result.converted.append(target_file)
+
+    if link_graph is not None:
+        with link_graph:
+            link_graph.update(
+                graph_notes,
+                {key: deps["wikilinks"] for (key, _, _), (_, deps) in zip(pending, outputs)},
+                content_index,
+            )
+
+    if manifest is not None:
+        # Prune outputs sync owns whose source was deleted, renamed or archived
+        current_outputs = {
+            target_file.relative_to(hugo_content_path).as_posix() for target_file in result.files
+        }
+        for rel_output in sorted(manifest.owned - current_outputs):
+            output = hugo_content_path / rel_output
+            if not output.exists():
+                continue
             if not dry_run:
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                target_file.write_text(converted_content, encoding="utf-8")
+                output.unlink()
+                _remove_empty_dirs(output.parent, hugo_content_path)
+            result.deleted.append(output)
+
+        if not dry_run:
+            # Forget sources that no longer exist in the vault
+            manifest.entries = {
+                key: entry for key, entry in manifest.entries.items() if key in seen
+            }
+            manifest.owned = current_outputs
+            manifest.save()
 
-            converted_files.append(target_file)
+    if validate:
+        result.validation = _validate_outputs(
+            hugo_content_path, validated, strict, validation_cache_path, dry_run
+        )
 
-    # Process archive directory (parallel to obsidian/)
-    archive_source = obsidian_path.parent / "archive"
-    if archive_source.exists():
-        for sync_dir in sync_dirs:
-            archive_section = archive_source / sync_dir
-            if not archive_section.exists():
-                continue
+    return result
+
+
+def _validate_outputs(
+    hugo_content_path: Path,
+    validated: dict[Path, tuple[dict, bytes]],
+    strict: bool,
+    cache_path: Optional[Path],
+    dry_run: bool,
+) -> dict:
+    """
+    Combine in-memory validation of converted notes with the rest of the site.
+
+    Args:
+        hugo_content_path: Hugo content directory
+        validated: Output path -> (validation result, output bytes) for
+            every note converted this run
+        strict: Strict validation (see validate_frontmatter)
+        cache_path: Validation cache to read and update (None = no cache)
+        dry_run: Outputs were not written, so nothing is cached for them
+
+    Returns:
+        Dict with summary and per-file results, as from validate_directory
+    """
+    # Imported here: tools.curate builds on tools.sync
+    from tools.curate.schema import section_for
+    from tools.curate.validate import VALIDATOR_VERSION, iter_validate_files, tally_result
+    from tools.curate.validation_cache import ValidationCache
+
+    cache: Optional[ValidationCache] = None
+    if cache_path is not None:
+        cache = ValidationCache.load(cache_path, VALIDATOR_VERSION)
+
+    results: dict = {"total": 0, "valid": 0, "invalid": 0, "warnings": 0, "files": []}
+
+    for target_file, (file_result, data) in validated.items():
+        file_result["path"] = str(target_file)
+        if cache is not None and not dry_run:
+            section = section_for(target_file, hugo_content_path)
+            cache.put(cache.key_for_bytes(target_file, data, strict, section), file_result)
+        tally_result(results, file_result)
+        results["files"].append(file_result)
+
+    # Skipped outputs and hand-written pages were not parsed this run
+    others = (path for path in hugo_content_path.rglob("*.md") if path not in validated)
+    for file_result in iter_validate_files(
+        others, strict=strict, cache=cache, root=hugo_content_path
+    ):
+        tally_result(results, file_result)
+        results["files"].append(file_result)
+
+    if cache is not None:
+        cache.save()
+
+    return results
+
+
+def _remove_empty_dirs(directory: Path, stop: Path) -> None:
+    """Remove directory and its parents while they are empty, stopping at stop."""
+    while directory != stop and directory.is_relative_to(stop):
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def write_if_changed(path: Path, content: str, dry_run: bool = False) -> bool:
+    """
+    Write content to a file unless it already holds exactly these bytes.
+
+    Args:
+        path: File to write
+        content: Text to write (UTF-8)
+        dry_run: If True, only report whether a write would happen
 
-            archive_target = hugo_content_path / "archive" / sync_dir
+    Returns:
+        True if the file was (or would be) written
+    """
+    data = content.encode("utf-8")
+    try:
+        # Cheap size check first; only read the file when sizes match
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
 
-            for md_file in archive_section.rglob("*.md"):
-                # Skip draft files if configured
-                if exclude_drafts and "drafts" in md_file.parts:
-                    continue
+    if not dry_run:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return True
 
-                # Calculate relative path and target
-                rel_path = md_file.relative_to(archive_section)
-                target_file = archive_target / rel_path
 
-                # Convert the file with content-aware link resolver
-                converted_content = convert_file(md_file, content_index)
+# Content index shared with conversion worker processes (set by _init_worker)
+_worker_index: Optional[dict[str, str]] = None
+_worker_validate_strict: Optional[bool] = None
 
-                if not dry_run:
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    target_file.write_text(converted_content, encoding="utf-8")
 
-                converted_files.append(target_file)
+def _init_worker(
+    content_index: dict[str, str],
+    validate_strict: Optional[bool] = None,
+) -> None:
+    """Process pool initializer: receive the content index once per worker."""
+    global _worker_index, _worker_validate_strict
+    _worker_index = content_index
+    _worker_validate_strict = validate_strict
 
-    return converted_files
+
+def _convert_worker(source_path: Path) -> tuple[str, dict]:
+    """Convert a file inside a worker process using the shared index."""
+    return _convert_file(source_path, _worker_index, _worker_validate_strict)
 
 
 def build_content_index(
     obsidian_path: Path,
     sync_dirs: list[str],
     exclude_drafts: bool = True,
+    inventory: Optional[VaultInventory] = None,
 ) -> dict[str, str]:
     """
     Build an index mapping page names to their Hugo URLs.
@@ -130,53 +380,22 @@ def build_content_index(
         obsidian_path: Path to Obsidian vault root
         sync_dirs: List of directories to index
         exclude_drafts: Whether to exclude drafts
+        inventory: Pre-scanned vault inventory (scanned here if omitted)
 
     Returns:
         Dict mapping slugified page names to Hugo URLs
     """
-    from .wikilinks import slugify
+    if inventory is None:
+        inventory = VaultInventory.scan(obsidian_path, sync_dirs)
 
     index: dict[str, str] = {}
 
-    for sync_dir in sync_dirs:
-        source_dir = obsidian_path / sync_dir
-        if not source_dir.exists():
-            continue
-
-        for md_file in source_dir.rglob("*.md"):
-            if exclude_drafts and "drafts" in md_file.parts:
-                continue
-
-            # Get the page name (filename without extension)
-            page_name = md_file.stem
-            slug = slugify(page_name)
-
-            # Build the Hugo URL
-            # If file has same name as its parent folder, it becomes the section index
-            if page_name.lower() == sync_dir.lower():
-                url = f"/{sync_dir}/"
-            else:
-                url = f"/{sync_dir}/{slug}/"
-
-            # Index by slug (for wikilink lookup)
-            index[slug] = url
-
-    # Also index archived content (parallel to obsidian/)
-    archive_path = obsidian_path.parent / "archive"
-    if archive_path.exists():
-        for sync_dir in sync_dirs:
-            archive_section = archive_path / sync_dir
-            if not archive_section.exists():
-                continue
-
-            for md_file in archive_section.rglob("*.md"):
-                if exclude_drafts and "drafts" in md_file.parts:
-                    continue
-
-                page_name = md_file.stem
-                slug = slugify(page_name)
-                url = f"/archive/{sync_dir}/{slug}/"
-                index[slug] = url
+    # Archived content is indexed after live content (parallel to obsidian/)
+    for entry in inventory.select(
+        exclude_drafts=exclude_drafts, sections=sync_dirs, include_root=False
+    ):
+        # Index by slug (for wikilink lookup)
+        index[entry.slug] = entry.url
 
     return index
 
@@ -195,6 +414,32 @@ def convert_file(
     Returns:
         Converted markdown content as string
     """
+    return _convert_file(source_path, content_index)[0]
+
+
+def _convert_file(
+    source_path: Path,
+    content_index: Optional[dict[str, str]] = None,
+    validate_strict: Optional[bool] = None,
+) -> tuple[str, dict]:
+    """
+    Convert a single file, also reporting what the output depends on.
+
+    Args:
+        source_path: Path to source markdown file
+        content_index: Optional dict mapping page slugs to Hugo URLs
+        validate_strict: If not None, validate the converted post before
+            serializing it (with this strict setting)
+
+    Returns:
+        Tuple of (converted content, deps) where deps has 'links' (slug ->
+        resolved URL, None if unresolved), 'wikilinks' ((target, heading)
+        pairs in document order) and 'mtime_date' (the date taken from the
+        file's mtime, or None if frontmatter supplied one). With validation,
+        deps also has 'validation' (the validate_post result)
+    """
+    deps: dict = {"links": {}, "wikilinks": [], "mtime_date": None}
+
     # Parse frontmatter and content
     post = frontmatter.load(source_path)
 
@@ -212,6 +457,7 @@ def convert_file(
 
             mtime = source_path.stat().st_mtime
             post.metadata["date"] = datetime.date.fromtimestamp(mtime).isoformat()
+            deps["mtime_date"] = post.metadata["date"]
 
     # Ensure authorship metadata exists (flat schema)
     if "ai_contribution" not in post.metadata:
@@ -223,43 +469,29 @@ def convert_file(
     if "related_articles" not in post.metadata:
         post.metadata["related_articles"] = []
 
-    # Convert content
-    content = post.content
-
-    # Convert Obsidian block references to HTML anchors (must be before wikilinks)
-    content = convert_block_references(content)
-
-    # Convert Obsidian wikilinks to Hugo links
+    # Convert block references, wikilinks, callouts and embeds in one pass
     # Use content-aware resolver if index is provided
+    link_resolver: Optional[Callable[[str], str]] = None
     if content_index:
-        from .wikilinks import slugify
 
         def link_resolver(target: str) -> str:
-            # Handle path-based targets like "arguments/epiphenomenalism"
-            if "/" in target:
-                parts = target.split("/")
-                slugified_parts = [slugify(part) for part in parts]
-                return "/" + "/".join(slugified_parts) + "/"
-            # Single-part target: look up in index
-            slug = slugify(target)
-            if slug in content_index:
-                return content_index[slug]
-            # Fallback to root-level path
-            return f"/{slug}/"
-
-        content = convert_wikilinks(content, link_resolver=link_resolver)
-    else:
-        content = convert_wikilinks(content)
-
-    # Convert Obsidian callouts to Hugo shortcodes (if needed)
-    content = convert_callouts(content)
-
-    # Convert Obsidian embeds
-    content = convert_embeds(content)
+            if "/" not in target:
+                # Output depends on how this slug resolves
+                slug = slugify(target)
+                deps["links"][slug] = content_index.get(slug)
+            return resolve_link(target, content_index)
+
+    content = transform_markdown(
+        post.content, link_resolver=link_resolver, collect_links=deps["wikilinks"]
+    )
 
     # Rebuild the file with frontmatter
     post.content = content
-    return frontmatter.dumps(post)
+    if validate_strict is not None:
+        from tools.curate.validate import validate_post
+
+        deps["validation"] = validate_post(post, source_path, strict=validate_strict)
+    return frontmatter.dumps(post), deps
 
 
 def convert_callouts(content: str) -> str:
@@ -269,19 +501,7 @@ def convert_callouts(content: str) -> str:
     Obsidian format: > [!note] Title
     Hugo format: <blockquote class="callout callout-note">...</blockquote>
     """
-    # Pattern for Obsidian callouts
-    callout_pattern = re.compile(
-        r"^>\s*\[!(\w+)\]\s*(.*)$", re.MULTILINE
-    )
-
-    def replace_callout(match: re.Match) -> str:
-        callout_type = match.group(1).lower()
-        title = match.group(2).strip()
-        if title:
-            return f'> **{title}**\n> \n> *({callout_type})*'
-        return f"> *({callout_type})*"
-
-    return callout_pattern.sub(replace_callout, content)
+    return transform_markdown(content, block_refs=False, wikilinks=False, embeds=False)
 
 
 def convert_embeds(content: str) -> str:
@@ -290,21 +510,7 @@ def convert_embeds(content: str) -> str:
 
     For now, just converts to regular links.
     """
-    # Pattern for Obsidian embeds
-    embed_pattern = re.compile(r"!\[\[([^\]]+)\]\]")
-
-    def replace_embed(match: re.Match) -> str:
-        target = match.group(1)
-        # Handle display text
-        if "|" in target:
-            target, display = target.split("|", 1)
-        else:
-            display = target
-
-        # Convert to markdown link (embedded content would need more work)
-        return f"[{display}](/{target.lower().replace(' ', '-')}/)"
-
-    return embed_pattern.sub(replace_embed, content)
+    return transform_markdown(content, block_refs=False, wikilinks=False, callouts=False)
 
 
 def ensure_frontmatter(content: str, defaults: Optional[dict] = None) -> str:
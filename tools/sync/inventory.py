@@ -0,0 +1,180 @@
+"""Single-walk inventory of the Obsidian vault and its archive."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .wikilinks import slugify
+
+# Directories inside sync directories that are never synced, relative to the
+# vault root (workflow/todo-archive: append-only shards of old todo entries)
+UNSYNCED_DIRS = ("workflow/todo-archive",)
+
+
+@dataclass(frozen=True)
+class VaultEntry:
+    """A markdown note found by the vault scan."""
+
+    path: Path  # Source file
+    section: str  # Sync directory, e.g. "concepts" ("" for the root index)
+    rel_path: Path  # Path relative to the section directory
+    stem: str
+    slug: str
+    target: Path  # Hugo output path, relative to the content directory
+    archived: bool  # Lives under archive/ rather than the vault
+    in_drafts: bool  # Lives under a drafts/ folder
+    stat: os.stat_result
+
+    @property
+    def is_section_index(self) -> bool:
+        """True if the note is its section's landing page (e.g. tenets/tenets.md)."""
+        return not self.archived and self.stem.lower() == self.section.lower()
+
+    @property
+    def url(self) -> str:
+        """Hugo URL the note is published at."""
+        if not self.section:
+            return "/"
+        if self.archived:
+            return f"/archive/{self.section}/{self.slug}/"
+        if self.is_section_index:
+            return f"/{self.section}/"
+        return f"/{self.section}/{self.slug}/"
+
+
+def _walk_markdown(
+    directory: Path,
+    skip: frozenset[Path] = frozenset(),
+) -> Iterator[tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for every .md file below a directory, except under skip."""
+    subdirs: list[Path] = []
+    try:
+        with os.scandir(directory) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    if Path(dir_entry.path) not in skip:
+                        subdirs.append(Path(dir_entry.path))
+                elif dir_entry.name.endswith(".md") and dir_entry.is_file():
+                    yield Path(dir_entry.path), dir_entry.stat()
+    except FileNotFoundError:
+        return
+
+    for subdir in subdirs:
+        yield from _walk_markdown(subdir, skip)
+
+
+class VaultInventory:
+    """
+    Every note in the vault and archive, from a single directory scan.
+
+    Consumers (the content index, the converter, validation, deep review)
+    share one inventory instead of each walking the tree with rglob.
+    """
+
+    def __init__(self, obsidian_path: Path, entries: list[VaultEntry]):
+        self.obsidian_path = obsidian_path
+        self.entries = entries
+
+    @classmethod
+    def scan(cls, obsidian_path: Path, sync_dirs: list[str]) -> "VaultInventory":
+        """
+        Scan the vault's sync directories and the parallel archive tree.
+
+        Entries are ordered: root index, vault sections, archive sections.
+        Directories in UNSYNCED_DIRS are not entered.
+
+        Args:
+            obsidian_path: Path to Obsidian vault root
+            sync_dirs: Section directories to scan
+
+        Returns:
+            VaultInventory holding every markdown note found
+        """
+        entries: list[VaultEntry] = []
+
+        # Root index.md -> _index.md (site landing page)
+        root_index = obsidian_path / "index.md"
+        if root_index.is_file():
+            entries.append(
+                VaultEntry(
+                    path=root_index,
+                    section="",
+                    rel_path=Path("index.md"),
+                    stem="index",
+                    slug="index",
+                    target=Path("_index.md"),
+                    archived=False,
+                    in_drafts=False,
+                    stat=root_index.stat(),
+                )
+            )
+
+        archive_path = obsidian_path.parent / "archive"
+        roots = [(obsidian_path, False)]
+        if archive_path.exists():
+            roots.append((archive_path, True))
+
+        for root, archived in roots:
+            skip = frozenset(root / unsynced for unsynced in UNSYNCED_DIRS)
+            for sync_dir in sync_dirs:
+                source_dir = root / sync_dir
+                for md_file, stat in _walk_markdown(source_dir, skip):
+                    rel_path = md_file.relative_to(source_dir)
+                    stem = md_file.stem
+
+                    if archived:
+                        target = Path("archive") / sync_dir / rel_path
+                    elif stem.lower() == sync_dir.lower():
+                        # e.g., tenets/tenets.md -> tenets/_index.md
+                        target = Path(sync_dir) / "_index.md"
+                    else:
+                        target = Path(sync_dir) / rel_path
+
+                    entries.append(
+                        VaultEntry(
+                            path=md_file,
+                            section=sync_dir,
+                            rel_path=rel_path,
+                            stem=stem,
+                            slug=slugify(stem),
+                            target=target,
+                            archived=archived,
+                            in_drafts="drafts" in md_file.parts,
+                            stat=stat,
+                        )
+                    )
+
+        return cls(obsidian_path, entries)
+
+    def select(
+        self,
+        exclude_drafts: bool = True,
+        sections: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        include_root: bool = True,
+    ) -> Iterator[VaultEntry]:
+        """
+        Iterate over entries matching the given filters.
+
+        Args:
+            exclude_drafts: Skip notes under a drafts/ folder
+            sections: Only these sections (None = all)
+            archived: Only archived (True) or only live (False) notes (None = both)
+            include_root: Include the root index note
+
+        Yields:
+            Matching VaultEntry objects, in scan order
+        """
+        for entry in self.entries:
+            if not entry.section:
+                if include_root and sections is None and archived is not True:
+                    yield entry
+                continue
+            if exclude_drafts and entry.in_drafts:
+                continue
+            if sections is not None and entry.section not in sections:
+                continue
+            if archived is not None and entry.archived != archived:
+                continue
+            yield entry
@@ -0,0 +1,287 @@
+"""Persistent wikilink graph (forward links and backlinks) maintained by sync.
+
+Sync already parses every wikilink while converting notes; instead of
+throwing that away it records each link here, in a small SQLite database.
+Only reconverted notes have their rows replaced, so the graph is updated
+incrementally alongside the sync manifest. Resolution status is recomputed
+in SQL on every update, so links start resolving as soon as their target
+note appears.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from .centrality import pagerank
+from .wikilinks import resolve_link, slugify
+
+# Default graph location, relative to the repository root
+DEFAULT_LINK_GRAPH_PATH = Path(".cache") / "link-graph.sqlite"
+
+# Bump when the table layout changes (the graph is then rebuilt)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notes (
+    source TEXT PRIMARY KEY,      -- source path, relative to the vault's parent
+    slug TEXT NOT NULL,
+    url TEXT NOT NULL,
+    archived INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scanned (
+    source TEXT PRIMARY KEY       -- sources whose links are recorded
+);
+CREATE TABLE IF NOT EXISTS links (
+    source TEXT NOT NULL,
+    source_slug TEXT NOT NULL,
+    target TEXT NOT NULL,         -- wikilink target as written
+    target_slug TEXT NOT NULL,
+    anchor TEXT,                  -- heading or ^block-id, if any
+    target_url TEXT NOT NULL,
+    status TEXT NOT NULL          -- 'resolved' or 'broken'
+);
+CREATE TABLE IF NOT EXISTS centrality (
+    source TEXT PRIMARY KEY,      -- PageRank of each live note, as of centrality_version
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_source ON links(source);
+CREATE INDEX IF NOT EXISTS links_target_url ON links(target_url);
+CREATE INDEX IF NOT EXISTS notes_slug ON notes(slug);
+CREATE INDEX IF NOT EXISTS notes_url ON notes(url);
+"""
+
+
+class LinkGraph:
+    """SQLite-backed store of every wikilink in the vault."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def __enter__(self) -> "LinkGraph":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _ensure_schema(self) -> None:
+        """Create tables, rebuilding them if the schema version changed."""
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is not None and int(row["value"]) == SCHEMA_VERSION:
+            return
+
+        with self._conn:
+            for table in ("notes", "scanned", "links", "centrality", "meta"):
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('version', '0')")
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every update; use it to key derived caches."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row["value"]) if row else 0
+
+    def scanned_sources(self) -> set[str]:
+        """Sources whose links are currently recorded."""
+        return {row["source"] for row in self._conn.execute("SELECT source FROM scanned")}
+
+    def update(
+        self,
+        notes: list[tuple[str, str, str, bool]],
+        changed: dict[str, list[tuple[str, Optional[str]]]],
+        content_index: dict[str, str],
+    ) -> None:
+        """
+        Apply the results of a sync run.
+
+        Args:
+            notes: Every current note as (source, slug, url, archived)
+            changed: Wikilinks of each reconverted source, as (target, heading)
+            content_index: Slug -> URL index used to resolve targets
+        """
+        slugs = {source: slug for source, slug, _, _ in notes}
+        urls = {source: url for source, _, url, _ in notes}
+
+        with self._conn:
+            self._conn.execute("DELETE FROM notes")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notes (source, slug, url, archived) VALUES (?, ?, ?, ?)",
+                [(source, slug, url, int(archived)) for source, slug, url, archived in notes],
+            )
+
+            # Drop links from sources that no longer exist
+            self._conn.execute("DELETE FROM links WHERE source NOT IN (SELECT source FROM notes)")
+            self._conn.execute(
+                "DELETE FROM scanned WHERE source NOT IN (SELECT source FROM notes)"
+            )
+
+            for source, wikilinks in changed.items():
+                self._conn.execute("DELETE FROM links WHERE source = ?", (source,))
+                rows = []
+                for target, heading in wikilinks:
+                    if target:
+                        target_slug = slugify(target.split("/")[-1])
+                        target_url = resolve_link(target, content_index)
+                    else:
+                        # [[#Heading]] points into the note itself
+                        target_slug = slugs.get(source, "")
+                        target_url = urls.get(source, "")
+                    rows.append(
+                        (source, slugs.get(source, ""), target, target_slug, heading, target_url)
+                    )
+                self._conn.executemany(
+                    "INSERT INTO links (source, source_slug, target, target_slug, anchor, "
+                    "target_url, status) VALUES (?, ?, ?, ?, ?, ?, 'broken')",
+                    rows,
+                )
+                self._conn.execute("INSERT OR REPLACE INTO scanned (source) VALUES (?)", (source,))
+
+            # Targets may have appeared or vanished since links were recorded
+            self._conn.execute(
+                "UPDATE links SET status = CASE WHEN target_url IN (SELECT url FROM notes) "
+                "THEN 'resolved' ELSE 'broken' END"
+            )
+            self._conn.execute(
+                "UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'version'"
+            )
+
+    def forward_links(self, slug: str) -> list[dict]:
+        """
+        Links going out of the note(s) with the given slug.
+
+        Returns:
+            List of dicts with target, target_slug, anchor, target_url, status
+        """
+        rows = self._conn.execute(
+            "SELECT target, target_slug, anchor, target_url, status FROM links "
+            "WHERE source_slug = ? ORDER BY rowid",
+            (slug,),
+        )
+        return [dict(row) for row in rows]
+
+    def backlinks(self, slug: str) -> list[dict]:
+        """
+        Links from other notes pointing at the note(s) with the given slug.
+
+        Returns:
+            List of dicts with source, source_slug, anchor
+        """
+        rows = self._conn.execute(
+            "SELECT DISTINCT l.source, l.source_slug, l.anchor FROM links l "
+            "JOIN notes n ON l.target_url = n.url "
+            "WHERE n.slug = ? AND l.source != n.source ORDER BY l.source",
+            (slug,),
+        )
+        return [dict(row) for row in rows]
+
+    def orphans(self, include_archived: bool = False) -> list[str]:
+        """
+        Notes that no other note links to.
+
+        The site root and section landing pages are never orphans.
+
+        Args:
+            include_archived: Also report archived notes
+
+        Returns:
+            Sorted list of source paths
+        """
+        rows = self._conn.execute(
+            "SELECT n.source, n.url, n.archived FROM notes n "
+            "WHERE NOT EXISTS (SELECT 1 FROM links l "
+            "WHERE l.target_url = n.url AND l.source != n.source) ORDER BY n.source"
+        )
+        orphans = []
+        for row in rows:
+            if row["archived"] and not include_archived:
+                continue
+            # "/" and "/section/" are landing pages
+            if row["url"].count("/") <= 2:
+                continue
+            orphans.append(row["source"])
+        return orphans
+
+    def edges(self) -> list[tuple[str, str]]:
+        """
+        Resolved links between distinct live (non-archived) notes.
+
+        Returns:
+            Sorted list of unique (source, target source) pairs
+        """
+        rows = self._conn.execute(
+            "SELECT DISTINCT l.source, n.source AS target FROM links l "
+            "JOIN notes n ON l.target_url = n.url "
+            "JOIN notes s ON l.source = s.source "
+            "WHERE l.source != n.source AND n.archived = 0 AND s.archived = 0 "
+            "ORDER BY l.source, n.source"
+        )
+        return [(row["source"], row["target"]) for row in rows]
+
+    def centrality(self) -> dict[str, float]:
+        """
+        PageRank of every live note over the link graph.
+
+        Computed once per graph version and stored alongside the graph, so
+        repeated lookups between syncs cost a single query.
+
+        Returns:
+            Dict mapping source path to rank (ranks sum to 1)
+        """
+        version = str(self.version)
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'centrality_version'"
+        ).fetchone()
+        if row is not None and row["value"] == version:
+            rows = self._conn.execute("SELECT source, score FROM centrality")
+            return {row["source"]: row["score"] for row in rows}
+
+        nodes = [
+            row["source"]
+            for row in self._conn.execute(
+                "SELECT source FROM notes WHERE archived = 0 ORDER BY source"
+            )
+        ]
+        ranks = pagerank(nodes, self.edges())
+        with self._conn:
+            self._conn.execute("DELETE FROM centrality")
+            self._conn.executemany(
+                "INSERT INTO centrality (source, score) VALUES (?, ?)", ranks.items()
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('centrality_version', ?)",
+                (version,),
+            )
+        return ranks
+
+    def broken(self) -> list[dict]:
+        """
+        Links whose target does not resolve to any note.
+
+        Returns:
+            List of dicts with source, target, anchor, target_url
+        """
+        rows = self._conn.execute(
+            "SELECT source, target, anchor, target_url FROM links "
+            "WHERE status = 'broken' ORDER BY source, rowid"
+        )
+        return [dict(row) for row in rows]
@@ -0,0 +1,204 @@
+"""Persisted sync manifest for incremental Obsidian -> Hugo conversion.
+
+The manifest records, for every converted source note, the content hash it
+was converted from, the converter version, the output path, and every
+wikilink slug whose resolution the output depends on. A later sync can then
+skip any note whose source, converter, and link resolutions are unchanged.
+
+It also records the set of outputs sync owns, so outputs whose source was
+deleted, renamed or archived can be pruned without touching hand-written
+files in the Hugo content directory.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+# Bump when the on-disk manifest layout changes
+MANIFEST_VERSION = 2
+
+# Default manifest location, relative to the repository root
+DEFAULT_MANIFEST_PATH = Path(".cache") / "sync-manifest.json"
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Record of one converted source note."""
+
+    source_hash: str
+    converter_version: int
+    output: str  # Output path, relative to the Hugo content directory
+    mtime_ns: int = 0
+    size: int = 0
+    links: dict[str, Optional[str]] = field(default_factory=dict)  # slug -> resolved URL
+    mtime_date: Optional[str] = None  # Fallback date taken from mtime, if used
+
+
+class SyncManifest:
+    """Source-to-output manifest persisted as JSON between sync runs."""
+
+    def __init__(self, path: Path, hugo_content_path: Path, exclude_drafts: bool):
+        self.path = path
+        self.hugo_content_path = hugo_content_path
+        self.exclude_drafts = exclude_drafts
+        self.entries: dict[str, ManifestEntry] = {}
+        self.owned: set[str] = set()  # Output paths (relative to content dir) sync wrote
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        hugo_content_path: Path,
+        exclude_drafts: bool,
+    ) -> "SyncManifest":
+        """
+        Load a manifest, starting empty if it is missing or was written for
+        a different target. If only the draft setting differs, the owned
+        outputs are kept (so they can be pruned) but every note is treated
+        as stale.
+
+        Args:
+            path: Path to the manifest file
+            hugo_content_path: Hugo content directory being synced to
+            exclude_drafts: Whether drafts are excluded from this sync
+
+        Returns:
+            SyncManifest (possibly empty)
+        """
+        manifest = cls(path, hugo_content_path, exclude_drafts)
+        if not path.exists():
+            return manifest
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("hugo_content") != str(hugo_content_path.resolve())
+        ):
+            return manifest
+
+        manifest.owned = set(data.get("owned", []))
+        if data.get("exclude_drafts") != exclude_drafts:
+            return manifest
+
+        for key, value in data.get("entries", {}).items():
+            try:
+                manifest.entries[key] = ManifestEntry(**value)
+            except TypeError:
+                continue
+
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "hugo_content": str(self.hugo_content_path.resolve()),
+            "exclude_drafts": self.exclude_drafts,
+            "owned": sorted(self.owned),
+            "entries": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+    def is_fresh(
+        self,
+        key: str,
+        source_path: Path,
+        target_file: Path,
+        converter_version: int,
+        content_index: dict[str, str],
+        stat: Optional[os.stat_result] = None,
+        assume_unchanged: bool = False,
+    ) -> bool:
+        """
+        Check whether a source note's existing output is still up to date.
+
+        A note is fresh when its bytes, the converter version, and the
+        resolution of every wikilink slug it uses all match the manifest,
+        and its output file still exists.
+
+        Args:
+            key: Manifest key for the source note
+            source_path: Path to the source note
+            target_file: Path the note converts to
+            converter_version: Current converter version
+            content_index: Current slug -> URL index
+            stat: The source's stat result, if already known
+            assume_unchanged: Trust that the source itself is unchanged (e.g.
+                the file watcher saw no event for it) and only check outputs
+                and link resolutions
+
+        Returns:
+            True if the note can be skipped
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.converter_version != converter_version:
+            return False
+
+        if entry.output != target_file.relative_to(self.hugo_content_path).as_posix():
+            return False
+        if not target_file.exists():
+            return False
+
+        if not assume_unchanged:
+            if stat is None:
+                stat = source_path.stat()
+            if stat.st_mtime_ns != entry.mtime_ns or stat.st_size != entry.size:
+                # Stat changed - fall back to comparing content
+                if hash_file(source_path) != entry.source_hash:
+                    return False
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+
+            if entry.mtime_date is not None:
+                if date.fromtimestamp(stat.st_mtime).isoformat() != entry.mtime_date:
+                    return False
+
+        # Dependency check: every link must resolve exactly as before
+        for slug, url in entry.links.items():
+            if content_index.get(slug) != url:
+                return False
+
+        return True
+
+    def record(
+        self,
+        key: str,
+        source_path: Path,
+        target_file: Path,
+        converter_version: int,
+        deps: dict,
+    ) -> None:
+        """
+        Record a freshly converted note.
+
+        Args:
+            key: Manifest key for the source note
+            source_path: Path to the source note
+            target_file: Path the note was converted to
+            converter_version: Current converter version
+            deps: Dependency info reported by the converter
+        """
+        stat = source_path.stat()
+        self.entries[key] = ManifestEntry(
+            source_hash=hash_file(source_path),
+            converter_version=converter_version,
+            output=target_file.relative_to(self.hugo_content_path).as_posix(),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            links=deps.get("links", {}),
+            mtime_date=deps.get("mtime_date"),
+        )
@@ -0,0 +1,222 @@
+"""Single-pass Obsidian -> Hugo markdown transformer.
+
+One precompiled tokenizer walks the document once and rewrites block
+references, wikilinks, embeds and callouts together. Fenced code blocks and
+inline code spans are recognised as tokens of their own and copied through
+untouched, so `[[...]]` written as code survives conversion.
+"""
+
+import re
+from typing import Callable, Optional
+
+from .wikilinks import default_link_resolver, slugify
+
+# Alternatives are tried left to right at each position; code comes first so
+# that nothing inside a code span or fence is rewritten.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<fence>
+        ^[ ]{0,3}(?P<fence_mark>`{3,}|~{3,})[^\n]*
+        (?:\n(?![ ]{0,3}(?P=fence_mark)[`~]*[ \t]*$)[^\n]*)*
+        (?:\n[ ]{0,3}(?P=fence_mark)[`~]*[ \t]*$|\Z)
+    )
+    | (?P<code>(?P<ticks>`+)[^\n]+?(?<!`)(?P=ticks)(?!`))
+    | (?P<callout>^>[ \t]*\[!(?P<callout_type>\w+)\][ \t]*(?P<callout_title>[^\n]*))
+    | (?P<embed>!\[\[(?P<embed_target>[^\]]+)\]\])
+    | (?P<wikilink>\[\[(?P<link_content>[^\]]+)\]\])
+    | (?P<block_ref>\s+\^(?P<block_id>[a-zA-Z0-9-]+)(?P<block_trailing>\s*)$)
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+_TOKEN_KINDS = ("fence", "code", "callout", "embed", "wikilink", "block_ref")
+
+
+def parse_wikilink(link_content: str) -> tuple[str, Optional[str], str]:
+    """
+    Split the inside of a [[wikilink]] into its parts.
+
+    Args:
+        link_content: Text between the brackets, e.g. "Page#Heading|Display"
+
+    Returns:
+        Tuple of (target, heading or None, display text)
+    """
+    display_text: Optional[str] = None
+    heading: Optional[str] = None
+
+    # Check for display text (pipe separator)
+    if "|" in link_content:
+        target, display_text = link_content.split("|", 1)
+    else:
+        target = link_content
+
+    # Check for heading anchor (including block references with ^)
+    if "#" in target:
+        target, heading = target.split("#", 1)
+
+    # Clean up the target
+    target = target.strip()
+
+    # Use display text or derive from target
+    if display_text is None:
+        # Use the last part of the path as display
+        display_text = target.split("/")[-1] if "/" in target else target
+
+    return target, heading, display_text
+
+
+def render_wikilink(
+    link_content: str,
+    base_path: str = "/",
+    link_resolver: Optional[Callable[[str], str]] = None,
+    collect_links: Optional[list[tuple[str, Optional[str]]]] = None,
+) -> str:
+    """
+    Render the inside of a [[wikilink]] as a markdown link.
+
+    Args:
+        link_content: Text between the brackets, e.g. "Page#Heading|Display"
+        base_path: Base path prefix for generated links
+        link_resolver: Optional function to resolve link targets
+        collect_links: If given, (target, heading) is appended to it
+
+    Returns:
+        Markdown link
+    """
+    target, heading, display_text = parse_wikilink(link_content)
+    if collect_links is not None:
+        collect_links.append((target, heading))
+
+    # Resolve the link URL
+    if link_resolver:
+        url = link_resolver(target)
+    else:
+        url = default_link_resolver(target, base_path)
+
+    # Add heading anchor if present
+    if heading:
+        if heading.startswith("^"):
+            # Block references: use the block ID directly (without ^)
+            url = f"{url}#{heading[1:]}"
+        else:
+            # Regular headings: slugify
+            url = f"{url}#{slugify(heading)}"
+
+    return f"[{display_text}]({url})"
+
+
+def render_embed(target: str) -> str:
+    """
+    Render the inside of an ![[embed]] as a plain markdown link.
+
+    Embedded content would need more work; for now it links to the page.
+    """
+    # Handle display text
+    if "|" in target:
+        target, display = target.split("|", 1)
+    else:
+        display = target
+
+    return f"[{display}](/{target.lower().replace(' ', '-')}/)"
+
+
+def render_callout(callout_type: str, title: str) -> str:
+    """Render an Obsidian callout header line as a styled blockquote header."""
+    callout_type = callout_type.lower()
+    title = title.strip()
+    if title:
+        return f"> **{title}**\n> \n> *({callout_type})*"
+    return f"> *({callout_type})*"
+
+
+def transform_markdown(
+    content: str,
+    link_resolver: Optional[Callable[[str], str]] = None,
+    base_path: str = "/",
+    block_refs: bool = True,
+    wikilinks: bool = True,
+    callouts: bool = True,
+    embeds: bool = True,
+    collect_links: Optional[list[tuple[str, Optional[str]]]] = None,
+) -> str:
+    """
+    Rewrite Obsidian syntax to Hugo markdown in a single pass.
+
+    Args:
+        content: Markdown body
+        link_resolver: Optional function to resolve wikilink targets
+        base_path: Base path prefix for default-resolved links
+        block_refs: Convert trailing ^block-id markers to HTML anchors
+        wikilinks: Convert [[wikilinks]] to markdown links
+        callouts: Convert > [!type] callout headers
+        embeds: Convert ![[embeds]] to links (if disabled while wikilinks
+            are enabled, the embed is treated as "!" followed by a wikilink)
+        collect_links: If given, (target, heading) of every converted
+            wikilink is appended to it, in document order
+
+    Returns:
+        Converted markdown
+    """
+    parts: list[str] = []
+    position = 0
+
+    for match in _TOKEN_PATTERN.finditer(content):
+        kind = next(name for name in _TOKEN_KINDS if match.group(name) is not None)
+
+        replacement: Optional[str] = None
+
+        if kind == "callout" and callouts:
+            title = transform_markdown(
+                match.group("callout_title"),
+                link_resolver=link_resolver,
+                base_path=base_path,
+                block_refs=block_refs,
+                wikilinks=wikilinks,
+                callouts=False,
+                embeds=embeds,
+                collect_links=collect_links,
+            )
+            replacement = render_callout(match.group("callout_type"), title)
+        elif kind == "callout":
+            # Callouts disabled: still convert the rest of the line
+            prefix_end = match.start("callout_title")
+            replacement = content[match.start():prefix_end] + transform_markdown(
+                match.group("callout_title"),
+                link_resolver=link_resolver,
+                base_path=base_path,
+                block_refs=block_refs,
+                wikilinks=wikilinks,
+                callouts=False,
+                embeds=embeds,
+                collect_links=collect_links,
+            )
+        elif kind == "embed" and embeds:
+            replacement = render_embed(match.group("embed_target"))
+            if collect_links is not None:
+                target, heading, _ = parse_wikilink(match.group("embed_target"))
+                collect_links.append((target, heading))
+        elif kind == "embed" and wikilinks:
+            replacement = "!" + render_wikilink(
+                match.group("embed_target"), base_path, link_resolver, collect_links
+            )
+        elif kind == "wikilink" and wikilinks:
+            replacement = render_wikilink(
+                match.group("link_content"), base_path, link_resolver, collect_links
+            )
+        elif kind == "block_ref" and block_refs:
+            block_id = match.group("block_id")
+            replacement = f' <span id="{block_id}"></span>{match.group("block_trailing")}'
+
+        if replacement is None:
+            # Code, or a construct whose rewrite is disabled: copy verbatim
+            continue
+
+        parts.append(content[position:match.start()])
+        parts.append(replacement)
+        position = match.end()
+
+    if not parts:
+        return content
+
+    parts.append(content[position:])
+    return "".join(parts)
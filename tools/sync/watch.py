@@ -0,0 +1,283 @@
+"""Watch the Obsidian vault and resync changed notes as they are saved.
+
+Uses Linux inotify (through ctypes, no extra dependency) where available and
+falls back to polling file stats elsewhere. Bursts of saves are debounced
+into a single incremental sync driven by the sync manifest, so only the
+touched notes and the notes whose links they affect are reconverted.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .converter import SyncResult, sync_vault
+from .manifest import DEFAULT_MANIFEST_PATH
+
+# inotify event masks (from <sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_hidden(path: Path) -> bool:
+    """True for dot-directories such as .obsidian and .git."""
+    return path.name.startswith(".")
+
+
+class InotifyWatcher:
+    """Recursive directory watcher built on Linux inotify."""
+
+    def __init__(self, roots: list[Path]):
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._wd_paths: dict[int, Path] = {}
+        for root in roots:
+            if root.exists():
+                self._add_tree(root)
+
+    def _add_tree(self, directory: Path) -> None:
+        """Watch a directory and all of its non-hidden subdirectories."""
+        for dirpath, dirnames, _ in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(dirpath), _WATCH_MASK
+            )
+            if wd >= 0:
+                self._wd_paths[wd] = Path(dirpath)
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        """
+        Wait for file events.
+
+        Args:
+            timeout: Seconds to wait (None = block until something happens)
+
+        Returns:
+            Set of paths that changed (empty on timeout)
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_IGNORED:
+                self._wd_paths.pop(wd, None)
+                continue
+
+            parent = self._wd_paths.get(wd)
+            if parent is None or not name:
+                continue
+
+            path = parent / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if _is_hidden(path):
+                    continue
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._add_tree(path)
+                changed.add(path)
+            elif path.suffix == ".md":
+                changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable watcher that compares mtime and size snapshots."""
+
+    def __init__(self, roots: list[Path], interval: float = 0.5):
+        self._roots = roots
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Record (mtime_ns, size) for every markdown file under the roots."""
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for root in self._roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for filename in filenames:
+                    if not filename.endswith(".md"):
+                        continue
+                    path = Path(dirpath) / filename
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        """
+        Sleep for one polling interval, then report changed files.
+
+        Args:
+            timeout: Maximum seconds to wait (None = one polling interval)
+
+        Returns:
+            Set of paths that were added, modified or removed
+        """
+        time.sleep(self._interval if timeout is None else min(timeout, self._interval))
+
+        snapshot = self._scan()
+        changed = {
+            path
+            for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc if it provides inotify, else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def make_watcher(
+    roots: list[Path],
+    force_polling: bool = False,
+    poll_interval: float = 0.5,
+) -> "InotifyWatcher | PollingWatcher":
+    """
+    Create the best available watcher for the given directories.
+
+    Args:
+        roots: Directories to watch recursively
+        force_polling: Use stat polling even if inotify is available
+        poll_interval: Seconds between polls for the polling watcher
+
+    Returns:
+        InotifyWatcher where supported, otherwise PollingWatcher
+    """
+    if not force_polling:
+        try:
+            return InotifyWatcher(roots)
+        except OSError:
+            pass
+    return PollingWatcher(roots, interval=poll_interval)
+
+
+def watch_vault(
+    obsidian_path: Path,
+    hugo_content_path: Path,
+    exclude_drafts: bool = True,
+    manifest_path: Path = DEFAULT_MANIFEST_PATH,
+    debounce: float = 0.2,
+    force_polling: bool = False,
+    poll_interval: float = 0.5,
+    on_sync: Optional[Callable[[SyncResult, set[Path], float], None]] = None,
+    link_graph_path: Optional[Path] = None,
+) -> None:
+    """
+    Resync the vault whenever notes change, until interrupted.
+
+    Each burst of events is debounced: after the first event, further events
+    are absorbed until the vault has been quiet for `debounce` seconds. The
+    batch then drives one incremental sync, which rewrites only outputs whose
+    bytes change and deletes outputs of removed sources.
+
+    Args:
+        obsidian_path: Path to Obsidian vault root
+        hugo_content_path: Path to Hugo content directory
+        exclude_drafts: Whether to exclude files in drafts/ folder
+        manifest_path: Path to the sync manifest
+        debounce: Quiet period (seconds) that ends a burst of saves
+        force_polling: Use stat polling even if inotify is available
+        poll_interval: Seconds between polls for the polling watcher
+        on_sync: Called after each sync with (result, changed paths, seconds)
+        link_graph_path: If given, keep the link graph up to date as well
+    """
+    roots = [obsidian_path, obsidian_path.parent / "archive"]
+    watcher = make_watcher(roots, force_polling=force_polling, poll_interval=poll_interval)
+
+    try:
+        while True:
+            changed = watcher.wait(None)
+            if not changed:
+                continue
+
+            # Debounce: keep absorbing events until the vault is quiet
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+
+            # A directory event covers every note inside it
+            for path in list(changed):
+                if path.is_dir():
+                    changed.update(path.rglob("*.md"))
+
+            started = time.perf_counter()
+            result = sync_vault(
+                obsidian_path,
+                hugo_content_path,
+                exclude_drafts=exclude_drafts,
+                manifest_path=manifest_path,
+                changed=changed,
+                link_graph_path=link_graph_path,
+            )
+            if on_sync is not None:
+                on_sync(result, changed, time.perf_counter() - started)
+    finally:
+        watcher.close()
@@ -1,8 +1,12 @@
 """Convert Obsidian wikilinks to Hugo-compatible markdown links."""
 
 import re
+from functools import lru_cache
 from typing import Callable, Optional
 
+# Pattern for wikilinks: [[target]] or [[target|display]]
+WIKILINK_PATTERN = re.compile(r"\[\[([^\]]+)\]\]")
+
 
 def convert_wikilinks(
     content: str,
@@ -18,7 +22,8 @@ def convert_wikilinks(
         link_resolver: Optional function to resolve link targets
 
     Returns:
-        Content with wikilinks converted to markdown links
+        Content with wikilinks converted to markdown links (code spans and
+        fenced code blocks are left untouched)
 
     Examples:
         [[Page Name]] -> [Page Name](/page-name/)
@@ -26,57 +31,16 @@ def convert_wikilinks(
         [[folder/Page Name]] -> [Page Name](/folder/page-name/)
         [[Page Name#Heading]] -> [Page Name](/page-name/#heading)
     """
-    # Pattern for wikilinks: [[target]] or [[target|display]]
-    wikilink_pattern = re.compile(r"\[\[([^\]]+)\]\]")
-
-    def replace_wikilink(match: re.Match) -> str:
-        link_content = match.group(1)
-
-        # Parse the wikilink components
-        display_text: Optional[str] = None
-        heading: Optional[str] = None
-
-        # Check for display text (pipe separator)
-        if "|" in link_content:
-            target, display_text = link_content.split("|", 1)
-        else:
-            target = link_content
-
-        # Check for heading anchor (including block references with ^)
-        if "#" in target:
-            target, heading = target.split("#", 1)
-
-        # Clean up the target
-        target = target.strip()
-
-        # Check if heading is a block reference (starts with ^)
-        is_block_ref = heading.startswith("^") if heading else False
-
-        # Use display text or derive from target
-        if display_text is None:
-            # Use the last part of the path as display
-            display_text = target.split("/")[-1] if "/" in target else target
-
-        # Resolve the link URL
-        if link_resolver:
-            url = link_resolver(target)
-        else:
-            url = default_link_resolver(target, base_path)
-
-        # Add heading anchor if present
-        if heading:
-            if is_block_ref:
-                # Block references: use the block ID directly (without ^)
-                block_id = heading[1:]  # Remove the ^ prefix
-                url = f"{url}#{block_id}"
-            else:
-                # Regular headings: slugify
-                heading_slug = slugify(heading)
-                url = f"{url}#{heading_slug}"
+    from .transform import transform_markdown
 
-        return f"[{display_text}]({url})"
-
-    return wikilink_pattern.sub(replace_wikilink, content)
+    return transform_markdown(
+        content,
+        link_resolver=link_resolver,
+        base_path=base_path,
+        block_refs=False,
+        callouts=False,
+        embeds=False,
+    )
 
 
 def convert_block_references(content: str) -> str:
@@ -95,17 +59,9 @@ def convert_block_references(content: str) -> str:
     Examples:
         "Some text ^my-block" -> "Some text <span id=\"my-block\"></span>"
     """
-    # Pattern for block references at end of line: ^block-id
-    # Must be at end of line (before newline or end of string)
-    # Captures trailing whitespace to preserve newlines
-    block_ref_pattern = re.compile(r"\s+\^([a-zA-Z0-9-]+)(\s*)$", re.MULTILINE)
-
-    def replace_block_ref(match: re.Match) -> str:
-        block_id = match.group(1)
-        trailing = match.group(2)  # Preserve any trailing whitespace/newlines
-        return f' <span id="{block_id}"></span>{trailing}'
+    from .transform import transform_markdown
 
-    return block_ref_pattern.sub(replace_block_ref, content)
+    return transform_markdown(content, wikilinks=False, callouts=False, embeds=False)
 
 
 def default_link_resolver(target: str, base_path: str = "/") -> str:
@@ -131,32 +87,105 @@ def default_link_resolver(target: str, base_path: str = "/") -> str:
     return f"{base_path}/{path}/"
 
 
+def resolve_link(target: str, content_index: dict[str, str]) -> str:
+    """
+    Resolve a wikilink target to a Hugo URL using the content index.
+
+    Args:
+        target: Wikilink target, e.g. "Page Name" or "arguments/epiphenomenalism"
+        content_index: Dict mapping page slugs to Hugo URLs
+
+    Returns:
+        Hugo URL (root-level fallback if the page is not indexed)
+    """
+    # Handle path-based targets like "arguments/epiphenomenalism"
+    if "/" in target:
+        parts = target.split("/")
+        slugified_parts = [slugify(part) for part in parts]
+        return "/" + "/".join(slugified_parts) + "/"
+    # Single-part target: look up in index
+    slug = slugify(target)
+    if slug in content_index:
+        return content_index[slug]
+    # Fallback to root-level path
+    return f"/{slug}/"
+
+
+def _build_ascii_slug_table() -> dict[int, Optional[str]]:
+    """Translation table doing lowercase + separator + filter in one step."""
+    table: dict[int, Optional[str]] = {}
+    for code in range(128):
+        char = chr(code).lower()
+        if char.isspace() or char == "_":
+            table[code] = "-"
+        elif not (char.isascii() and (char.isalnum() or char == "-")):
+            table[code] = None
+        elif char != chr(code):
+            table[code] = char
+    return table
+
+
+# Precompiled slug patterns (general path, for non-ASCII text)
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_]+")
+_SLUG_INVALID_PATTERN = re.compile(r"[^a-z0-9\-]")
+_SLUG_HYPHEN_RUN_PATTERN = re.compile(r"-{2,}")
+_ASCII_SLUG_TABLE = _build_ascii_slug_table()
+
+# Bounded so long-running processes (watch mode) cannot grow it without limit
+SLUGIFY_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=SLUGIFY_CACHE_SIZE)
 def slugify(text: str) -> str:
     """
     Convert text to URL-friendly slug.
 
+    Results are memoized in a bounded LRU cache; see slugify_cache_stats().
+
     Args:
         text: Text to slugify
 
     Returns:
         URL-friendly slug
     """
-    # Convert to lowercase
-    slug = text.lower()
+    if text.isascii():
+        # Lowercase, map separators to hyphens and drop everything else
+        # that is not [a-z0-9-] with a single translate()
+        slug = text.translate(_ASCII_SLUG_TABLE)
+    else:
+        # Convert to lowercase
+        slug = text.lower()
 
-    # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
+        # Replace spaces and underscores with hyphens
+        slug = _SLUG_SEPARATOR_PATTERN.sub("-", slug)
 
-    # Remove non-alphanumeric characters (except hyphens)
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
+        # Remove non-alphanumeric characters (except hyphens)
+        slug = _SLUG_INVALID_PATTERN.sub("", slug)
 
     # Remove consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
+    if "--" in slug:
+        slug = _SLUG_HYPHEN_RUN_PATTERN.sub("-", slug)
 
     # Remove leading/trailing hyphens
-    slug = slug.strip("-")
+    return slug.strip("-")
+
 
-    return slug
+def slugify_cache_stats() -> dict:
+    """
+    Report how well the slugify cache is doing.
+
+    Returns:
+        Dict with hits, misses, size, maxsize and hit_rate (0.0-1.0)
+    """
+    info = slugify.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
 
 
 def extract_wikilinks(content: str) -> list[dict]:
@@ -169,10 +198,9 @@ def extract_wikilinks(content: str) -> list[dict]:
     Returns:
         List of dicts with wikilink info
     """
-    wikilink_pattern = re.compile(r"\[\[([^\]]+)\]\]")
     links = []
 
-    for match in wikilink_pattern.finditer(content):
+    for match in WIKILINK_PATTERN.finditer(content):
         link_content = match.group(1)
 
         display_text = None
@@ -8,6 +8,11 @@ from tools.todo.processor import (
     TaskStatus,
     TaskType,
 )
+from tools.todo.index import TaskIndex
+from tools.todo.scan import scan_todo, TodoScan
+from tools.todo.compact import compact_todo, search_archive
+from tools.todo.graph import TaskGraph, TaskScheduler
+from tools.todo.dedup import DuplicateIndex, find_duplicates
 
 __all__ = [
     "parse_tasks",
@@ -16,4 +21,13 @@ __all__ = [
     "Task",
     "TaskStatus",
     "TaskType",
+    "TaskIndex",
+    "scan_todo",
+    "TodoScan",
+    "compact_todo",
+    "search_archive",
+    "TaskGraph",
+    "TaskScheduler",
+    "DuplicateIndex",
+    "find_duplicates",
 ]
@@ -0,0 +1,250 @@
+"""Compaction of todo.md's Completed Tasks section into monthly archives.
+
+Completed entries older than a cutoff are moved, byte for byte, into
+append-only shards next to todo.md (`todo-archive/YYYY-MM.md`, by completion
+date), and a one-line pointer to the archive is left in the Completed Tasks
+section. Every moved entry is also recorded in `todo-archive/index.jsonl`,
+so duplicate and veto checks can still find archived titles without reading
+the shards. Entries already in the index are not appended again, so an
+interrupted compaction can simply be rerun. The archive is not published:
+sync skips it (tools.sync.inventory.UNSYNCED_DIRS).
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .index import scan_blocks
+
+# Completed entries newer than this many days stay in todo.md
+DEFAULT_KEEP_DAYS = 30
+
+# Archive directory, next to todo.md
+ARCHIVE_DIRNAME = "todo-archive"
+
+# Title index of everything archived, one JSON object per line
+ARCHIVE_INDEX_NAME = "index.jsonl"
+
+# Left at the top of the Completed Tasks section
+ARCHIVE_POINTER = (
+    f"> Older completed tasks are archived by month in `{ARCHIVE_DIRNAME}/` (YYYY-MM.md)."
+)
+
+_DATED_HEADING_PATTERN = re.compile(r"^###\s+([✓✗])\s+(\d{4}-\d{2}-\d{2}):\s+(.+)$")
+
+_SHARD_HEADER = """---
+title: Completed Tasks {shard}
+created: {created}
+related_articles:
+  - "[[todo]]"
+---
+
+Completed tasks from [[todo]], archived by completion month. This file is
+append-only: compaction adds entries at the end and never rewrites them.
+
+"""
+
+
+@dataclass
+class ArchivedTask:
+    """Index record of one archived Completed Tasks entry."""
+
+    title: str
+    completed: str  # ISO date from the entry heading
+    status: str  # "completed" or "failed"
+    shard: str  # YYYY-MM
+    block_hash: str  # SHA-256 of the entry's bytes
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of compact_todo."""
+
+    archived: list[ArchivedTask] = field(default_factory=list)
+    shards: dict[str, int] = field(default_factory=dict)  # Shard -> entries appended
+    size_before: int = 0
+    size_after: int = 0
+
+
+def archive_dir_for(todo_path: Path) -> Path:
+    """Archive directory belonging to a todo file."""
+    return todo_path.parent / ARCHIVE_DIRNAME
+
+
+def load_archive_index(archive_dir: Path) -> list[ArchivedTask]:
+    """
+    Read the archive's title index.
+
+    Args:
+        archive_dir: Archive directory (see archive_dir_for)
+
+    Returns:
+        Archived entries in the order they were archived (empty if none)
+    """
+    try:
+        with open(archive_dir / ARCHIVE_INDEX_NAME, encoding="utf-8") as f:
+            return [ArchivedTask(**json.loads(line)) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def iter_archived_completions(archive_dir: Path) -> Iterator[str]:
+    """
+    Titles of archived tasks that completed successfully.
+
+    The index is only read once iteration starts, so this can be handed to
+    TaskGraph.build, which skips it when no task has a Blocked-by field.
+    """
+    for task in load_archive_index(archive_dir):
+        if task.status == "completed":
+            yield task.title
+
+
+def iter_archived_failures(archive_dir: Path) -> Iterator[str]:
+    """Titles of archived tasks that failed, read lazily like iter_archived_completions."""
+    for task in load_archive_index(archive_dir):
+        if task.status == "failed":
+            yield task.title
+
+
+def search_archive(archive_dir: Path, query: str) -> list[ArchivedTask]:
+    """
+    Archived entries whose title contains every word of the query.
+
+    Args:
+        archive_dir: Archive directory
+        query: Words to look for (case-insensitive)
+
+    Returns:
+        Matching entries, most recently completed first
+    """
+    words = query.lower().split()
+    matches = [
+        task for task in load_archive_index(archive_dir)
+        if all(word in task.title.lower() for word in words)
+    ]
+    return sorted(matches, key=lambda task: task.completed, reverse=True)
+
+
+def compact_todo(
+    todo_path: Path,
+    keep_days: int = DEFAULT_KEEP_DAYS,
+    archive_dir: Optional[Path] = None,
+    today: Optional[date] = None,
+    dry_run: bool = False,
+) -> CompactionResult:
+    """
+    Move old Completed Tasks entries from todo.md into monthly archives.
+
+    Only dated entries (`### ✓ YYYY-MM-DD: ...` or `### ✗ ...`) completed
+    more than keep_days ago are moved. Shards and the index are appended to
+    before todo.md is rewritten, and todo.md is replaced atomically.
+
+    Args:
+        todo_path: Path to todo.md
+        keep_days: Keep entries completed within this many days
+        archive_dir: Archive directory (default: todo-archive/ next to todo.md)
+        today: Date to count from (default: today)
+        dry_run: Report what would move without writing anything
+
+    Returns:
+        CompactionResult
+    """
+    archive_dir = archive_dir or archive_dir_for(todo_path)
+    today = today or date.today()
+    cutoff = today - timedelta(days=keep_days)
+
+    data = todo_path.read_bytes()
+    blocks, sections = scan_blocks(data)
+    result = CompactionResult(size_before=len(data), size_after=len(data))
+
+    known = {task.block_hash for task in load_archive_index(archive_dir)}
+    moving = []
+    for block in blocks:
+        match = _DATED_HEADING_PATTERN.match(block.heading)
+        if block.section != "completed" or not match:
+            continue
+        completed = date.fromisoformat(match.group(2))
+        if completed >= cutoff:
+            continue
+        task = ArchivedTask(
+            title=match.group(3).strip(),
+            completed=completed.isoformat(),
+            status="completed" if match.group(1) == "✓" else "failed",
+            shard=completed.strftime("%Y-%m"),
+            block_hash=hashlib.sha256(data[block.start : block.end]).hexdigest(),
+        )
+        moving.append((block, task))
+        result.archived.append(task)
+
+    if not moving:
+        return result
+
+    # Group new entries by shard, keeping their order in todo.md
+    appends: dict[str, list[bytes]] = {}
+    for block, task in moving:
+        if task.block_hash in known:
+            continue  # Archived by an earlier, interrupted run
+        text = data[block.start : block.end].rstrip(b"\n") + b"\n\n"
+        appends.setdefault(task.shard, []).append(text)
+        result.shards[task.shard] = result.shards.get(task.shard, 0) + 1
+
+    # Cut the moved blocks out, adding the pointer once
+    edits = [(block.start, block.end, b"") for block, _ in moving]
+    section_start, section_end = sections["completed"]
+    if ARCHIVE_POINTER.encode("utf-8") not in data[section_start:section_end]:
+        first = next(block.start for block in blocks if block.section == "completed")
+        edits.append((first, first, ARCHIVE_POINTER.encode("utf-8") + b"\n\n"))
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+
+    pieces = []
+    position = 0
+    for start, end, replacement in edits:
+        pieces.append(data[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(data[position:])
+    compacted = b"".join(pieces)
+    result.size_after = len(compacted)
+
+    if dry_run:
+        return result
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    for shard, texts in appends.items():
+        shard_path = archive_dir / f"{shard}.md"
+        with open(shard_path, "ab") as f:
+            if f.tell() == 0:
+                header = _SHARD_HEADER.format(shard=shard, created=today.isoformat())
+                f.write(header.encode("utf-8"))
+            f.writelines(texts)
+
+    with open(archive_dir / ARCHIVE_INDEX_NAME, "a", encoding="utf-8") as f:
+        for _, task in moving:
+            if task.block_hash not in known:
+                f.write(json.dumps(asdict(task), ensure_ascii=False) + "\n")
+
+    _replace_file(todo_path, compacted)
+    return result
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file and an atomic rename."""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
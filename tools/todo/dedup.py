@@ -0,0 +1,295 @@
+"""Near-duplicate detection for tasks, with MinHash and locality-sensitive hashing.
+
+Every task ever queued (active, blocked, vetoed, completed, and the
+completed tasks archived out of todo.md) is turned into two sets of word
+shingles, one for its title and one for its notes. Each set gets a MinHash
+signature, and the signatures are cut into bands that are hashed into
+buckets. Only tasks sharing a bucket become candidates, and candidates are
+confirmed by the exact Jaccard similarity of their shingles. Checking a new
+task therefore costs a few dictionary lookups rather than a comparison with
+every task in the history.
+
+Titles follow a few templates ("Cross-review X considering Y insights"), so
+title matches need a high similarity; notes are free text, so a lower one
+already means the same idea is being proposed again.
+
+With NumPy installed (the "fast" extra), signatures are computed
+vectorized; without it, the same arithmetic runs in plain Python.
+"""
+
+import random
+import re
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # Optional ("fast" extra): only makes signatures faster
+    HAS_NUMPY = False
+
+from .compact import archive_dir_for
+from .index import scan_blocks
+
+# Signature length per field
+NUM_PERM = 64
+
+# Field -> (Jaccard similarity that counts as a duplicate, signature rows per LSH band)
+FIELD_THRESHOLDS: dict[str, tuple[float, int]] = {
+    "title": (0.75, 4),  # 16 bands: a 0.75 match shares a bucket with p > 0.99
+    "notes": (0.5, 2),  # 32 bands: a 0.5 match shares a bucket with p > 0.9999
+}
+
+# Mersenne prime for the universal hash family (a * x + b) mod p
+_PRIME = (1 << 31) - 1
+
+# Words too common to say anything about a task
+_STOPWORDS = frozenset(
+    "a an and as at be by for from in into is it its of on or that the this to with".split()
+)
+
+_TITLE_PREFIX_PATTERN = re.compile(r"^###\s+(?:P[0-3]:|[✓✗]\s+[\d-]+:)?\s*", re.IGNORECASE)
+_VETO_PATTERN = re.compile(r"\s*#veto\b", re.IGNORECASE)
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass
+class TaskRecord:
+    """A task from todo.md or its archive, as seen by the duplicate check."""
+
+    title: str
+    notes: str
+    section: str  # active, blocked, vetoed or completed
+    source: str  # File it came from, relative to the todo directory
+
+
+@dataclass
+class DuplicateMatch:
+    """An existing task that a proposed task repeats."""
+
+    record: TaskRecord
+    similarity: float  # Jaccard similarity of the matching field
+    field: str  # "title" or "notes"
+
+
+def shingles(text: str) -> set[str]:
+    """
+    Word shingles of a title or notes string.
+
+    Words and adjacent word pairs, lowercased, with hyphens and file
+    extensions splitting words ("implicit-memory.md" reads as
+    "implicit memory md") and stopwords dropped.
+    """
+    words = [word for word in _WORD_PATTERN.findall(text.lower()) if word not in _STOPWORDS]
+    return set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+def jaccard(first: set[str], second: set[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """MinHash signatures from a fixed, seeded family of hash functions."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.coefficients = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+        if HAS_NUMPY:
+            self._a = np.array([a for a, _ in self.coefficients], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self.coefficients], dtype=np.uint64)[:, None]
+
+    def signature(
+        self,
+        shingle_set: set[str],
+        use_numpy: Optional[bool] = None,
+    ) -> tuple[int, ...]:
+        """
+        MinHash signature of a shingle set.
+
+        Args:
+            shingle_set: Shingles (must not be empty)
+            use_numpy: Force (True) or avoid (False) NumPy; default: use it if installed
+
+        Returns:
+            One minimum per hash function
+        """
+        values = [zlib.crc32(shingle.encode("utf-8")) % _PRIME for shingle in shingle_set]
+        if use_numpy is None:
+            use_numpy = HAS_NUMPY
+        if use_numpy:
+            x = np.array(values, dtype=np.uint64)[None, :]
+            return tuple(((self._a * x + self._b) % _PRIME).min(axis=1).tolist())
+        return tuple(min([(a * x + b) % _PRIME for x in values]) for a, b in self.coefficients)
+
+
+@dataclass
+class _FieldIndex:
+    """LSH buckets and shingles for one field of every record."""
+
+    threshold: float
+    rows: int
+    shingles: list[set[str]] = field(default_factory=list)
+    buckets: dict[tuple, list[int]] = field(default_factory=dict)
+
+    def bands(self, signature: tuple[int, ...]) -> list[tuple]:
+        """Bucket keys of a signature (band number, then the band's rows)."""
+        return [
+            (start, *signature[start : start + self.rows])
+            for start in range(0, len(signature) - self.rows + 1, self.rows)
+        ]
+
+
+class DuplicateIndex:
+    """LSH index of task titles and notes."""
+
+    def __init__(self, num_perm: int = NUM_PERM):
+        self.hasher = MinHasher(num_perm)
+        self.records: list[TaskRecord] = []
+        self.fields = {
+            name: _FieldIndex(threshold, rows)
+            for name, (threshold, rows) in FIELD_THRESHOLDS.items()
+        }
+
+    @classmethod
+    def from_todo(cls, todo_path: Path, archive_dir: Optional[Path] = None) -> "DuplicateIndex":
+        """Index every task in todo.md and its archive."""
+        index = cls()
+        for record in load_task_records(todo_path, archive_dir):
+            index.add(record)
+        return index
+
+    def _field_shingles(self, title: str, notes: str) -> dict[str, set[str]]:
+        """Shingles of each indexed field."""
+        return {"title": shingles(title), "notes": shingles(notes)}
+
+    def add(self, record: TaskRecord) -> None:
+        """Add a task to the index."""
+        position = len(self.records)
+        self.records.append(record)
+        for name, shingle_set in self._field_shingles(record.title, record.notes).items():
+            index = self.fields[name]
+            index.shingles.append(shingle_set)
+            if shingle_set:
+                for key in index.bands(self.hasher.signature(shingle_set)):
+                    index.buckets.setdefault(key, []).append(position)
+
+    def query(self, title: str, notes: str = "") -> list[DuplicateMatch]:
+        """
+        Existing tasks that a proposed task would repeat.
+
+        Args:
+            title: Proposed task title
+            notes: Proposed task notes
+
+        Returns:
+            Matches, most similar first (one per existing task)
+        """
+        best: dict[int, DuplicateMatch] = {}
+        for name, shingle_set in self._field_shingles(title, notes).items():
+            if not shingle_set:
+                continue
+            index = self.fields[name]
+            candidates = {
+                position
+                for key in index.bands(self.hasher.signature(shingle_set))
+                for position in index.buckets.get(key, ())
+            }
+            for position in candidates:
+                similarity = jaccard(shingle_set, index.shingles[position])
+                if similarity >= index.threshold and (
+                    position not in best or similarity > best[position].similarity
+                ):
+                    best[position] = DuplicateMatch(self.records[position], similarity, name)
+        return sorted(best.values(), key=lambda match: -match.similarity)
+
+    def pairs(self) -> list[tuple[TaskRecord, TaskRecord, DuplicateMatch]]:
+        """
+        Near-duplicate pairs among the indexed tasks.
+
+        Returns:
+            (first, second, match) triples, most similar first, where match
+            describes second as a duplicate of first
+        """
+        found: dict[tuple[int, int], tuple[float, str]] = {}
+        for name, index in self.fields.items():
+            checked: set[tuple[int, int]] = set()
+            for members in index.buckets.values():
+                for i, first in enumerate(members):
+                    for second in members[i + 1 :]:
+                        pair = (first, second)
+                        if pair in checked:
+                            continue
+                        checked.add(pair)
+                        similarity = jaccard(index.shingles[first], index.shingles[second])
+                        if similarity < index.threshold:
+                            continue
+                        if pair not in found or similarity > found[pair][0]:
+                            found[pair] = (similarity, name)
+
+        results = [
+            (
+                self.records[first],
+                self.records[second],
+                DuplicateMatch(self.records[second], similarity, name),
+            )
+            for (first, second), (similarity, name) in found.items()
+        ]
+        return sorted(results, key=lambda result: -result[2].similarity)
+
+
+def _records_from(data: bytes, source: str, section: str = "preamble") -> Iterable[TaskRecord]:
+    """Task records for the `###` blocks in a todo or archive file."""
+    blocks, _ = scan_blocks(data, section=section)
+    for block in blocks:
+        title = _VETO_PATTERN.sub("", _TITLE_PREFIX_PATTERN.sub("", block.heading)).strip()
+        notes = next(
+            (
+                line.split(":", 1)[1].strip()
+                for line in block.body_lines
+                if line.strip().startswith("- **Notes**:")
+            ),
+            "",
+        )
+        yield TaskRecord(title=title, notes=notes, section=block.section, source=source)
+
+
+def load_task_records(todo_path: Path, archive_dir: Optional[Path] = None) -> list[TaskRecord]:
+    """
+    Every task in todo.md and in its archive shards.
+
+    Args:
+        todo_path: Path to todo.md
+        archive_dir: Archive directory (default: todo-archive/ next to todo.md)
+
+    Returns:
+        TaskRecords, todo.md first, then the shards oldest first
+    """
+    archive_dir = archive_dir or archive_dir_for(todo_path)
+    records = list(_records_from(todo_path.read_bytes(), todo_path.name))
+    for shard in sorted(archive_dir.glob("*.md")):
+        source = f"{archive_dir.name}/{shard.name}"
+        records.extend(_records_from(shard.read_bytes(), source, section="completed"))
+    return records
+
+
+def find_duplicates(todo_path: Path, title: str, notes: str = "") -> list[DuplicateMatch]:
+    """
+    Tasks in todo.md or its archive that a proposed task would repeat.
+
+    Args:
+        todo_path: Path to todo.md
+        title: Proposed task title
+        notes: Proposed task notes
+
+    Returns:
+        Matches, most similar first (empty if the task is new)
+    """
+    return DuplicateIndex.from_todo(todo_path).query(title, notes)
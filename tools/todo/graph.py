@@ -0,0 +1,245 @@
+"""Dependency graph of active tasks, built from their Blocked-by fields.
+
+A `- **Blocked-by**:` field names one or more tasks by title, separated by
+semicolons. A reference to another active task is an edge in the graph.
+Only a successful (`✓`) completion, in todo.md or its archive, satisfies a
+reference. A reference to a task that is blocked, failed or vetoed is
+unmet and keeps blocking, like an active prerequisite that is in progress.
+A reference that matches nothing at all (a typo, or a task that was
+removed) does not block; it is kept in `unresolved` so `process_todo.py
+deps` can report it. Tasks on or behind a dependency cycle can never start;
+the cycles are reported so a human can break them.
+
+TaskScheduler keeps the ready tasks in a heap ordered like get_next_task
+(priority, then file order) and releases dependents as tasks complete, so
+each completion costs O(dependents x log n) rather than a rescan.
+"""
+
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+from .processor import TaskStatus
+
+if TYPE_CHECKING:
+    from .index import TaskEntry
+    from .processor import Task
+
+# Prefixes a reference may carry: "P1: ..." or "✓ 2026-01-19: ..."
+_REFERENCE_PREFIX_PATTERN = re.compile(r"^(?:P[0-3]|[✓✗]\s+[\d-]+):\s+", re.IGNORECASE)
+
+
+def normalize_title(title: str) -> str:
+    """Title as compared when resolving Blocked-by references."""
+    title = title.strip().strip("`\"'").removeprefix("[[").removesuffix("]]")
+    title = _REFERENCE_PREFIX_PATTERN.sub("", title.strip())
+    return " ".join(title.rstrip(".").split()).casefold()
+
+
+def blocker_references(blocked_by: Optional[str]) -> list[str]:
+    """Normalized titles named by a Blocked-by field."""
+    if not blocked_by:
+        return []
+    return [ref for ref in (normalize_title(part) for part in blocked_by.split(";")) if ref]
+
+
+def _status(task: "Task | TaskEntry") -> str:
+    """Status value of a Task (enum) or TaskEntry (string)."""
+    if isinstance(task.status, TaskStatus):
+        return task.status.value
+    return task.status or ""
+
+
+@dataclass
+class TaskGraph:
+    """Blocked-by edges between active tasks, by position in the task list."""
+
+    titles: list[str]
+    priorities: list[int]
+    line_numbers: list[int]
+    pending: list[bool]
+    blockers: list[set[int]]  # Active tasks each task waits for
+    dependents: list[set[int]]  # Active tasks waiting for each task
+    unmet: list[list[str]] = field(default_factory=list)  # Blocked, failed or vetoed tasks
+    unresolved: list[list[str]] = field(default_factory=list)  # References matching nothing
+    cycles: list[list[int]] = field(default_factory=list)
+    stuck: set[int] = field(default_factory=set)  # On or behind a cycle
+    _descendants: list[int] = field(default_factory=list, repr=False)  # Transitive dependents
+
+    @classmethod
+    def build(
+        cls,
+        tasks: Sequence,
+        completed_titles: Iterable[str] = (),
+        unmet_titles: Iterable[str] = (),
+    ) -> "TaskGraph":
+        """
+        Build the graph over active tasks.
+
+        completed_titles and unmet_titles are only iterated if some task has
+        a Blocked-by field, so they can be lazy generators over the archive.
+
+        Args:
+            tasks: Active tasks (Task or TaskEntry), vetoed ones excluded
+            completed_titles: Titles of successfully completed tasks
+            unmet_titles: Titles of other known tasks that will not complete
+                on their own (blocked, failed or vetoed)
+
+        Returns:
+            TaskGraph
+        """
+        count = len(tasks)
+        graph = cls(
+            titles=[task.title for task in tasks],
+            priorities=[task.priority for task in tasks],
+            line_numbers=[task.line_number for task in tasks],
+            pending=[_status(task) == "pending" for task in tasks],
+            blockers=[set() for _ in range(count)],
+            dependents=[set() for _ in range(count)],
+            unmet=[[] for _ in range(count)],
+            unresolved=[[] for _ in range(count)],
+        )
+
+        references = [blocker_references(task.blocked_by) for task in tasks]
+        if any(references):
+            positions: dict[str, list[int]] = {}
+            for i, title in enumerate(graph.titles):
+                positions.setdefault(normalize_title(title), []).append(i)
+            completed = {normalize_title(title) for title in completed_titles}
+            unmet = {normalize_title(title) for title in unmet_titles} - completed
+
+            for i, refs in enumerate(references):
+                for ref in refs:
+                    if ref in positions:
+                        for blocker in positions[ref]:
+                            graph.blockers[i].add(blocker)
+                            graph.dependents[blocker].add(i)
+                    elif ref in unmet:
+                        graph.unmet[i].append(ref)
+                    elif ref not in completed:
+                        graph.unresolved[i].append(ref)
+
+        graph._order()
+        return graph
+
+    def _order(self) -> None:
+        """Topologically sort (Kahn), recording cycles and transitive dependents."""
+        count = len(self.titles)
+        waiting = [len(blockers) for blockers in self.blockers]
+        queue = [i for i in range(count) if waiting[i] == 0]
+        order = []
+        while queue:
+            node = queue.pop()
+            order.append(node)
+            for dependent in self.dependents[node]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    queue.append(dependent)
+
+        self.stuck = set(range(count)) - set(order)
+        self.cycles = _find_cycles(self.stuck, self.blockers)
+
+        # Stuck tasks can never finish, so they unlock nothing
+        self._descendants = [0] * count
+        for node in reversed(order):
+            mask = 0
+            for dependent in self.dependents[node]:
+                if dependent not in self.stuck:
+                    mask |= (1 << dependent) | self._descendants[dependent]
+            self._descendants[node] = mask
+
+    def is_blocked(self, i: int) -> bool:
+        """True if task i waits on an active task, an unmet reference or a cycle."""
+        return bool(self.blockers[i] or self.unmet[i] or i in self.stuck)
+
+    def unlocks_count(self, i: int) -> int:
+        """Number of tasks that transitively wait for task i."""
+        return bin(self._descendants[i]).count("1")
+
+    def cycle_titles(self) -> list[list[str]]:
+        """Each dependency cycle, as task titles."""
+        return [[self.titles[i] for i in cycle] for cycle in self.cycles]
+
+
+def _find_cycles(stuck: set[int], blockers: list[set[int]]) -> list[list[int]]:
+    """
+    One cycle through each group of stuck tasks.
+
+    Every stuck task waits for another stuck task, so following blockers
+    from any of them must come back to a task already visited.
+    """
+    cycles = []
+    seen: set[int] = set()
+    for start in sorted(stuck):
+        path: list[int] = []
+        position: dict[int, int] = {}
+        node = start
+        while node not in position and node not in seen:
+            position[node] = len(path)
+            path.append(node)
+            node = min(blocker for blocker in blockers[node] if blocker in stuck)
+        if node in position:
+            cycles.append(path[position[node] :])
+        seen.update(path)
+    return cycles
+
+
+class TaskScheduler:
+    """Ready tasks in a heap, released as the tasks they wait for complete."""
+
+    def __init__(self, graph: TaskGraph):
+        self.graph = graph
+        self._waiting = [len(blockers) for blockers in graph.blockers]
+        self._done: set[int] = set()
+        self._heap: list[tuple[int, int, int]] = []
+        for i in range(len(graph.titles)):
+            self._release(i)
+
+    def _release(self, i: int) -> None:
+        """Queue task i if it is pending and nothing holds it back."""
+        graph = self.graph
+        if (
+            graph.pending[i]
+            and self._waiting[i] == 0
+            and not graph.unmet[i]
+            and i not in graph.stuck
+            and i not in self._done
+        ):
+            heapq.heappush(self._heap, (graph.priorities[i], graph.line_numbers[i], i))
+
+    def peek(self) -> Optional[int]:
+        """The next ready task (highest priority, then first in file), or None."""
+        while self._heap and self._heap[0][2] in self._done:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    def pop(self) -> Optional[int]:
+        """Remove and return the next ready task."""
+        i = self.peek()
+        if i is not None:
+            heapq.heappop(self._heap)
+        return i
+
+    def complete(self, i: int) -> list[int]:
+        """
+        Mark task i completed, releasing tasks that were waiting only for it.
+
+        Args:
+            i: Task position
+
+        Returns:
+            Positions of the tasks that became ready
+        """
+        if i in self._done:
+            return []
+        self._done.add(i)
+        released = []
+        for dependent in self.graph.dependents[i]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                before = len(self._heap)
+                self._release(dependent)
+                if len(self._heap) > before:
+                    released.append(dependent)
+        return released
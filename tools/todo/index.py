@@ -0,0 +1,437 @@
+"""Byte-offset index of the task blocks in todo.md.
+
+todo.md keeps growing (the Completed section never shrinks), yet most
+operations only care about a handful of active tasks. TaskIndex records,
+for every `###` block, its byte range, section, parsed fields and a hash of
+its bytes. The index is saved in a sidecar file and trusted while the todo
+file's mtime and size are unchanged. Picking the next task then needs no
+read of todo.md at all, reading a task reads only its own byte range, and
+editing a task rewrites the file only from that task onward.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .processor import (
+    COMPLETED_HEADING_PATTERN,
+    TASK_HEADING_PATTERN,
+    VETO_TAG_PATTERN,
+    Task,
+    TaskStatus,
+    _parse_task_block,
+)
+
+if TYPE_CHECKING:
+    from .graph import TaskGraph
+
+# Bump when the sidecar layout changes
+TODO_INDEX_FORMAT = 1
+
+# Default sidecar location, relative to the repository root
+DEFAULT_TODO_INDEX_PATH = Path(".cache") / "todo-index.json"
+
+# Second-level headings that start a task section
+SECTION_HEADINGS = {
+    "## Active Tasks": "active",
+    "## Completed Tasks": "completed",
+    "## Blocked Tasks": "blocked",
+    "## Vetoed Tasks": "vetoed",
+}
+
+
+@dataclass
+class TaskBlock:
+    """A `###` block found by scan_blocks."""
+
+    section: str  # preamble, active, completed, blocked or vetoed
+    heading: str
+    body_lines: list[str]  # Lines after the heading, as parse_tasks splits them
+    start: int  # Byte offset of the heading line
+    end: int  # Byte offset just past the block
+    line_number: int  # 0-based line of the heading
+    end_line: int = 0  # 0-based line just past the block
+
+    @property
+    def is_task(self) -> bool:
+        """True for `### P<n>: ...` task headings (and #veto-tagged ones)."""
+        return bool(
+            TASK_HEADING_PATTERN.match(self.heading) or VETO_TAG_PATTERN.search(self.heading)
+        )
+
+
+def scan_blocks(
+    data: bytes,
+    section: str = "preamble",
+) -> tuple[list[TaskBlock], dict[str, tuple[int, int]]]:
+    """
+    Split todo.md into `###` blocks with their byte ranges, in one pass.
+
+    A block runs from its heading to the next `###` or `##` heading. Text
+    between a section heading and its first block belongs to no block, and
+    `###` headings in the preamble are not blocks.
+
+    Args:
+        data: Raw todo.md content
+        section: Section the data starts in (for scanning part of a file)
+
+    Returns:
+        Tuple of (blocks in file order, section name -> (start, end) byte range)
+    """
+    blocks: list[TaskBlock] = []
+    sections: dict[str, tuple[int, int]] = {}
+    section_start = 0
+    current: Optional[TaskBlock] = None
+
+    offset = 0
+    lines = data.splitlines(keepends=True)
+    for line_number, raw in enumerate(lines):
+        if raw.startswith(b"#"):
+            line = raw.decode("utf-8").removesuffix("\n")
+            if line.startswith("## ") or line.startswith("### "):
+                if current is not None:
+                    current.end = offset
+                    current.end_line = line_number
+                    current = None
+                name = next(
+                    (name for prefix, name in SECTION_HEADINGS.items() if line.startswith(prefix)),
+                    None,
+                )
+                if name is not None:
+                    sections[section] = (section_start, offset)
+                    section, section_start = name, offset
+                elif line.startswith("### ") and section != "preamble":
+                    current = TaskBlock(section, line, [], offset, offset, line_number)
+                    blocks.append(current)
+                offset += len(raw)
+                continue
+
+        if current is not None:
+            current.body_lines.append(raw.decode("utf-8").removesuffix("\n"))
+        offset += len(raw)
+
+    if current is not None:
+        current.end = offset
+        current.end_line = len(lines)
+        if data.endswith(b"\n"):
+            # str.split("\n") (as parse_tasks uses) yields a final empty line
+            current.body_lines.append("")
+            current.end_line += 1
+    sections[section] = (section_start, offset)
+    return blocks, sections
+
+
+@dataclass
+class TaskEntry:
+    """Index record of one `###` block."""
+
+    title: str
+    section: str
+    start: int
+    end: int
+    line_number: int
+    block_hash: str  # SHA-256 of the block's bytes
+    priority: Optional[int] = None  # Active tasks only
+    status: Optional[str] = None  # TaskStatus value
+    task_type: Optional[str] = None  # TaskType value
+    blocked_by: Optional[str] = None
+    vetoed: bool = False  # Heading carries #veto
+
+
+def _entry_for(block: TaskBlock, data: bytes, task: Optional[Task] = None) -> TaskEntry:
+    """Index record for a scanned block (task: the block already parsed, if it is a task)."""
+    block_hash = hashlib.sha256(data[block.start : block.end]).hexdigest()
+    entry = TaskEntry(
+        title=block.heading[4:].strip(),
+        section=block.section,
+        start=block.start,
+        end=block.end,
+        line_number=block.line_number,
+        block_hash=block_hash,
+    )
+
+    if block.is_task:
+        if task is None:
+            task = _parse_task_block(block.heading, block.body_lines, block.line_number)
+        if task is not None:
+            entry.title = task.title
+            entry.priority = task.priority
+            entry.status = task.status.value
+            entry.task_type = task.task_type.value
+            entry.blocked_by = task.blocked_by
+            entry.vetoed = bool(VETO_TAG_PATTERN.search(block.heading))
+        return entry
+
+    match = COMPLETED_HEADING_PATTERN.match(block.heading)
+    if match:
+        entry.title = match.group(1).strip()
+        entry.status = (
+            TaskStatus.COMPLETED.value if "✓" in block.heading else TaskStatus.FAILED.value
+        )
+    elif block.section == "vetoed":
+        entry.status = TaskStatus.VETOED.value
+    return entry
+
+
+def reference_titles(entries: Iterable[TaskEntry]) -> tuple[list[str], list[str]]:
+    """
+    Titles outside the active tasks that a Blocked-by reference can name.
+
+    Args:
+        entries: Entries of every block in todo.md
+
+    Returns:
+        Tuple of (titles completed with ✓, titles of failed, blocked and
+        vetoed tasks)
+    """
+    completed: list[str] = []
+    unmet: list[str] = []
+    for entry in entries:
+        if entry.section == "completed":
+            if entry.status == TaskStatus.COMPLETED.value:
+                completed.append(entry.title)
+            elif entry.status == TaskStatus.FAILED.value:
+                unmet.append(entry.title)
+        elif entry.section in ("blocked", "vetoed") or (entry.section == "active" and entry.vetoed):
+            unmet.append(entry.title)
+    return completed, unmet
+
+
+@dataclass
+class TaskIndex:
+    """Byte-offset index of a todo file, valid for one (mtime, size)."""
+
+    todo_path: Path
+    mtime_ns: int
+    size: int
+    entries: list[TaskEntry] = field(default_factory=list)
+    sections: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, todo_path: Path) -> "TaskIndex":
+        """Index a todo file with one read and one scan."""
+        with open(todo_path, "rb") as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+        blocks, sections = scan_blocks(data)
+        return cls(
+            todo_path=todo_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            entries=[_entry_for(block, data) for block in blocks],
+            sections=sections,
+        )
+
+    @classmethod
+    def load(cls, todo_path: Path, index_path: Optional[Path] = None) -> "TaskIndex":
+        """
+        Load the sidecar index, rebuilding it if the todo file has changed.
+
+        Args:
+            todo_path: Path to todo.md
+            index_path: Sidecar file (None = build in memory, never saved)
+
+        Returns:
+            TaskIndex matching the file as it is now
+        """
+        if index_path is not None:
+            index = cls.saved(todo_path, index_path)
+            if index is not None:
+                return index
+
+        index = cls.build(todo_path)
+        if index_path is not None:
+            index.save(index_path)
+        return index
+
+    @classmethod
+    def saved(cls, todo_path: Path, index_path: Path) -> Optional["TaskIndex"]:
+        """The saved index, if it still describes todo_path."""
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            stat = todo_path.stat()
+        except (OSError, ValueError):
+            return None
+
+        if (
+            data.get("format") != TODO_INDEX_FORMAT
+            or data.get("path") != str(todo_path.resolve())
+            or data.get("mtime_ns") != stat.st_mtime_ns
+            or data.get("size") != stat.st_size
+        ):
+            return None
+
+        return cls(
+            todo_path=todo_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            entries=[TaskEntry(**entry) for entry in data["entries"]],
+            sections={name: tuple(span) for name, span in data["sections"].items()},
+        )
+
+    def save(self, index_path: Path) -> None:
+        """Write the index to its sidecar file."""
+        data = {
+            "format": TODO_INDEX_FORMAT,
+            "path": str(self.todo_path.resolve()),
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "sections": self.sections,
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(json.dumps(data), encoding="utf-8")
+
+    def tasks(self, section: str = "active") -> list[TaskEntry]:
+        """Entries in one section, in file order."""
+        return [entry for entry in self.entries if entry.section == section]
+
+    def find(self, title: str, section: str = "active") -> Optional[TaskEntry]:
+        """First entry in a section with exactly this title."""
+        return next((e for e in self.tasks(section) if e.title == title), None)
+
+    def _read_range(self, entry: TaskEntry) -> bytes:
+        """The bytes of one block, checked against the indexed hash."""
+        with open(self.todo_path, "rb") as f:
+            f.seek(entry.start)
+            data = f.read(entry.end - entry.start)
+        if hashlib.sha256(data).hexdigest() != entry.block_hash:
+            raise ValueError(f"{self.todo_path} changed since it was indexed")
+        return data
+
+    def read_block(self, entry: TaskEntry) -> str:
+        """Text of one block, reading only its byte range."""
+        return self._read_range(entry).decode("utf-8")
+
+    def read_task(self, entry: TaskEntry) -> Optional[Task]:
+        """Parse one active task, reading only its byte range."""
+        text = self.read_block(entry)
+        if entry.end < self.size:
+            # The final newline separates this block from the next heading
+            text = text[:-1]
+        heading, *body_lines = text.split("\n")
+        return _parse_task_block(heading, body_lines, entry.line_number)
+
+    def graph(self) -> tuple[list[TaskEntry], "TaskGraph"]:
+        """
+        Blocked-by dependency graph of the active (non-vetoed) entries.
+
+        The archive of completed and failed tasks is only read if some entry
+        has a Blocked-by field.
+
+        Returns:
+            Tuple of (active entries, TaskGraph over them by position)
+        """
+        from .compact import archive_dir_for, iter_archived_completions, iter_archived_failures
+        from .graph import TaskGraph
+
+        active = [entry for entry in self.tasks("active") if not entry.vetoed]
+        completed, unmet = reference_titles(self.entries)
+        archive_dir = archive_dir_for(self.todo_path)
+        return active, TaskGraph.build(
+            active,
+            chain(completed, iter_archived_completions(archive_dir)),
+            chain(unmet, iter_archived_failures(archive_dir)),
+        )
+
+    def iter_pending(self) -> Iterator[TaskEntry]:
+        """Active entries that are pending and not blocked, in file order."""
+        active, graph = self.graph()
+        for i, entry in enumerate(active):
+            if entry.status == TaskStatus.PENDING.value and not graph.is_blocked(i):
+                yield entry
+
+    def next_task(self) -> Optional[Task]:
+        """
+        The highest-priority pending task, as get_next_task picks it.
+
+        Only the chosen task's bytes are read.
+
+        Returns:
+            Task, or None if nothing is pending
+        """
+        from .graph import TaskScheduler
+
+        active, graph = self.graph()
+        best = TaskScheduler(graph).peek()
+        return self.read_task(active[best]) if best is not None else None
+
+    def replace_block(self, entry: TaskEntry, text: str) -> None:
+        """
+        Replace one block in the todo file and update the index in place.
+
+        Bytes before the block are not rewritten, and later entries are
+        shifted rather than rescanned.
+
+        Args:
+            entry: Entry to replace (from this index)
+            text: New `###` block(s), including the trailing blank line
+
+        Raises:
+            ValueError: If the file no longer matches the index
+        """
+        old_lines = self._read_range(entry).count(b"\n")
+        new_bytes = text.encode("utf-8")
+        delta = len(new_bytes) - (entry.end - entry.start)
+        line_delta = new_bytes.count(b"\n") - old_lines
+
+        with open(self.todo_path, "r+b") as f:
+            f.seek(entry.end)
+            tail = f.read()
+            f.seek(entry.start)
+            f.write(new_bytes)
+            f.write(tail)
+            f.truncate()
+            f.flush()
+            stat = os.fstat(f.fileno())
+
+        blocks, _ = scan_blocks(new_bytes, section=entry.section)
+        replacements = [_entry_for(block, new_bytes) for block in blocks]
+        for replacement in replacements:
+            replacement.start += entry.start
+            replacement.end += entry.start
+            replacement.line_number += entry.line_number
+
+        position = self.entries.index(entry)
+        for later in self.entries[position + 1 :]:
+            later.start += delta
+            later.end += delta
+            later.line_number += line_delta
+        self.entries[position : position + 1] = replacements
+
+        self.sections = {
+            name: (
+                start + delta if start >= entry.end else start,
+                end + delta if end >= entry.end else end,
+            )
+            for name, (start, end) in self.sections.items()
+        }
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+
+    def set_status(self, entry: TaskEntry, status: TaskStatus) -> None:
+        """
+        Set an active task's `- **Status**:` line, adding it if missing.
+
+        Args:
+            entry: Active task entry
+            status: New status
+        """
+        lines = self.read_block(entry).split("\n")
+        status_line = f"- **Status**: {status.value}"
+        for i, line in enumerate(lines):
+            if line.strip().startswith("- **Status**:"):
+                lines[i] = status_line
+                break
+        else:
+            # After the Type line if there is one, else right after the heading
+            at = next(
+                (i + 1 for i, line in enumerate(lines) if line.strip().startswith("- **Type**:")),
+                1,
+            )
+            lines.insert(at, status_line)
+        self.replace_block(entry, "\n".join(lines))
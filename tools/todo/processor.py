@@ -4,8 +4,9 @@ import re
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class TaskStatus(Enum):
@@ -136,7 +137,23 @@ def parse_tasks(content: str) -> dict:
     current_task_body: list[str] = []
     current_task_line = 0
 
+    def flush_task() -> None:
+        """Record the task being read, if it is in the active section."""
+        if current_task_heading and current_section == "active":
+            task = _parse_task_block(current_task_heading, current_task_body, current_task_line)
+            if task:
+                if task.status == TaskStatus.VETOED:
+                    result["vetoed"].append(task)
+                else:
+                    result["active"].append(task)
+
     for i, line in enumerate(lines):
+        # A section header ends the task before it
+        if line.startswith(("## Active Tasks", "## Completed Tasks", "## Vetoed Tasks")):
+            flush_task()
+            current_task_heading = None
+            current_task_body = []
+
         # Check for section headers
         if line.startswith("## Active Tasks"):
             result["sections"]["preamble"] = (0, i)
@@ -162,15 +179,7 @@ def parse_tasks(content: str) -> dict:
         # Check for task headings (### P0-3: ...)
         if line.startswith("### "):
             # Save previous task if any
-            if current_task_heading and current_section == "active":
-                task = _parse_task_block(
-                    current_task_heading, current_task_body, current_task_line
-                )
-                if task:
-                    if task.status == TaskStatus.VETOED:
-                        result["vetoed"].append(task)
-                    else:
-                        result["active"].append(task)
+            flush_task()
 
             # Start new task
             if TASK_HEADING_PATTERN.match(line) or VETO_TAG_PATTERN.search(line):
@@ -185,15 +194,7 @@ def parse_tasks(content: str) -> dict:
             current_task_body.append(line)
 
     # Don't forget the last task
-    if current_task_heading and current_section == "active":
-        task = _parse_task_block(
-            current_task_heading, current_task_body, current_task_line
-        )
-        if task:
-            if task.status == TaskStatus.VETOED:
-                result["vetoed"].append(task)
-            else:
-                result["active"].append(task)
+    flush_task()
 
     # Record final section
     result["sections"][current_section] = (section_start, len(lines))
@@ -263,6 +264,21 @@ def process_vetoes(content: str) -> tuple[str, list[Task]]:
     if not vetoed_tasks:
         return content, []
 
+    return _move_to_vetoed(lines, lines_to_remove, vetoed_tasks), vetoed_tasks
+
+
+def _move_to_vetoed(lines: list[str], lines_to_remove: set[int], vetoed_tasks: list[Task]) -> str:
+    """
+    Rewrite todo.md without the vetoed task lines, listing them under Vetoed Tasks.
+
+    Args:
+        lines: The todo.md content split on newlines
+        lines_to_remove: Indexes of the vetoed tasks' lines
+        vetoed_tasks: Tasks to record in the Vetoed Tasks section
+
+    Returns:
+        The updated content
+    """
     # Remove vetoed task lines
     new_lines = [line for i, line in enumerate(lines) if i not in lines_to_remove]
 
@@ -320,10 +336,14 @@ def process_vetoes(content: str) -> tuple[str, list[Task]]:
         cleaned_lines.append("")
         cleaned_lines.append(vetoed_block)
 
-    return "\n".join(cleaned_lines), vetoed_tasks
+    return "\n".join(cleaned_lines)
 
 
-def get_next_task(content: str) -> Optional[Task]:
+def get_next_task(
+    content: str,
+    archived_titles: Iterable[str] = (),
+    archived_failures: Iterable[str] = (),
+) -> Optional[Task]:
     """
     Get the highest priority pending task.
 
@@ -332,45 +352,111 @@ def get_next_task(content: str) -> Optional[Task]:
 
     Skips:
     - Tasks with status: in-progress, blocked, failed, vetoed
-    - Tasks with unmet blocked-by dependencies
-    """
-    parsed = parse_tasks(content)
-
-    # Filter to pending tasks only
-    pending = [
-        t for t in parsed["active"]
-        if t.status == TaskStatus.PENDING and not t.blocked_by
-    ]
+    - Tasks with unmet blocked-by dependencies (see tools.todo.graph); a
+      Blocked-by is met only by a task completed with ✓
 
-    if not pending:
-        return None
+    Args:
+        content: The todo.md file content
+        archived_titles: Titles of completed tasks archived out of todo.md
+        archived_failures: Titles of failed tasks archived out of todo.md
+    """
+    from .graph import TaskGraph, TaskScheduler
+    from .index import _entry_for, reference_titles, scan_blocks
 
-    # Sort by priority (ascending) then by line number (ascending)
-    pending.sort(key=lambda t: (t.priority, t.line_number))
+    parsed = parse_tasks(content)
+    active = parsed["active"]
 
-    return pending[0]
+    data = content.encode("utf-8")
+    blocks, _ = scan_blocks(data)
+    completed, unmet = reference_titles(_entry_for(block, data) for block in blocks)
+    graph = TaskGraph.build(
+        active, chain(completed, archived_titles), chain(unmet, archived_failures)
+    )
+    best = TaskScheduler(graph).peek()
+    return active[best] if best is not None else None
 
 
-def process_todo_file(todo_path: Path) -> tuple[bool, list[Task], Optional[Task]]:
+def process_todo_file(
+    todo_path: Path,
+    index_path: Optional[Path] = None,
+) -> tuple[bool, list[Task], Optional[Task]]:
     """
     Process a todo.md file: handle vetoes and find next task.
 
+    Done in a single pass over the file (see tools.todo.scan). With an
+    up-to-date task index and no #veto tags, todo.md is not read beyond the
+    chosen task's block.
+
     Args:
         todo_path: Path to todo.md
+        index_path: Sidecar task index (see tools.todo.index)
 
     Returns:
         Tuple of (file_was_modified, vetoed_tasks, next_task)
     """
-    content = todo_path.read_text(encoding="utf-8")
+    from .scan import process_todo
 
-    # Process vetoes
-    new_content, vetoed = process_vetoes(content)
-    modified = new_content != content
+    return process_todo(todo_path, index_path)
 
-    if modified:
-        todo_path.write_text(new_content, encoding="utf-8")
 
-    # Get next task from updated content
-    next_task = get_next_task(new_content)
+def add_task(
+    todo_path: Path,
+    title: str,
+    priority: int,
+    task_type: TaskType,
+    notes: str = "",
+    source: Optional[str] = None,
+    blocked_by: Optional[str] = None,
+    check_duplicates: bool = True,
+) -> list:
+    """
+    Append a task to the end of Active Tasks, unless it repeats an earlier one.
+
+    The proposed title and notes are first checked against every active,
+    blocked, vetoed, completed and archived task (see tools.todo.dedup).
+
+    Args:
+        todo_path: Path to todo.md
+        title: Task title
+        priority: 0-3
+        task_type: Task type
+        notes: Task notes
+        source: What proposed the task (e.g. "optimistic-review")
+        blocked_by: Title(s) of tasks this one waits for, separated by semicolons
+        check_duplicates: Skip the near-duplicate check
+
+    Returns:
+        DuplicateMatch list; the task was appended only if it is empty
 
-    return modified, vetoed, next_task
+    Raises:
+        ValueError: If todo.md has no Active Tasks section
+    """
+    from .dedup import find_duplicates
+    from .index import scan_blocks
+
+    if check_duplicates:
+        duplicates = find_duplicates(todo_path, title, notes)
+        if duplicates:
+            return duplicates
+
+    data = todo_path.read_bytes()
+    _, sections = scan_blocks(data)
+    if "active" not in sections:
+        raise ValueError(f"{todo_path} has no Active Tasks section")
+
+    lines = [f"### P{priority}: {title}", f"- **Type**: {task_type.value}"]
+    if notes:
+        lines.append(f"- **Notes**: {notes}")
+    if source:
+        lines.append(f"- **Source**: {source}")
+    if blocked_by:
+        lines.append(f"- **Blocked-by**: {blocked_by}")
+    lines.append(f"- **Generated**: {date.today().isoformat()}")
+    block = "\n".join(lines).encode("utf-8") + b"\n\n"
+
+    end = sections["active"][1]
+    before = data[:end]
+    if before and not before.endswith(b"\n\n"):
+        block = (b"\n" if before.endswith(b"\n") else b"\n\n") + block
+    todo_path.write_bytes(before + block + data[end:])
+    return []
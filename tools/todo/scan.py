@@ -0,0 +1,157 @@
+"""Single-pass processing of todo.md.
+
+Handling vetoes and picking the next task used to take three full passes:
+process_vetoes scanned every line and rebuilt the file, get_next_task
+parsed it again with parse_tasks, and the task index scanned it a third
+time. scan_todo splits the file into blocks once (scan_blocks) and derives
+everything from those blocks: the active, vetoed and completed tasks, the
+lines to remove, the next task and the index entries. The file is only
+rebuilt as text when a veto actually moves something. The next task is
+chosen through the Blocked-by dependency graph (see tools.todo.graph).
+"""
+
+import os
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .compact import archive_dir_for, iter_archived_completions, iter_archived_failures
+from .graph import TaskGraph, TaskScheduler
+from .index import TaskEntry, TaskIndex, _entry_for, reference_titles, scan_blocks
+from .processor import (
+    VETO_TAG_PATTERN,
+    Task,
+    _move_to_vetoed,
+    _parse_task_block,
+)
+
+
+@dataclass
+class TodoScan:
+    """Everything process_todo_file needs from one pass over todo.md."""
+
+    entries: list[TaskEntry]  # Every block, for the task index
+    sections: dict[str, tuple[int, int]]  # Section name -> byte range
+    active: list[Task] = field(default_factory=list)  # Active tasks that stay in place
+    vetoed: list[Task] = field(default_factory=list)  # #veto-tagged tasks to move
+    completed: list[TaskEntry] = field(default_factory=list)  # Completed Tasks entries
+    graph: Optional[TaskGraph] = None  # Blocked-by graph over active, by position
+    next_task: Optional[Task] = None
+    content: Optional[str] = None  # Rewritten todo.md, or None if nothing changed
+
+    @property
+    def modified(self) -> bool:
+        """True if vetoes require the file to be rewritten."""
+        return self.content is not None
+
+
+def scan_todo(
+    data: bytes,
+    archived_titles: Iterable[str] = (),
+    archived_failures: Iterable[str] = (),
+) -> TodoScan:
+    """
+    Scan todo.md once, handling vetoes and choosing the next task.
+
+    The result matches process_vetoes followed by get_next_task, except that
+    line numbers refer to the scanned data rather than the rewritten content.
+
+    Args:
+        data: Raw todo.md content
+        archived_titles: Titles of completed tasks archived out of todo.md
+            (only read if some active task has a Blocked-by field)
+        archived_failures: Titles of failed tasks archived out of todo.md
+            (read under the same condition)
+
+    Returns:
+        TodoScan for the data
+    """
+    blocks, sections = scan_blocks(data)
+    scan = TodoScan(entries=[], sections=sections)
+    lines_to_remove: set[int] = set()
+
+    for block in blocks:
+        task = None
+        if block.section == "active" and block.is_task:
+            task = _parse_task_block(block.heading, block.body_lines, block.line_number)
+        entry = _entry_for(block, data, task)
+        scan.entries.append(entry)
+
+        if block.section == "completed":
+            scan.completed.append(entry)
+        if task is None:
+            continue
+
+        # process_vetoes only moves `### P<n>:` headings
+        if block.heading.startswith("### P") and VETO_TAG_PATTERN.search(block.heading):
+            scan.vetoed.append(task)
+            lines_to_remove.update(range(block.line_number, block.end_line))
+            continue
+
+        scan.active.append(task)
+
+    completed, unmet = reference_titles(scan.entries)
+    scan.graph = TaskGraph.build(
+        scan.active, chain(completed, archived_titles), chain(unmet, archived_failures)
+    )
+    best = TaskScheduler(scan.graph).peek()
+    scan.next_task = scan.active[best] if best is not None else None
+    if scan.vetoed:
+        lines = data.decode("utf-8").split("\n")
+        scan.content = _move_to_vetoed(lines, lines_to_remove, scan.vetoed)
+    return scan
+
+
+def process_todo(
+    todo_path: Path,
+    index_path: Optional[Path] = None,
+) -> tuple[bool, list[Task], Optional[Task]]:
+    """
+    Handle vetoes and find the next task, reading todo.md at most once.
+
+    With an up-to-date task index and no #veto tags, only the chosen task's
+    block is read. Otherwise the file is scanned once; it is written (and
+    the rewritten content scanned to re-index it) only if a veto moved a task.
+
+    Args:
+        todo_path: Path to todo.md
+        index_path: Sidecar task index (see tools.todo.index)
+
+    Returns:
+        Tuple of (file_was_modified, vetoed_tasks, next_task)
+    """
+    if index_path is not None:
+        index = TaskIndex.saved(todo_path, index_path)
+        if index is not None and not any(entry.vetoed for entry in index.tasks("active")):
+            return False, [], index.next_task()
+
+    with open(todo_path, "rb") as f:
+        data = f.read()
+        stat = os.fstat(f.fileno())
+    archive_dir = archive_dir_for(todo_path)
+    scan = result = scan_todo(
+        data, iter_archived_completions(archive_dir), iter_archived_failures(archive_dir)
+    )
+
+    if scan.content is not None:
+        data = scan.content.encode("utf-8")
+        with open(todo_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            stat = os.fstat(f.fileno())
+        result = scan_todo(
+            data, iter_archived_completions(archive_dir), iter_archived_failures(archive_dir)
+        )
+
+    if index_path is not None:
+        index = TaskIndex(
+            todo_path=todo_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            entries=result.entries,
+            sections=result.sections,
+        )
+        index.save(index_path)
+
+    return scan.modified, scan.vetoed, result.next_task